@@ -1,19 +1,61 @@
 from services.database import DatabaseService
+from models.raw_event import RawEvent
 from utils.text_cleaner import TextCleaner
 from services.chunker import Chunker
-from processors.entity_extractor import EntityExtractor
+from processors.entity_extractor import get_entity_extractor
 from processors.mention_tracker import MentionTracker
 from processors.relationship_mapper import RelationshipMapper  # TODO: Only used for alias detection, will be deprecated
-from services.embeddings import EmbeddingsService
+from services.embeddings import get_embeddings_service
 from services.entity_resolver import EntityResolver
 from processors.signal_scorer import SignalScorer
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import bisect
+import itertools
 import logging
+import queue
+import re
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on total characters sent in a single embedding call when
+# batching chunks across events
+MAX_EMBEDDING_BATCH_CHARS = 150_000
+
+# Token-length bucket upper bounds; each embedding call only carries chunks
+# from one bucket so short chunks are never padded to a long one
+EMBEDDING_TOKEN_BUCKETS = (64, 128, 256, 512)
+
+# Decimal places signals are stored with; rescoring an entity only writes its
+# row when a rounded score actually moved
+SIGNAL_PRECISION = 3
+
+# Maximum number of events processed concurrently by process_pending_events
+MAX_PARALLEL_EVENTS = 4
+
+# Embedding generation runs here so it overlaps with entity extraction
+_EMBEDDING_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='archivist-embeddings')
+
+# Entity types promoted as hub entities (step 4)
+_HUB_TYPES = frozenset({'project', 'feature', 'decision'})
+
+# Per-source pipeline settings for step 5, looked up once per event.
+#   creates_spoke: whether the event gets a spoke entity linked to its hub
+#   spoke_type: fixed spoke type, or None to classify from the content
+# Sources not listed here use _DEFAULT_SOURCE_PROFILE.
+_SOURCE_PROFILES = {
+    'quick_capture': {'creates_spoke': True, 'spoke_type': None},
+    'voice_debrief': {'creates_spoke': True, 'spoke_type': None},
+    'webhook_granola': {'creates_spoke': True, 'spoke_type': None},
+}
+_DEFAULT_SOURCE_PROFILE = {'creates_spoke': False, 'spoke_type': None}
+
+# Case-insensitive substring match used to classify spoke type (step 5)
+_MEETING_RE = re.compile(r'meeting', re.IGNORECASE)
+
 
 class Archivist:
     """Main orchestrator for the Archivist agent - transforms raw events into structured memory graph"""
@@ -23,12 +65,19 @@ class Archivist:
         self.db = DatabaseService()
         self.text_cleaner = TextCleaner()
         self.chunker = Chunker()
-        self.entity_extractor = EntityExtractor()
+        self.entity_extractor = get_entity_extractor()
         self.mention_tracker = MentionTracker()
         self.relationship_mapper = RelationshipMapper()  # TODO: Only for alias detection, will be deprecated
-        self.embeddings_service = EmbeddingsService()
+        self.embeddings_service = get_embeddings_service()
         self.entity_resolver = EntityResolver()
         self.signal_scorer = SignalScorer()
+        self._promotion_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._signal_queue = queue.Queue()
+        self._signal_worker = None
+        self._signal_worker_lock = threading.Lock()
+        self._relationship_engine = None
+        self._relationship_engine_lock = threading.Lock()
 
         logger.info("Archivist initialized with all processors")
 
@@ -38,6 +87,19 @@ class Archivist:
         self.mention_tracker = MentionTracker()  # Reinitialize with empty cache
         logger.info("Cache cleared successfully")
 
+    def _get_relationship_engine(self):
+        """Return the RelationshipEngine used for step 6, creating it on first use
+
+        The import stays deferred so a failure loading the engine only disables
+        relationship detection instead of the whole Archivist.
+        """
+        if self._relationship_engine is None:
+            with self._relationship_engine_lock:
+                if self._relationship_engine is None:
+                    from engines.relationship_engine import RelationshipEngine
+                    self._relationship_engine = RelationshipEngine()
+        return self._relationship_engine
+
     def process_event(self, event_id: str) -> Dict:
         """Process a single raw event through the full pipeline
 
@@ -55,63 +117,143 @@ class Archivist:
         5. Create hub-and-spoke structures
         6. Trigger relationship engine (asynchronous edge creation)
         7. Detect aliases/renames
-        8. Chunk text
-        9. Generate embeddings
-        10. Assign signals
+        8. Chunk text (runs right after step 2)
+        9. Generate embeddings (in the background while steps 3-7 run)
+        10. Assign signals (queued to a background worker)
         11. Update event status
         """
         try:
-            logger.info(f"Starting processing for event {event_id}")
-            start_time = time.time()
+            loaded = self._load_event(event_id)
+
+            # Step 9: Embedding Generation, overlapped with steps 3-7
+            embeddings_future = _EMBEDDING_POOL.submit(self._generate_embeddings, [loaded['chunks']])
+            state = self._prepare_event(loaded)
+            embeddings = embeddings_future.result()[0]
+
+            return self._finalize_event(state, embeddings)
+
+        except Exception as e:
+            return self._handle_event_error(event_id, e)
+
+    def _load_event(self, event_id: str, event: RawEvent = None) -> Dict:
+        """Run pipeline steps 1, 2 and 8 for an event (fetch, clean, chunk)
 
-            # Step 1: Fetch event
+        Chunking only needs the cleaned text, so it happens here and embedding
+        generation can start before entity extraction.
+
+        Args:
+            event_id: UUID of the raw_event to process
+            event: The already-fetched raw event, if available (skips step 1's query)
+
+        Returns:
+            Loaded event consumed by _prepare_event
+        """
+        logger.info("Starting processing for event %s", event_id)
+        start_time = time.time()
+
+        # Step 1: Fetch event
+        if event is None:
             event = self.db.get_event_by_id(event_id)
-            if not event:
-                raise ValueError(f"Event {event_id} not found")
+        if not event:
+            raise ValueError(f"Event {event_id} not found")
 
-            logger.info(f"Fetched event {event_id} from {event.source}")
+        logger.info("Fetched event %s from %s", event_id, event.source)
 
-            # Step 2: Parse & Clean
-            raw_text = event.payload.content
-            cleaned_text = self.text_cleaner.clean(raw_text)
+        # Step 2: Parse & Clean
+        raw_text = event.payload.content
+        cleaned_text = self.text_cleaner.clean(raw_text)
 
-            logger.info(f"Cleaned text: {len(raw_text)} → {len(cleaned_text)} chars")
+        logger.info("Cleaned text: %d → %d chars", len(raw_text), len(cleaned_text))
 
-            # Step 3: Entity Extraction
-            extracted_entities = self.entity_extractor.extract_entities(cleaned_text)
-            logger.info(f"Extracted {len(extracted_entities)} entities")
-            logger.info(f"🔍 [DEBUG] Extracted entities: {[{'title': e.get('title'), 'type': e.get('type'), 'is_primary': e.get('is_primary_subject')} for e in extracted_entities]}")
+        # Step 8: Chunking
+        chunks = self.chunker.chunk_text(cleaned_text)
+        logger.info("Created %d chunks", len(chunks))
 
-            # Step 3.5: Entity Resolution (NEW - Phase 1)
-            # Resolve pronouns and references to existing entities
-            user_entity_id = event.payload.user_entity_id
-            reference_map = self.entity_resolver.resolve_references(
-                cleaned_text,
-                user_entity_id
-            )
+        return {
+            'event_id': event_id,
+            'event': event,
+            'start_time': start_time,
+            'cleaned_text': cleaned_text,
+            'chunks': chunks
+        }
 
-            # Fetch recent entities for cross-event relationship detection
-            existing_entities = self.db.get_recent_entities(limit=20)
-            logger.info(f"Fetched {len(existing_entities)} recent entities for resolution")
-            logger.info(f"Resolved {len(reference_map)} references: {reference_map}")
+    def _prepare_event(self, loaded: Dict, run_relationships: bool = True) -> Dict:
+        """Run pipeline steps 3-7 for a loaded event (everything before storing chunks)
 
-            # Step 4: Mention Tracking & Entity Promotion
-            entity_ids = []
-            hub_entity_id = None
-            entity_map = {}  # Map of entity titles to IDs
-            user_person_entity_id = None  # Track if we create a person entity for the user
+        Args:
+            loaded: Result of _load_event
+            run_relationships: Run step 6 for this event; batches skip it and
+                run the relationship engine once for all events instead
 
-            for entity_data in extracted_entities:
+        Returns:
+            Per-event state consumed by _finalize_event
+        """
+        event_id = loaded['event_id']
+        event = loaded['event']
+        cleaned_text = loaded['cleaned_text']
+
+        # Step 3: Entity Extraction
+        extracted_entities = self.entity_extractor.extract_entities(cleaned_text)
+        logger.info("Extracted %d entities", len(extracted_entities))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 [DEBUG] Extracted entities: %s", [{'title': e.get('title'), 'type': e.get('type'), 'is_primary': e.get('is_primary_subject')} for e in extracted_entities])
+
+        # Collapse repeats (case/whitespace variants) so each entity is processed once
+        unique_entities = self._dedupe_entities(extracted_entities)
+
+        # Step 3.5: Entity Resolution (NEW - Phase 1)
+        # Resolve pronouns and references to existing entities
+        user_entity_id = event.payload.user_entity_id
+        reference_map = self.entity_resolver.resolve_references(
+            cleaned_text,
+            user_entity_id
+        )
+
+        logger.info("Resolved %d references: %s", len(reference_map), reference_map)
+
+        # Step 4: Mention Tracking & Entity Promotion
+        entity_ids = []
+        hub_entity_id = None
+        entity_map = {}  # Map of entity titles to IDs
+        user_person_entity_id = None  # Track if we create a person entity for the user
+        pending_metadata = {}  # entity ID -> full metadata, written in one call per step
+        core_identity_count = 0  # Used by step 5 to recognize core identity documents
+        new_entities = []  # Entities to create once the promotion pass is done
+        pending_by_title = {}  # normalized title -> entry in new_entities
+
+        # Serialize promotion so concurrently processed events cannot create the
+        # same entity twice (mention tracker state is shared across threads)
+        with self._promotion_lock:
+            # Look up every entity the mention tracker doesn't already know in one query
+            known_ids = self.mention_tracker.get_existing_entity_ids(
+                [e.get('title', '') for e, _ in unique_entities]
+            )
+            existing_by_title = self.db.get_entities_by_titles([
+                (e.get('title', ''), e.get('type', 'reference_document'))
+                for e, _ in unique_entities
+                if e.get('title', '') not in known_ids
+            ])
+
+            # Prefetch every entity that may take the existing-entity branch so
+            # reference tracking doesn't need a lookup per mention
+            entities_by_id = self.db.get_entities_by_ids(list(set(known_ids.values()))) if known_ids else {}
+            entities_by_id.update({entity.id: entity for entity in existing_by_title.values()})
+
+            for entity_data, mention_count_in_event in unique_entities:
                 entity_title = entity_data.get('title', '')
                 entity_type = entity_data.get('type', 'reference_document')
                 is_primary = entity_data.get('is_primary_subject', False)
 
+                if entity_type == 'core_identity':
+                    core_identity_count += mention_count_in_event
+
                 # Record mention
                 self.mention_tracker.record_mention(
                     entity_title,
                     entity_type,
                     event_id,
-                    is_primary
+                    is_primary,
+                    count=mention_count_in_event
                 )
 
                 # Check if should promote (pass entity_type for better promotion logic)
@@ -119,44 +261,58 @@ class Archivist:
                     # Check if already exists (mention tracker first, then database)
                     existing_id = self.mention_tracker.get_existing_entity_id(entity_title)
 
+                    title_key = ' '.join(entity_title.lower().split())
+                    if not existing_id and title_key in pending_by_title:
+                        # Already queued for creation by this event under another type;
+                        # count the mention on the new entity instead of creating another
+                        creation = pending_by_title[title_key]
+                        creation['payload']['metadata']['mention_count'] += mention_count_in_event
+                        creation['slots'].append(len(entity_ids))
+                        entity_ids.append(None)
+                        continue
+
                     if not existing_id:
-                        # Check database for existing entity
-                        logger.info(f"🔍 [DEBUG] Checking database for entity '{entity_title}' (type: {entity_type})")
-                        existing_entity = self.db.get_entity_by_title(entity_title, entity_type)
+                        # Check database results fetched before the loop
+                        logger.debug("🔍 [DEBUG] Checking database for entity '%s' (type: %s)", entity_title, entity_type)
+                        existing_entity = existing_by_title.get((entity_title, entity_type))
                         if existing_entity:
                             existing_id = existing_entity.id
-                            logger.info(f"✅ [DEBUG] Found existing entity in database: {existing_id[:8]}...")
+                            logger.debug("✅ [DEBUG] Found existing entity in database: %s", existing_id)
                             # Update mention tracker so we don't query again
                             self.mention_tracker.mark_promoted(entity_title, existing_id)
 
                     if existing_id:
                         entity_ids.append(existing_id)
                         entity_map[entity_title] = existing_id
-                        logger.info(f"✅ [DEBUG] Using existing entity '{entity_title}': {existing_id[:8]}...")
+                        logger.debug("✅ [DEBUG] Using existing entity '%s': %s", entity_title, existing_id)
 
-                        # Update reference tracking for existing entity
-                        existing_entity = self.db.get_entity_by_id(existing_id)
+                        # Update reference tracking for existing entity; every candidate
+                        # was prefetched above, so this never hits the database
+                        existing_entity = entities_by_id.get(existing_id)
                         if existing_entity:
                             referenced_by = existing_entity.metadata.get('referenced_by_event_ids', [])
                             if event_id not in referenced_by:
                                 referenced_by.append(event_id)
 
-                            mention_count = existing_entity.metadata.get('mention_count', 0) + 1
+                            mention_count = existing_entity.metadata.get('mention_count', 0) + mention_count_in_event
 
-                            self.db.update_entity_metadata(existing_id, {
+                            existing_entity.metadata = {
                                 **existing_entity.metadata,
                                 'referenced_by_event_ids': referenced_by,
                                 'mention_count': mention_count
-                            })
-                            logger.info(f"Updated entity {existing_id[:8]}... mention_count: {mention_count}, events: {len(referenced_by)}")
+                            }
+                            pending_metadata[existing_id] = existing_entity.metadata
+                            # Keep the cached copy current in case the entity is mentioned again
+                            entities_by_id[existing_id] = existing_entity
+                            logger.info("Updated entity %s mention_count: %s, events: %d", existing_id, mention_count, len(referenced_by))
                     else:
                         # Determine if this should be a hub entity
-                        is_hub = entity_type in ['project', 'feature', 'decision']
+                        is_hub = entity_type in _HUB_TYPES
 
                         # Initialize reference tracking metadata
                         entity_metadata = entity_data.get('metadata', {})
                         entity_metadata['referenced_by_event_ids'] = [event_id]
-                        entity_metadata['mention_count'] = 1
+                        entity_metadata['mention_count'] = mention_count_in_event
 
                         entity_payload = {
                             'source_event_id': event_id,
@@ -166,273 +322,498 @@ class Archivist:
                             'metadata': entity_metadata,
                         }
 
-                        try:
-                            if is_hub:
-                                entity_id = self.db.create_hub_entity(entity_payload)
-                                hub_entity_id = entity_id
-                                logger.info(f"Created hub entity '{entity_title}': {entity_id}")
-                            else:
-                                entity_id = self.db.create_entity(entity_payload)
-                                logger.info(f"Created entity '{entity_title}': {entity_id}")
-
-                            # If this is a person entity and is primary subject, it might be the user introducing themselves
-                            logger.info(f"🔍 [DEBUG] Checking for self-introduction: type={entity_type}, is_primary={is_primary}, user_entity_id={user_entity_id}")
-                            if entity_type == 'person' and is_primary:
-                                # THIS is the user introducing themselves!
-                                user_person_entity_id = entity_id
-                                logger.info(f"✅ [DEBUG] Detected self-introduction: '{entity_title}' is the user (entity_id: {entity_id[:8]}...)")
-
-                            self.mention_tracker.mark_promoted(entity_title, entity_id)
-                            entity_ids.append(entity_id)
-                            entity_map[entity_title] = entity_id
-                        except Exception as e:
-                            logger.error(f"Failed to create entity '{entity_title}': {e}")
-                            # Don't add to entity_ids if creation failed
+                        # Created together after the loop; keep this entity's place in entity_ids
+                        creation = {
+                            'payload': entity_payload,
+                            'is_hub': is_hub,
+                            'is_primary': is_primary,
+                            'slots': [len(entity_ids)]
+                        }
+                        new_entities.append(creation)
+                        pending_by_title[title_key] = creation
+                        entity_ids.append(None)
                 else:
-                    logger.debug(f"Entity '{entity_title}' not promoted yet (mention count too low)")
-
-            # Step 4.5: Link user entity to person entity if this is a self-introduction
-            logger.info(f"\n🔍 [DEBUG] Step 4.5 - Self-introduction detection")
-            logger.info(f"🔍 [DEBUG] user_person_entity_id: {user_person_entity_id}")
-            logger.info(f"🔍 [DEBUG] user_entity_id from payload: {user_entity_id}")
-
-            if user_person_entity_id:
-                logger.info(f"✅ [DEBUG] Detected person entity creation: {user_person_entity_id[:8]}...")
-                try:
-                    if not user_entity_id:
-                        # This is the FIRST event - user introduced themselves
-                        # Use the person entity as the user entity directly
-                        logger.info(f"✅ [DEBUG] FIRST EVENT: Using person entity {user_person_entity_id[:8]}... as user entity")
-                        user_entity_id = user_person_entity_id
+                    logger.debug("Entity '%s' not promoted yet (mention count too low)", entity_title)
+
+            # Create every newly promoted entity with one insert
+            created_ids = self._create_entities(new_entities)
+            for creation, entity_id in zip(new_entities, created_ids):
+                if not entity_id:
+                    continue  # Creation failed; its slots are dropped below
+
+                entity_title = creation['payload']['title']
+                entity_type = creation['payload']['type']
+                if creation['is_hub']:
+                    hub_entity_id = entity_id
+                    logger.info("Created hub entity '%s': %s", entity_title, entity_id)
+                else:
+                    logger.info("Created entity '%s': %s", entity_title, entity_id)
+
+                # If this is a person entity and is primary subject, it might be the user introducing themselves
+                logger.debug("🔍 [DEBUG] Checking for self-introduction: type=%s, is_primary=%s, user_entity_id=%s", entity_type, creation['is_primary'], user_entity_id)
+                if entity_type == 'person' and creation['is_primary']:
+                    # THIS is the user introducing themselves!
+                    user_person_entity_id = entity_id
+                    logger.debug("✅ [DEBUG] Detected self-introduction: '%s' is the user (entity_id: %s)", entity_title, entity_id)
+
+                self.mention_tracker.mark_promoted(entity_title, entity_id)
+                entity_map[entity_title] = entity_id
+                for slot in creation['slots']:
+                    entity_ids[slot] = entity_id
+
+            # Don't keep entities whose creation failed
+            entity_ids = [entity_id for entity_id in entity_ids if entity_id]
+
+            # Write reference-tracking updates together, before another event can
+            # read these entities
+            self.db.bulk_update_entity_metadata(pending_metadata)
+            pending_metadata = {}
+
+        # Step 4.5: Link user entity to person entity if this is a self-introduction
+        logger.debug("\n🔍 [DEBUG] Step 4.5 - Self-introduction detection")
+        logger.debug("🔍 [DEBUG] user_person_entity_id: %s", user_person_entity_id)
+        logger.debug("🔍 [DEBUG] user_entity_id from payload: %s", user_entity_id)
+
+        if user_person_entity_id:
+            logger.debug("✅ [DEBUG] Detected person entity creation: %s", user_person_entity_id)
+            try:
+                if not user_entity_id:
+                    # This is the FIRST event - user introduced themselves
+                    # Use the person entity as the user entity directly
+                    logger.debug("✅ [DEBUG] FIRST EVENT: Using person entity %s as user entity", user_person_entity_id)
+                    user_entity_id = user_person_entity_id
+
+                    # Update person entity metadata to mark it as the user
+                    person_entity = self.db.get_entity_by_id(user_person_entity_id)
+                    if person_entity:
+                        logger.debug("✅ [DEBUG] Marking person entity as user (is_user_entity: true)")
+                        pending_metadata[user_person_entity_id] = {
+                            **pending_metadata.get(user_person_entity_id, person_entity.metadata),
+                            'user_id': 'default_user',
+                            'is_user_entity': True
+                        }
+                        logger.debug("✅ [DEBUG] Updated metadata for %s", user_person_entity_id)
+                    else:
+                        logger.error("❌ [DEBUG] Could not fetch person entity %s", user_person_entity_id)
+
+
+                elif user_person_entity_id != user_entity_id:
+                    # User entity exists but they created a new person entity
+                    # Merge the generic user entity with the real person entity
+                    user_entity = self.db.get_entity_by_id(user_entity_id)
+
+                    if user_entity and user_entity.metadata.get('is_system_user'):
+                        # This is the auto-created generic user entity
+                        # Update reference_map to point to the real person entity instead
+                        logger.info("Merging user entity %s with person entity %s", user_entity_id, user_person_entity_id)
+
+                        # Update reference_map so "I" points to the real person entity
+                        for ref_key in list(reference_map.keys()):
+                            if reference_map[ref_key] == user_entity_id:
+                                reference_map[ref_key] = user_person_entity_id
+                                logger.info("Updated reference '%s' to point to %s", ref_key, user_person_entity_id)
+
+                        # Mark the generic user entity for future cleanup (add to metadata)
+                        # In production, you might want to actually merge/delete the generic entity
+                        pending_metadata[user_entity_id] = {
+                            **pending_metadata.get(user_entity_id, user_entity.metadata),
+                            'merged_into': user_person_entity_id,
+                            'is_deprecated': True
+                        }
 
-                        # Update person entity metadata to mark it as the user
+                        # Update person entity to mark as user
                         person_entity = self.db.get_entity_by_id(user_person_entity_id)
                         if person_entity:
-                            logger.info(f"✅ [DEBUG] Marking person entity as user (is_user_entity: true)")
-                            self.db.update_entity_metadata(user_person_entity_id, {
-                                **person_entity.metadata,
+                            pending_metadata[user_person_entity_id] = {
+                                **pending_metadata.get(user_person_entity_id, person_entity.metadata),
                                 'user_id': 'default_user',
                                 'is_user_entity': True
-                            })
-                            logger.info(f"✅ [DEBUG] Updated metadata for {user_person_entity_id[:8]}...")
-                        else:
-                            logger.error(f"❌ [DEBUG] Could not fetch person entity {user_person_entity_id[:8]}...")
-
-
-                    elif user_person_entity_id != user_entity_id:
-                        # User entity exists but they created a new person entity
-                        # Merge the generic user entity with the real person entity
-                        user_entity = self.db.get_entity_by_id(user_entity_id)
-
-                        if user_entity and user_entity.metadata.get('is_system_user'):
-                            # This is the auto-created generic user entity
-                            # Update reference_map to point to the real person entity instead
-                            logger.info(f"Merging user entity {user_entity_id[:8]} with person entity {user_person_entity_id[:8]}")
-
-                            # Update reference_map so "I" points to the real person entity
-                            for ref_key in list(reference_map.keys()):
-                                if reference_map[ref_key] == user_entity_id:
-                                    reference_map[ref_key] = user_person_entity_id
-                                    logger.info(f"Updated reference '{ref_key}' to point to {user_person_entity_id[:8]}")
-
-                            # Mark the generic user entity for future cleanup (add to metadata)
-                            # In production, you might want to actually merge/delete the generic entity
-                            self.db.update_entity_metadata(user_entity_id, {
-                                **user_entity.metadata,
-                                'merged_into': user_person_entity_id,
-                                'is_deprecated': True
-                            })
-
-                            # Update person entity to mark as user
-                            person_entity = self.db.get_entity_by_id(user_person_entity_id)
-                            if person_entity:
-                                self.db.update_entity_metadata(user_person_entity_id, {
-                                    **person_entity.metadata,
-                                    'user_id': 'default_user',
-                                    'is_user_entity': True
-                                })
-
-                except Exception as e:
-                    logger.error(f"Error linking user entity to person entity: {e}")
-
-            # Step 5: Create spoke entity if hub exists
-            # Skip spoke creation for core identity documents (where multiple core_identity entities were extracted)
-            core_identity_count = sum(1 for e in extracted_entities if e.get('type') == 'core_identity')
-            should_create_spoke = (
-                hub_entity_id and
-                event.source in ['quick_capture', 'voice_debrief', 'webhook_granola'] and
-                core_identity_count < 2  # Don't create spoke for core identity documents (they have many core_identity entities)
+                            }
+
+            except Exception as e:
+                logger.error("Error linking user entity to person entity: %s", e)
+
+        # Write step 4.5 metadata changes before the relationship engine and
+        # alias detection read them
+        self.db.bulk_update_entity_metadata(pending_metadata)
+
+        # Step 5: Create spoke entity if hub exists
+        # Skip spoke creation for core identity documents (where multiple core_identity entities were extracted)
+        source_profile = _SOURCE_PROFILES.get(event.source, _DEFAULT_SOURCE_PROFILE)
+        should_create_spoke = (
+            hub_entity_id and
+            source_profile['creates_spoke'] and
+            core_identity_count < 2  # Don't create spoke for core identity documents (they have many core_identity entities)
+        )
+
+        if should_create_spoke:
+            # Use the source's fixed spoke type, otherwise determine it from content
+            spoke_type = source_profile['spoke_type'] or (
+                'meeting_note' if _MEETING_RE.search(cleaned_text) else 'reflection'
             )
 
-            if should_create_spoke:
-                # Determine spoke type based on content
-                spoke_type = 'meeting_note' if 'meeting' in cleaned_text.lower() else 'reflection'
+            spoke_payload = {
+                'source_event_id': event_id,
+                'type': spoke_type,
+                'title': f"{spoke_type.replace('_', ' ').title()}: {cleaned_text[:50]}...",
+                'summary': cleaned_text[:200],
+                'metadata': {'is_spoke': True, 'hub_id': hub_entity_id}
+            }
 
-                spoke_payload = {
-                    'source_event_id': event_id,
-                    'type': spoke_type,
-                    'title': f"{spoke_type.replace('_', ' ').title()}: {cleaned_text[:50]}...",
-                    'summary': cleaned_text[:200],
-                    'metadata': {'is_spoke': True, 'hub_id': hub_entity_id}
-                }
+            spoke_id = self.db.create_spoke_entity(hub_entity_id, spoke_payload, source_event_id=event_id)
+            entity_ids.append(spoke_id)
+            logger.info("Created spoke entity %s linked to hub %s", spoke_id, hub_entity_id)
+        elif hub_entity_id and core_identity_count >= 2:
+            logger.info("Skipping spoke creation - this appears to be a core identity document (%s core_identity entities)", core_identity_count)
+
+        # Step 6: Trigger Incremental Relationship Detection
+        # Now that entities are created, trigger the RelationshipEngine to find connections
+        if entity_ids and run_relationships:
+            try:
+                rel_result = self._get_relationship_engine().run_incremental(event_id)
+                logger.info("Relationship engine created %s edges, updated %s edges", rel_result.get('edges_created', 0), rel_result.get('edges_updated', 0))
+            except Exception as e:
+                logger.error("Relationship engine failed: %s", e)
+                # Don't fail the entire event if relationship detection fails
+
+        # Step 7: Alias Detection & Update
+        # Prepare entities with IDs for alias detection
+        entities_with_ids = []
+        for entity_data, _ in unique_entities:
+            title = entity_data.get('title', '')
+            if title in entity_map:
+                entities_with_ids.append({
+                    **entity_data,
+                    'entity_id': entity_map[title]
+                })
+
+        alias_updates = self.relationship_mapper.detect_alias_and_update(
+            cleaned_text,
+            entities_with_ids,
+            self.db
+        )
+
+        if alias_updates:
+            logger.info("Updated %d entity aliases", len(alias_updates))
+
+        return {
+            'event_id': event_id,
+            'start_time': loaded['start_time'],
+            'entity_ids': entity_ids,
+            'chunks': loaded['chunks'],
+            'alias_updates': alias_updates
+        }
 
-                spoke_id = self.db.create_spoke_entity(hub_entity_id, spoke_payload, source_event_id=event_id)
-                entity_ids.append(spoke_id)
-                logger.info(f"Created spoke entity {spoke_id} linked to hub {hub_entity_id}")
-            elif hub_entity_id and core_identity_count >= 2:
-                logger.info(f"Skipping spoke creation - this appears to be a core identity document ({core_identity_count} core_identity entities)")
+    def _create_entities(self, new_entities: List[Dict]) -> List[str]:
+        """Create the entities promoted during step 4
 
-            # Step 6: Trigger Incremental Relationship Detection
-            # Now that entities are created, trigger the RelationshipEngine to find connections
-            if entity_ids:
-                try:
-                    from engines.relationship_engine import RelationshipEngine
-                    engine = RelationshipEngine()
-                    rel_result = engine.run_incremental(event_id)
-                    logger.info(f"Relationship engine created {rel_result.get('edges_created', 0)} edges, updated {rel_result.get('edges_updated', 0)} edges")
-                except Exception as e:
-                    logger.error(f"Relationship engine failed: {e}")
-                    # Don't fail the entire event if relationship detection fails
-
-            # Step 7: Alias Detection & Update
-            # Prepare entities with IDs for alias detection
-            entities_with_ids = []
-            for entity_data in extracted_entities:
-                title = entity_data.get('title', '')
-                if title in entity_map:
-                    entities_with_ids.append({
-                        **entity_data,
-                        'entity_id': entity_map[title]
-                    })
-
-            alias_updates = self.relationship_mapper.detect_alias_and_update(
-                cleaned_text,
-                entities_with_ids,
-                self.db
+        Args:
+            new_entities: Entries with 'payload' and 'is_hub' keys
+
+        Returns:
+            Entity IDs aligned with new_entities; None where creation failed
+        """
+        if not new_entities:
+            return []
+
+        try:
+            return self.db.bulk_create_entities(
+                [creation['payload'] for creation in new_entities],
+                [creation['is_hub'] for creation in new_entities]
             )
+        except Exception as e:
+            logger.error("Bulk entity creation failed, falling back to per-entity inserts: %s", e)
 
-            if alias_updates:
-                logger.info(f"Updated {len(alias_updates)} entity aliases")
+        created_ids = []
+        for creation in new_entities:
+            try:
+                if creation['is_hub']:
+                    created_ids.append(self.db.create_hub_entity(creation['payload']))
+                else:
+                    created_ids.append(self.db.create_entity(creation['payload']))
+            except Exception as e:
+                logger.error("Failed to create entity '%s': %s", creation['payload']['title'], e)
+                created_ids.append(None)
+        return created_ids
 
-            # Step 8: Chunking
-            chunks = self.chunker.chunk_text(cleaned_text)
-            logger.info(f"Created {len(chunks)} chunks")
+    @staticmethod
+    def _dedupe_entities(extracted_entities: List[Dict]) -> List[Tuple[Dict, int]]:
+        """Merge extracted entities that share a normalized title and type
 
-            # Step 9: Embedding Generation
-            if chunks:
-                chunk_texts = [c['text'] for c in chunks]
-                embeddings = self.embeddings_service.generate_embeddings_batch(chunk_texts)
+        Args:
+            extracted_entities: Entities as returned by the extractor
 
-                # Step 9b: Store Chunks & Embeddings
-                chunks_created = 0
-                for i, chunk in enumerate(chunks):
-                    # Associate with first entity (only create chunks if entities exist)
-                    if not entity_ids:
-                        logger.warning("Skipping chunk - no entities extracted")
-                        continue
+        Returns:
+            (entity_data, count) pairs in first-seen order. entity_data is the first
+            occurrence, marked primary if any occurrence was.
+        """
+        unique = {}
+        for entity_data in extracted_entities:
+            title = entity_data.get('title', '')
+            key = (' '.join(title.lower().split()), entity_data.get('type', 'reference_document'))
 
-                    primary_entity_id = entity_ids[0]
-                    logger.info(f"🔍 [DEBUG] Creating chunk for entity {primary_entity_id[:8]}...")
+            if key not in unique:
+                unique[key] = [entity_data, 1]
+                continue
 
-                    try:
-                        chunk_payload = {
-                            'entity_id': primary_entity_id,
-                            'text': chunk['text'],
-                            'token_count': chunk['token_count'],
-                            'hash': chunk['hash']
-                        }
+            merged = unique[key]
+            merged[1] += 1
+            if entity_data.get('is_primary_subject') and not merged[0].get('is_primary_subject'):
+                merged[0] = {**merged[0], 'is_primary_subject': True}
 
-                        chunk_id = self.db.create_chunk(chunk_payload)
+        return [(entity_data, count) for entity_data, count in unique.values()]
 
-                        embedding_payload = {
-                            'chunk_id': chunk_id,
-                            'vec': embeddings[i],
-                            'model': 'text-embedding-3-small'
-                        }
+    def _generate_embeddings(self, chunk_lists: List[List[Dict]]) -> List[List[List[float]]]:
+        """Generate embeddings for the chunks of one or more events
 
-                        self.db.create_embedding(embedding_payload)
-                        chunks_created += 1
-                    except Exception as e:
-                        logger.error(f"❌ [DEBUG] Failed to create chunk for entity {primary_entity_id[:8]}...: {e}")
-                        # Continue with next chunk instead of failing the entire event
+        All chunk texts are flattened into as few embedding calls as possible
+        (bounded by MAX_EMBEDDING_BATCH_CHARS), then sliced back per event.
+        Texts are sent shortest first and each call holds a single
+        EMBEDDING_TOKEN_BUCKETS bin, which keeps padding low for models that
+        pad to the longest input.
 
-                logger.info(f"Stored {chunks_created}/{len(chunks)} chunks and embeddings")
+        Args:
+            chunk_lists: One list of chunks per event
 
-            # Step 10: Signal Assignment
-            for entity_id in entity_ids:
-                entity = self.db.get_entity_by_id(entity_id)
+        Returns:
+            One list of embeddings per event, aligned with chunk_lists
+        """
+        all_chunks = [chunk for chunks in chunk_lists for chunk in chunks]
+        if not all_chunks:
+            return [[] for _ in chunk_lists]
+
+        order = sorted(range(len(all_chunks)), key=lambda i: all_chunks[i]['token_count'])
+
+        # Split the length-sorted texts into super-batches bounded by total size
+        # and by token bucket
+        sorted_embeddings = []
+        batch_texts = []
+        batch_chars = 0
+        batch_bucket = None
+        for i in order:
+            text = all_chunks[i]['text']
+            bucket = bisect.bisect_left(EMBEDDING_TOKEN_BUCKETS, all_chunks[i]['token_count'])
+            if batch_texts and (bucket != batch_bucket or batch_chars + len(text) > MAX_EMBEDDING_BATCH_CHARS):
+                sorted_embeddings.extend(self.embeddings_service.generate_embeddings_batch(batch_texts))
+                batch_texts = []
+                batch_chars = 0
+            batch_bucket = bucket
+            batch_texts.append(text)
+            batch_chars += len(text)
+        sorted_embeddings.extend(self.embeddings_service.generate_embeddings_batch(batch_texts))
+
+        # Undo the sort so embeddings line up with the original chunk order
+        all_embeddings = [None] * len(all_chunks)
+        for position, i in enumerate(order):
+            all_embeddings[i] = sorted_embeddings[position]
+
+        # Slice the flat result back into per-event lists
+        per_event = []
+        offset = 0
+        for chunks in chunk_lists:
+            per_event.append(all_embeddings[offset:offset + len(chunks)])
+            offset += len(chunks)
+
+        return per_event
+
+    def _finalize_event(self, state: Dict, embeddings: List[List[float]], defer_status: bool = False) -> Dict:
+        """Run pipeline steps 9b-11 for a prepared event
 
-                if not entity:
-                    logger.warning(f"Could not fetch entity {entity_id} for signal scoring")
-                    continue
+        Args:
+            state: Per-event state returned by _prepare_event
+            embeddings: Embeddings for state['chunks'], in the same order
 
-                # Get edge count for novelty calculation
-                edge_count = self.db.get_edge_count_for_entity(entity_id)
+        Returns:
+            Dictionary with processing results and statistics
+        """
+        event_id = state['event_id']
+        start_time = state['start_time']
+        entity_ids = state['entity_ids']
+        chunks = state['chunks']
+        alias_updates = state['alias_updates']
+
+        # Step 9b: Store Chunks & Embeddings
+        if chunks:
+            chunks_created = 0
+
+            # Associate with first entity (only create chunks if entities exist)
+            if not entity_ids:
+                logger.warning("Skipping %d chunks - no entities extracted", len(chunks))
+            else:
+                primary_entity_id = entity_ids[0]
+                logger.debug("🔍 [DEBUG] Creating %d chunks for entity %s", len(chunks), primary_entity_id)
 
-                # Calculate all signals
-                signals = self.signal_scorer.calculate_all_signals(
-                    entity_type=entity.type,
-                    created_at=entity.created_at,
-                    updated_at=entity.updated_at,
-                    edge_count=edge_count,
-                    metadata=entity.metadata
-                )
+                chunk_ids = []
+                try:
+                    # The chunker's dicts already carry text/token_count/hash, so
+                    # tag them with the entity and send them as the insert rows
+                    for chunk in chunks:
+                        chunk['entity_id'] = primary_entity_id
 
-                signal_payload = {
-                    'entity_id': entity_id,
-                    'importance': signals['importance'],
-                    'recency': signals['recency'],
-                    'novelty': signals['novelty'],
-                    'last_surfaced_at': None
-                }
+                    chunk_ids = self.db.create_chunks_bulk(chunks)
 
-                self.db.create_signal(signal_payload)
-                logger.debug(f"Created signals for entity {entity_id}: I={signals['importance']:.2f}, R={signals['recency']:.2f}, N={signals['novelty']:.2f}")
+                    embedding_payloads = [
+                        {
+                            'chunk_id': chunk_id,
+                            'vec': self.embeddings_service.to_vector_literal(embedding),
+                            'model': 'text-embedding-3-small'
+                        }
+                        for chunk_id, embedding in zip(chunk_ids, embeddings)
+                    ]
+
+                    self.db.create_embeddings_bulk(embedding_payloads)
+                    chunks_created = len(chunk_ids)
+                except Exception as e:
+                    logger.error("❌ [DEBUG] Failed to create chunks for entity %s: %s", primary_entity_id, e)
+                    # PostgREST has no transactions: remove chunks whose embeddings
+                    # failed so no chunk is left without a vector
+                    if chunk_ids:
+                        try:
+                            self.db.delete_chunks(chunk_ids)
+                        except Exception as cleanup_error:
+                            logger.error("Failed to remove %d orphaned chunks: %s", len(chunk_ids), cleanup_error)
+                    # Don't fail the entire event if chunk storage fails
 
-            logger.info(f"Assigned signals to {len(entity_ids)} entities")
+            logger.info("Stored %s/%d chunks and embeddings", chunks_created, len(chunks))
 
-            # Step 11: Update Event Status
+        # Step 10: Signal Assignment
+        # Scored off the critical path; nothing reads signals before the event is processed
+        self._enqueue_signals(entity_ids)
+
+        # Step 11: Update Event Status
+        if not defer_status:
             self.db.update_event_status(event_id, 'processed')
 
-            # Calculate processing time
-            elapsed_time = time.time() - start_time
+        # Calculate processing time
+        elapsed_time = time.time() - start_time
 
-            logger.info(f"Successfully processed event {event_id} in {elapsed_time:.2f}s")
+        logger.info("Successfully processed event %s in %.2fs", event_id, elapsed_time)
 
-            return {
-                'event_id': event_id,
-                'status': 'success',
-                'entities_created': len(entity_ids),
-                'chunks_created': len(chunks),
-                'aliases_updated': len(alias_updates),
-                'processing_time_seconds': elapsed_time
-            }
+        return {
+            'event_id': event_id,
+            'status': 'success',
+            'entities_created': len(entity_ids),
+            'chunks_created': len(chunks),
+            'aliases_updated': len(alias_updates),
+            'processing_time_seconds': elapsed_time
+        }
 
-        except Exception as e:
-            logger.error(f"Error processing event {event_id}: {str(e)}", exc_info=True)
+    def compute_and_store_signals(self, entity_ids: List[str]) -> int:
+        """Calculate and store importance/recency/novelty signals for entities
+
+        Args:
+            entity_ids: UUIDs of the entities to score
+
+        Returns:
+            Number of entities whose signals were written (unchanged signals are skipped)
+        """
+        # Fetch all entities and their edge counts up front instead of per entity
+        entities = self.db.get_entities_by_ids(entity_ids)
+        edge_counts = self.db.get_edge_counts_for_entities(list(entities))
+
+        scored_ids = []
+        for entity_id in entity_ids:
+            if entity_id in entities:
+                scored_ids.append(entity_id)
+            else:
+                logger.warning("Could not fetch entity %s for signal scoring", entity_id)
+
+        # Calculate all signals in one pass against a single clock reading
+        all_signals = self.signal_scorer.calculate_all_signals_batch([
+            (
+                entities[entity_id].type,
+                entities[entity_id].created_at,
+                entities[entity_id].updated_at,
+                edge_counts.get(entity_id, 0),
+                entities[entity_id].metadata
+            )
+            for entity_id in scored_ids
+        ])
+
+        signal_payloads = []
+        for entity_id, signals in zip(scored_ids, all_signals):
+            logger.debug("Calculated signals for entity %s: I=%.2f, R=%.2f, N=%.2f", entity_id, signals['importance'], signals['recency'], signals['novelty'])
+
+            signal_payloads.append({
+                'entity_id': entity_id,
+                'importance': round(signals['importance'], SIGNAL_PRECISION),
+                'recency': round(signals['recency'], SIGNAL_PRECISION),
+                'novelty': round(signals['novelty'], SIGNAL_PRECISION),
+                'last_surfaced_at': None
+            })
+
+        # The database compares the rounded scores against the stored row, so
+        # signals rewritten elsewhere (e.g. by insight feedback) are re-scored
+        written = self.db.upsert_changed_signals(signal_payloads)
+
+        logger.info("Assigned signals to %d entities (%d unchanged)", written, len(signal_payloads) - written)
+        return written
+
+    def wait_for_signals(self) -> None:
+        """Block until all queued signal scoring has been stored"""
+        self._signal_queue.join()
+
+    def _enqueue_signals(self, entity_ids: List[str]) -> None:
+        """Queue entities for background signal scoring, starting the worker if needed"""
+        if not entity_ids:
+            return
+
+        with self._signal_worker_lock:
+            if self._signal_worker is None or not self._signal_worker.is_alive():
+                self._signal_worker = threading.Thread(
+                    target=self._run_signal_worker,
+                    name="archivist-signals",
+                    daemon=True
+                )
+                self._signal_worker.start()
+
+        self._signal_queue.put(list(entity_ids))
+
+    def _run_signal_worker(self) -> None:
+        """Drain the signal queue forever (runs in a daemon thread)"""
+        while True:
+            entity_ids = self._signal_queue.get()
+            try:
+                self.compute_and_store_signals(entity_ids)
+            except Exception as e:
+                logger.error("Error assigning signals to %d entities: %s", len(entity_ids), e, exc_info=True)
+            finally:
+                self._signal_queue.task_done()
+
+    def _handle_event_error(self, event_id: str, error: Exception, defer_status: bool = False) -> Dict:
+        """Mark an event as failed and build its error result"""
+        logger.error("Error processing event %s: %s", event_id, error, exc_info=error)
+        if not defer_status:
             self.db.update_event_status(event_id, 'error')
 
-            return {
-                'event_id': event_id,
-                'status': 'error',
-                'error': str(e)
-            }
+        return {
+            'event_id': event_id,
+            'status': 'error',
+            'error': str(error)
+        }
 
     def process_pending_events(self, batch_size: int = 10) -> Dict:
         """Process all pending events in batches
 
+        Events are streamed from the database and each one is prepared as soon as
+        it is chunked. The chunks of the whole batch are embedded together in the
+        background while events are prepared concurrently; each event is then
+        finalized with its embeddings.
+
         Args:
             batch_size: Maximum number of events to process in this batch
 
         Returns:
             Dictionary with batch processing results
         """
-        logger.info(f"Fetching up to {batch_size} pending events")
+        logger.info("Fetching up to %s pending events", batch_size)
 
-        events = self.db.get_pending_events(limit=batch_size)
-        total_events = len(events)
+        # Events arrive page by page so extraction can start before the whole
+        # batch has been fetched
+        events = self.db.iter_pending_events(limit=batch_size)
+        first_event = next(events, None)
 
-        if total_events == 0:
+        if first_event is None:
             logger.info("No pending events to process")
             return {
                 'status': 'success',
@@ -441,22 +822,91 @@ class Archivist:
                 'events_failed': 0
             }
 
-        logger.info(f"Processing batch of {total_events} events")
+        results = []  # one result per event, in fetch order
+        loaded = []  # (index, loaded event) for events that were fetched and chunked
+        prepare_futures = []
+
+        # Events are independent and I/O-bound (LLM, DB), so run them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_EVENTS) as executor:
+            # Steps 1, 2 and 8 as each event arrives (local work on the fetched row),
+            # then pass 1: steps 3-7 start right away while later pages are fetched
+            try:
+                for event in itertools.chain([first_event], events):
+                    index = len(results)
+                    results.append(None)
+                    try:
+                        event_state = self._load_event(event.id, event)
+                    except Exception as e:
+                        results[index] = self._handle_event_error(event.id, e, defer_status=True)
+                        continue
+                    loaded.append((index, event_state))
+                    prepare_futures.append((index, event_state, executor.submit(self._prepare_event, event_state, False)))
+            except Exception as e:
+                # Finish the events already fetched; the rest stay pending for the next batch
+                logger.error("Error fetching pending events, processing the %d already fetched: %s", len(results), e)
+
+            total_events = len(results)
+            logger.info("Processing batch of %s events", total_events)
+
+            # Step 9 for the whole batch: one embedding pass across all events' chunks,
+            # running in the background while entities are extracted
+            embeddings_future = _EMBEDDING_POOL.submit(
+                self._generate_embeddings, [event_state['chunks'] for _, event_state in loaded]
+            )
 
-        results = []
-        succeeded = 0
-        failed = 0
+            prepared = []  # (index, state) for events that made it through preparation
+            for index, event_state, future in prepare_futures:
+                try:
+                    prepared.append((index, future.result()))
+                except Exception as e:
+                    results[index] = self._handle_event_error(event_state['event_id'], e, defer_status=True)
+
+            # Step 6 for the whole batch: one relationship pass over every event
+            # that created entities, while the embeddings finish in the background
+            # Reuses the event text already loaded for each event
+            loaded_by_index = dict(loaded)
+            self._run_batch_relationships({
+                state['event_id']: loaded_by_index[index]['event'].payload.content
+                for index, state in prepared if state['entity_ids']
+            })
+
+            try:
+                embeddings_by_index = {
+                    index: embeddings
+                    for (index, _), embeddings in zip(loaded, embeddings_future.result())
+                }
+            except Exception as e:
+                for index, state in prepared:
+                    results[index] = self._handle_event_error(state['event_id'], e, defer_status=True)
+                prepared = []
+
+            # Pass 2: store chunks, queue signals and mark each event processed
+            finalize_futures = [
+                (index, state, executor.submit(self._finalize_event, state, embeddings_by_index[index], True))
+                for index, state in prepared
+            ]
+            for index, state, future in finalize_futures:
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = self._handle_event_error(state['event_id'], e, defer_status=True)
 
-        for event in events:
-            result = self.process_event(event.id)
-            results.append(result)
+        # Step 11 for the whole batch: write every terminal status together
+        statuses = {
+            result['event_id']: 'processed' if result['status'] == 'success' else 'error'
+            for result in results
+        }
+        try:
+            self.db.bulk_update_event_statuses(statuses)
+        except Exception as e:
+            logger.error("Bulk status update failed, falling back to per-event updates: %s", e)
+            for event_id, status in statuses.items():
+                self.db.update_event_status(event_id, status)
 
-            if result['status'] == 'success':
-                succeeded += 1
-            else:
-                failed += 1
+        succeeded = sum(1 for result in results if result['status'] == 'success')
+        failed = total_events - succeeded
 
-        logger.info(f"Batch complete: {succeeded} succeeded, {failed} failed")
+        logger.info("Batch complete: %s succeeded, %s failed", succeeded, failed)
 
         return {
             'status': 'success',
@@ -466,41 +916,72 @@ class Archivist:
             'results': results
         }
 
-    def run_continuous(self, interval_seconds: int = 60, max_iterations: int = None):
+    def _run_batch_relationships(self, event_texts: Dict[str, str]) -> None:
+        """Run incremental relationship detection once for a batch of events
+
+        Args:
+            event_texts: Raw text of each event whose entities were created in
+                this batch, keyed by event ID
+        """
+        if not event_texts:
+            return
+        event_ids = list(event_texts)
+        try:
+            rel_result = self._get_relationship_engine().run_incremental_batch(event_ids, event_texts)
+            logger.info("Relationship engine created %s edges, updated %s edges across %s events", rel_result.get('edges_created', 0), rel_result.get('edges_updated', 0), len(event_ids))
+        except Exception as e:
+            logger.error("Relationship engine failed for batch: %s", e)
+            # Don't fail the batch if relationship detection fails
+
+    def notify_pending(self) -> None:
+        """Wake run_continuous immediately because new events were queued"""
+        self._pending_event.set()
+
+    def run_continuous(self, interval_seconds: int = 60, max_iterations: int = None, batch_size: int = 10):
         """Run Archivist in continuous mode (background worker)
 
         Args:
-            interval_seconds: How often to check for new events (default 60s)
+            interval_seconds: Maximum time to wait between checks for new events (default 60s)
             max_iterations: Optional limit on iterations (for testing)
+            batch_size: Maximum number of events to process per iteration
 
         Note:
             This runs indefinitely unless max_iterations is set.
             Use Ctrl+C to stop, or run in a separate thread/process.
+            The wait is cut short by notify_pending(), and a full batch is
+            followed immediately by another check to drain any backlog.
         """
-        logger.info(f"Starting Archivist in continuous mode (checking every {interval_seconds}s)")
+        logger.info("Starting Archivist in continuous mode (checking every %ss)", interval_seconds)
 
         iteration = 0
 
         try:
             while True:
                 if max_iterations and iteration >= max_iterations:
-                    logger.info(f"Reached max_iterations ({max_iterations}), stopping")
+                    logger.info("Reached max_iterations (%s), stopping", max_iterations)
                     break
 
                 iteration += 1
-                logger.debug(f"Continuous mode iteration {iteration}")
+                logger.debug("Continuous mode iteration %s", iteration)
+
+                # Clear before polling so a notification that arrives mid-batch
+                # still wakes the next wait
+                self._pending_event.clear()
+                batch_full = False
 
                 try:
-                    result = self.process_pending_events()
+                    result = self.process_pending_events(batch_size=batch_size)
                     if result['events_processed'] > 0:
-                        logger.info(f"Iteration {iteration}: Processed {result['events_processed']} events")
+                        logger.info("Iteration %s: Processed %s events", iteration, result['events_processed'])
+                    batch_full = result['events_processed'] >= batch_size
                 except Exception as e:
-                    logger.error(f"Error in continuous processing iteration {iteration}: {str(e)}", exc_info=True)
+                    logger.error("Error in continuous processing iteration %s: %s", iteration, e, exc_info=True)
 
-                time.sleep(interval_seconds)
+                if not batch_full:
+                    self._pending_event.wait(interval_seconds)
 
         except KeyboardInterrupt:
             logger.info("Continuous mode stopped by user (Ctrl+C)")
         except Exception as e:
-            logger.error(f"Fatal error in continuous mode: {str(e)}", exc_info=True)
+            logger.error("Fatal error in continuous mode: %s", e, exc_info=True)
             raise
@@ -1,12 +1,81 @@
 from services.database import DatabaseService
 from processors.signal_scorer import SignalScorer
-from typing import List, Dict, Optional
-from datetime import datetime
+from models.entity import Entity
+from models.insight import Insight
+from models.signal import Signal
+from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from uuid import UUID
+import hashlib
+import httpx
 import logging
 import json
+import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Words ignored when extracting dismissal pattern keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who',
+    'when', 'where', 'why', 'how', 'your', 'their', 'our'
+})
+
+# Insight types as they appear in insight titles (e.g. "Delta Watch: ...")
+_INSIGHT_TYPE_RE = re.compile(r'(Delta Watch|Connection|Prompt)')
+
+# Keyword candidates: runs of 4+ characters between whitespace and ':,.'
+_KEYWORD_RE = re.compile(r'[^\s:,.]{4,}')
+
+# Driver entities (by id) and title -> id resolutions remembered across
+# requests; entries expire after ENTITY_CACHE_TTL seconds
+ENTITY_CACHE_SIZE = 4096
+ENTITY_CACHE_TTL = 60.0
+
+# Hashes of recently recorded dismissal patterns; a repeat within
+# PATTERN_CACHE_TTL seconds is not written again
+PATTERN_CACHE_SIZE = 2048
+PATTERN_CACHE_TTL = 300.0
+
+# Shared by all requests so independent reads can overlap without spawning threads per call
+_FEEDBACK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='feedback')
+
+# How each feedback action adjusts driver signals and the insight
+_ACTION_CONFIG = {
+    'acknowledge': {
+        'importance_delta': 0.1,
+        'recency_boost': True,
+        'status': 'acknowledged',
+        'record_pattern': False,
+        'summary': 'Acknowledged: Boosted'
+    },
+    'dismiss': {
+        'importance_delta': -0.1,
+        'recency_boost': False,
+        'status': 'dismissed',
+        'record_pattern': True,
+        'summary': 'Dismissed: Recorded pattern, lowered',
+        'summary_pattern_skipped': 'Dismissed: Pattern recorded recently (not rewritten), lowered'
+    }
+}
+
+
+def _is_uuid(value: str) -> bool:
+    """Return True if value parses as a UUID"""
+    try:
+        UUID(value)
+        return True
+    except (ValueError, TypeError, AttributeError):
+        return False
+
+
 class FeedbackProcessor:
     """
     Processes user feedback (Acknowledge/Dismiss) and adjusts
@@ -16,9 +85,95 @@ class FeedbackProcessor:
     Dismiss: Lowers importance scores, records pattern to avoid
     """
 
-    def __init__(self):
-        self.db = DatabaseService()
-        self.signal_scorer = SignalScorer()
+    # Shared by every FeedbackProcessor, created on first use
+    _shared_db: Optional[DatabaseService] = None
+    _shared_signal_scorer: Optional[SignalScorer] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db: DatabaseService = None, signal_scorer: SignalScorer = None):
+        self.db = db or self._get_shared_db()
+        self.signal_scorer = signal_scorer or self._get_shared_signal_scorer()
+        self._entity_cache = OrderedDict()  # entity ID -> (expires_at, Entity)
+        self._title_cache = OrderedDict()  # entity title -> (expires_at, entity ID)
+        self._pattern_cache = OrderedDict()  # pattern hash -> (expires_at, True)
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_shared_db(cls) -> DatabaseService:
+        """Return the DatabaseService shared by all instances"""
+        with cls._shared_lock:
+            if cls._shared_db is None:
+                cls._shared_db = DatabaseService()
+            return cls._shared_db
+
+    @classmethod
+    def _get_shared_signal_scorer(cls) -> SignalScorer:
+        """Return the SignalScorer shared by all instances"""
+        with cls._shared_lock:
+            if cls._shared_signal_scorer is None:
+                cls._shared_signal_scorer = SignalScorer()
+            return cls._shared_signal_scorer
+
+    def clear_cache(self) -> None:
+        """Clear the entity lookup and pattern caches (called after database reset)"""
+        with self._cache_lock:
+            self._entity_cache.clear()
+            self._title_cache.clear()
+            self._pattern_cache.clear()
+
+    def _cache_get(self, cache: OrderedDict, key: str):
+        """Return the live cached value for key, or None (caller holds _cache_lock)"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(
+        self,
+        cache: OrderedDict,
+        key: str,
+        value,
+        ttl: float = ENTITY_CACHE_TTL,
+        max_size: int = ENTITY_CACHE_SIZE
+    ) -> None:
+        """Store value under key, evicting the oldest entries (caller holds _cache_lock)"""
+        cache[key] = (time.monotonic() + ttl, value)
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+    def _get_entities_by_ids(self, entity_ids: List[str]) -> Dict[str, Entity]:
+        """
+        Fetch entities by id, serving recent lookups from the cache
+
+        Args:
+            entity_ids: UUIDs of entities
+
+        Returns:
+            Dict mapping entity ID to Entity (missing IDs are omitted)
+        """
+        entities = {}
+        missing = []
+        with self._cache_lock:
+            for entity_id in dict.fromkeys(entity_ids):
+                entity = self._cache_get(self._entity_cache, entity_id)
+                if entity is None:
+                    missing.append(entity_id)
+                else:
+                    entities[entity_id] = entity
+
+        if missing:
+            fetched = self.db.get_entities_by_ids(missing)
+            entities.update(fetched)
+            with self._cache_lock:
+                for entity_id, entity in fetched.items():
+                    self._cache_put(self._entity_cache, entity_id, entity)
+
+        return entities
 
     def process_acknowledge(self, insight_id: str) -> Dict:
         """
@@ -35,58 +190,7 @@ class FeedbackProcessor:
         Returns:
             Dict with status, action, entities_updated, signal_changes
         """
-        try:
-            # Get insight and its drivers
-            insight = self.db.get_insight_by_id(insight_id)
-
-            if not insight:
-                logger.error(f"Insight not found: {insight_id}")
-                return {
-                    'status': 'error',
-                    'message': 'Insight not found'
-                }
-
-            driver_entity_ids = insight.get('drivers', {}).get('entity_ids', [])
-
-            logger.info(f"Processing acknowledge for insight {insight_id} with {len(driver_entity_ids)} drivers")
-
-            # Boost signals for each driver entity
-            entities_updated = []
-            for entity_id in driver_entity_ids:
-                # Try to resolve entity_id if it's a title instead of UUID
-                resolved_id = self._resolve_entity_id(entity_id)
-                if not resolved_id:
-                    logger.warning(f"Could not resolve entity: {entity_id}")
-                    continue
-
-                updated = self._adjust_entity_signals(
-                    resolved_id,
-                    importance_delta=0.1,
-                    recency_boost=True
-                )
-                if updated.get('error'):
-                    logger.warning(f"Failed to update entity {resolved_id}: {updated.get('error')}")
-                else:
-                    entities_updated.append(updated)
-
-            # Update insight status
-            self.db.update_insight_status(insight_id, 'acknowledged')
-
-            logger.info(f"Acknowledged: Boosted {len(entities_updated)} entity signals")
-
-            return {
-                'status': 'success',
-                'action': 'acknowledge',
-                'entities_updated': len(entities_updated),
-                'signal_changes': entities_updated
-            }
-
-        except Exception as e:
-            logger.error(f"Error processing acknowledge: {e}", exc_info=True)
-            return {
-                'status': 'error',
-                'message': str(e)
-            }
+        return self._process_feedback(insight_id, 'acknowledge')
 
     def process_dismiss(self, insight_id: str) -> Dict:
         """
@@ -101,66 +205,151 @@ class FeedbackProcessor:
             insight_id: UUID of the insight
 
         Returns:
-            Dict with status, action, entities_updated, pattern_recorded
+            Dict with status, action, entities_updated and either
+            pattern_recorded or, if the same pattern was recorded recently,
+            pattern_skipped
         """
-        try:
-            # Get insight and its drivers
-            insight = self.db.get_insight_by_id(insight_id)
-
-            if not insight:
-                logger.error(f"Insight not found: {insight_id}")
-                return {
-                    'status': 'error',
-                    'message': 'Insight not found'
-                }
-
-            driver_entity_ids = insight.get('drivers', {}).get('entity_ids', [])
-
-            logger.info(f"Processing dismiss for insight {insight_id} with {len(driver_entity_ids)} drivers")
-
-            # Lower signals for each driver entity
-            entities_updated = []
-            for entity_id in driver_entity_ids:
-                # Try to resolve entity_id if it's a title instead of UUID
-                resolved_id = self._resolve_entity_id(entity_id)
-                if not resolved_id:
-                    logger.warning(f"Could not resolve entity: {entity_id}")
-                    continue
-
-                updated = self._adjust_entity_signals(
-                    resolved_id,
-                    importance_delta=-0.1,
-                    recency_boost=False
-                )
-                if updated.get('error'):
-                    logger.warning(f"Failed to update entity {resolved_id}: {updated.get('error')}")
-                else:
-                    entities_updated.append(updated)
+        return self._process_feedback(insight_id, 'dismiss')
 
-            # Record dismissed pattern
-            pattern = self._extract_pattern(insight)
-            self.db.record_dismissed_pattern(pattern)
-
-            # Update insight status
-            self.db.update_insight_status(insight_id, 'dismissed')
+    def _process_feedback(self, insight_id: str, action: str) -> Dict:
+        """
+        Apply an acknowledge or dismiss to an insight's driver entities
 
-            logger.info(f"Dismissed: Lowered {len(entities_updated)} entity signals, recorded pattern")
+        Args:
+            insight_id: UUID of the insight
+            action: Key into _ACTION_CONFIG ('acknowledge' or 'dismiss')
 
+        Returns:
+            Dict with status, action, entities_updated, signal_changes and,
+            for dismiss, pattern_recorded or pattern_skipped
+        """
+        # Insight ids are UUIDs; anything else would only fail inside the query
+        if not _is_uuid(insight_id):
+            logger.warning("Invalid insight_id: %s", insight_id)
             return {
-                'status': 'success',
-                'action': 'dismiss',
-                'entities_updated': len(entities_updated),
-                'pattern_recorded': pattern,
-                'signal_changes': entities_updated
+                'status': 'error',
+                'message': 'Invalid insight_id'
             }
 
+        try:
+            return self._apply_feedback(insight_id, action)
+        except httpx.TransportError as e:
+            # Network-level failure talking to the database; safe to retry
+            logger.error("Database unreachable while processing %s: %s", action, e, exc_info=True)
+            return {
+                'status': 'error',
+                'message': str(e),
+                'retryable': True
+            }
         except Exception as e:
-            logger.error(f"Error processing dismiss: {e}", exc_info=True)
+            logger.error("Error processing %s: %s", action, e, exc_info=True)
             return {
                 'status': 'error',
                 'message': str(e)
             }
 
+    def _apply_feedback(self, insight_id: str, action: str) -> Dict:
+        """
+        Run the acknowledge/dismiss steps; errors propagate to _process_feedback
+
+        Args:
+            insight_id: UUID of the insight
+            action: Key into _ACTION_CONFIG ('acknowledge' or 'dismiss')
+
+        Returns:
+            Same as _process_feedback
+        """
+        config = _ACTION_CONFIG[action]
+
+        # Get insight and its drivers
+        insight = self.db.get_insight_by_id(insight_id)
+
+        if not insight:
+            logger.error("Insight not found: %s", insight_id)
+            return {
+                'status': 'error',
+                'message': 'Insight not found'
+            }
+
+        driver_entity_ids = insight.drivers.get('entity_ids', [])
+
+        logger.info("Processing %s for insight %s with %d drivers", action, insight_id, len(driver_entity_ids))
+
+        # One timestamp for every write made by this request
+        now = datetime.now(timezone.utc)
+
+        # Resolve titles to UUIDs first so every driver's signals can be
+        # read and written together
+        resolved = self._resolve_entity_ids_bulk(driver_entity_ids)
+        resolved_ids = []
+        for entity_id in driver_entity_ids:
+            resolved_id = resolved[entity_id]
+            if not resolved_id:
+                logger.warning("Could not resolve entity: %s", entity_id)
+                continue
+            resolved_ids.append(resolved_id)
+
+        # The dismissal pattern only reads driver entities, so build it
+        # from the ids resolved above while the signals are being adjusted
+        pattern_future = None
+        if config['record_pattern']:
+            pattern_future = _FEEDBACK_POOL.submit(
+                self._extract_pattern, insight, now, resolved_ids=resolved_ids
+            )
+
+        # Adjust signals for each driver entity
+        signal_rows, signal_results = self._compute_signals_batch(
+            resolved_ids,
+            importance_delta=config['importance_delta'],
+            recency_boost=config['recency_boost'],
+            now=now
+        )
+        pattern = pattern_future.result() if pattern_future is not None else None
+
+        # The same pattern was just recorded (e.g. a repeated dismissal), so
+        # only the signals and status need writing
+        pattern_to_write = pattern
+        if pattern is not None:
+            with self._cache_lock:
+                if self._cache_get(self._pattern_cache, pattern['pattern_hash']):
+                    logger.info("Pattern %s recorded recently, not writing it again", pattern['pattern_hash'])
+                    pattern_to_write = None
+
+        # Signals, the dismissed pattern and the new status are written together
+        self.db.apply_insight_feedback(insight_id, config['status'], signal_rows, pattern_to_write)
+        self._log_signal_changes(signal_results)
+
+        if pattern_to_write is not None:
+            with self._cache_lock:
+                self._cache_put(
+                    self._pattern_cache, pattern['pattern_hash'], True,
+                    ttl=PATTERN_CACHE_TTL, max_size=PATTERN_CACHE_SIZE
+                )
+
+        entities_updated = []
+        for updated in signal_results:
+            if updated.get('error'):
+                logger.warning("Failed to update entity %s: %s", updated['entity_id'], updated.get('error'))
+            else:
+                entities_updated.append(updated)
+
+        result = {
+            'status': 'success',
+            'action': action,
+            'entities_updated': len(entities_updated)
+        }
+        summary = config['summary']
+        if pattern_to_write is not None:
+            result['pattern_recorded'] = pattern_to_write
+        elif pattern is not None:
+            result['pattern_skipped'] = True
+            summary = config['summary_pattern_skipped']
+
+        logger.info("%s %d entity signals", summary, len(entities_updated))
+
+        result['signal_changes'] = entities_updated
+        return result
+
     def _resolve_entity_id(self, entity_id: str) -> Optional[str]:
         """
         Resolve entity_id - if it's a UUID, return as-is.
@@ -169,78 +358,179 @@ class FeedbackProcessor:
         This handles the issue where Claude returns entity titles
         instead of UUIDs in driver_entity_ids.
         """
-        # Check if it looks like a UUID (contains hyphens and hex chars)
-        if '-' in entity_id and len(entity_id) >= 32:
-            return entity_id
+        return self._resolve_entity_ids_bulk([entity_id])[entity_id]
 
-        # Otherwise, try to look up by title
-        try:
-            entity = self.db.get_entity_by_title(entity_id)
-            if entity:
-                return entity['id']
-        except Exception as e:
-            logger.warning(f"Error looking up entity by title '{entity_id}': {e}")
+    def _resolve_entity_ids_bulk(self, raw_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve many driver entity_ids at once
 
-        return None
+        UUIDs map to themselves; title-like ids not resolved recently are
+        looked up with a single query.
 
-    def _adjust_entity_signals(
+        Args:
+            raw_ids: Driver entity_ids, each a UUID or an entity title
+
+        Returns:
+            Dict mapping each raw id to its entity UUID, or None if not found
+        """
+        resolved = {}
+        titles = []
+        with self._cache_lock:
+            for raw_id in raw_ids:
+                # Hyphenated titles are not UUIDs; only a real parse counts
+                if _is_uuid(raw_id):
+                    resolved[raw_id] = raw_id
+                    continue
+                cached_id = self._cache_get(self._title_cache, raw_id)
+                if cached_id is None:
+                    titles.append(raw_id)
+                else:
+                    resolved[raw_id] = cached_id
+
+        # Otherwise, look up every title in one query
+        matches = {}
+        if titles:
+            try:
+                matches = self.db.get_entities_by_titles([(title, None) for title in titles])
+            except Exception as e:
+                logger.warning("Error looking up entities by title %s: %s", titles, e)
+
+        with self._cache_lock:
+            for title in titles:
+                entity = matches.get((title, None))
+                resolved[title] = entity.id if entity else None
+                if entity:
+                    self._cache_put(self._title_cache, title, entity.id)
+                    self._cache_put(self._entity_cache, entity.id, entity)
+
+        return resolved
+
+    def _compute_signals_batch(
         self,
-        entity_id: str,
+        entity_ids: List[str],
         importance_delta: float,
-        recency_boost: bool
-    ) -> Dict:
+        recency_boost: bool,
+        now: Optional[datetime] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
         """
-        Adjust signal scores for an entity
+        Read the signals of several entities and compute their new values
 
         Args:
-            entity_id: UUID of entity
+            entity_ids: UUIDs of entities (duplicates are adjusted once)
             importance_delta: Amount to change importance (+0.1 or -0.1)
             recency_boost: Whether to refresh recency to 1.0
+            now: Request timestamp used for recency and last_surfaced_at (defaults to now)
 
         Returns:
-            Dict with entity_id, importance changes, recency_boosted
+            (signal rows to write, one dict per entity with entity_id,
+            importance changes, recency_boosted, or entity_id and error)
         """
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if not entity_ids:
+            return [], []
+
         try:
-            signal = self.db.get_signal_by_entity_id(entity_id)
+            signals = self.db.get_signals_by_entity_ids(entity_ids)
+            surfaced_at = now or datetime.now(timezone.utc)
+            surfaced_at_iso = surfaced_at.isoformat()
+
+            # Recency is measured from the later of created_at and the surfacing
+            # time, which is always surfaced_at here, so it is the same for every
+            # driver and needs no entity row
+            refreshed_recency = self.signal_scorer.calculate_recency(
+                surfaced_at, now=surfaced_at
+            ) if recency_boost else None
+
+            results = []
+            signal_rows = []
+            for entity_id in entity_ids:
+                signal = signals.get(entity_id)
+                if not signal:
+                    logger.warning("No signal found for entity %s", entity_id)
+                    results.append({'entity_id': entity_id, 'error': 'no_signal'})
+                    continue
+
+                signal_row, change = self._compute_signal_update(
+                    signal,
+                    importance_delta,
+                    refreshed_recency,
+                    surfaced_at_iso
+                )
+                if signal_row is not None:
+                    signal_rows.append(signal_row)
+                results.append(change)
 
-            if not signal:
-                logger.warning(f"No signal found for entity {entity_id}")
-                return {'entity_id': entity_id, 'error': 'no_signal'}
+            return signal_rows, results
 
-            # Calculate new importance (clamped to [0.0, 1.0])
-            old_importance = signal.get('importance', 0.5)
-            new_importance = max(0.0, min(1.0, old_importance + importance_delta))
+        except Exception as e:
+            logger.error("Error adjusting signals for %d entities: %s", len(entity_ids), e, exc_info=True)
+            return [], [{'entity_id': entity_id, 'error': str(e)} for entity_id in entity_ids]
+
+    def _log_signal_changes(self, results: List[Dict]) -> None:
+        """Log the importance changes of a batch as one debug line"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        changes = [
+            f"{change['entity_id']} {change['importance']['old']:.2f}->{change['importance']['new']:.2f}"
+            for change in results if 'importance' in change
+        ]
+        logger.debug("Updated importance for %d entities: %s", len(changes), ', '.join(changes))
+
+    def _compute_signal_update(
+        self,
+        signal: Signal,
+        importance_delta: float,
+        refreshed_recency: Optional[float],
+        surfaced_at_iso: str
+    ) -> Tuple[Optional[Dict], Dict]:
+        """
+        Compute the new signal values for one entity without touching the database
 
-            updates = {'importance': new_importance}
+        Args:
+            signal: Current signal for the entity
+            importance_delta: Amount to change importance (+0.1 or -0.1)
+            refreshed_recency: New recency when boosting, None to keep it
+            surfaced_at_iso: Request timestamp recorded as last_surfaced_at
 
-            # Boost recency if acknowledged
-            if recency_boost:
-                entity = self.db.get_entity_by_id(entity_id)
-                if entity:
-                    # Refresh recency to 1.0 (as if just created)
-                    new_recency = self.signal_scorer.calculate_recency(
-                        entity['created_at'],
-                        datetime.now().isoformat()
-                    )
-                    updates['recency'] = new_recency
-                    updates['last_surfaced_at'] = datetime.now().isoformat()
+        Returns:
+            (signal row for the upsert, or None if the stored signal is
+            unchanged, and the change record for the response)
+        """
+        # Calculate new importance (clamped to [0.0, 1.0])
+        old_importance = signal.importance
+        new_importance = max(0.0, min(1.0, old_importance + importance_delta))
+
+        change = {
+            'entity_id': signal.entity_id,
+            'importance': {'old': old_importance, 'new': new_importance},
+            'recency_boosted': refreshed_recency is not None
+        }
 
-            # Apply updates
-            self.db.update_signal(entity_id, updates)
+        # Importance already clamped at its bound and nothing else refreshed:
+        # the stored row would be rewritten with identical values
+        if new_importance == old_importance and refreshed_recency is None:
+            return None, change
 
-            logger.info(f"Updated entity {entity_id}: importance {old_importance:.2f} -> {new_importance:.2f}")
+        signal_row = {
+            'entity_id': signal.entity_id,
+            'importance': new_importance,
+            'recency': signal.recency,
+            'last_surfaced_at': signal.last_surfaced_at.isoformat() if signal.last_surfaced_at else None
+        }
 
-            return {
-                'entity_id': entity_id,
-                'importance': {'old': old_importance, 'new': new_importance},
-                'recency_boosted': recency_boost
-            }
+        # Boost recency if acknowledged (refreshed to 1.0, as if just created)
+        if refreshed_recency is not None:
+            signal_row['recency'] = refreshed_recency
+            signal_row['last_surfaced_at'] = surfaced_at_iso
 
-        except Exception as e:
-            logger.error(f"Error adjusting signals for entity {entity_id}: {e}", exc_info=True)
-            return {'entity_id': entity_id, 'error': str(e)}
+        return signal_row, change
 
-    def _extract_pattern(self, insight: Dict) -> Dict:
+    def _extract_pattern(
+        self,
+        insight: Insight,
+        now: Optional[datetime] = None,
+        resolved_ids: Optional[List[str]] = None
+    ) -> Dict:
         """
         Extract dismissal pattern from insight
 
@@ -250,44 +540,49 @@ class FeedbackProcessor:
         - Title keywords
 
         This allows the Mentor to avoid generating similar insights.
+        now is the request timestamp recorded as dismissed_at (defaults to now).
+        resolved_ids are the driver UUIDs already resolved by the caller; when
+        omitted the insight's drivers are resolved here.
         """
         # Get entity types of drivers
-        driver_ids = insight.get('drivers', {}).get('entity_ids', [])
-        driver_types = []
+        if resolved_ids is None:
+            driver_ids = insight.drivers.get('entity_ids', [])
+            resolved = self._resolve_entity_ids_bulk(driver_ids)
+            resolved_ids = [resolved[entity_id] for entity_id in driver_ids if resolved[entity_id]]
 
-        for entity_id in driver_ids:
-            # Resolve entity ID if needed
-            resolved_id = self._resolve_entity_id(entity_id)
-            if not resolved_id:
-                continue
-
-            entity = self.db.get_entity_by_id(resolved_id)
-            if entity:
-                driver_types.append(entity.get('type', 'unknown'))
+        entities = self._get_entities_by_ids(resolved_ids) if resolved_ids else {}
+        driver_types = [entities[resolved_id].type for resolved_id in resolved_ids if resolved_id in entities]
 
         # Extract insight type from title
-        title = insight.get('title', '')
-        insight_type = 'Unknown'
-        if 'Delta Watch' in title:
-            insight_type = 'Delta Watch'
-        elif 'Connection' in title:
-            insight_type = 'Connection'
-        elif 'Prompt' in title:
-            insight_type = 'Prompt'
-
-        # Build pattern signature
-        pattern_signature = {
+        title = insight.title
+        match = _INSIGHT_TYPE_RE.search(title)
+        insight_type = match.group(1) if match else 'Unknown'
+
+        # Build pattern signature; dict.fromkeys keeps the first-seen order so
+        # equivalent dismissals produce the same signature
+        stable_signature = {
             'insight_type': insight_type,
-            'driver_types': list(set(driver_types)),
+            'driver_types': list(dict.fromkeys(driver_types)),
             'title_keywords': self._extract_keywords(title),
-            'body_keywords': self._extract_keywords(insight.get('body', '')),
-            'dismissed_at': datetime.now().isoformat()
+            'body_keywords': self._extract_keywords(insight.body)
+        }
+        pattern_signature = {
+            **stable_signature,
+            'dismissed_at': (now or datetime.now(timezone.utc)).isoformat()
         }
 
+        # Hash everything except dismissed_at, so repeat dismissals of the same
+        # pattern share one dismissed_patterns row
+        pattern_hash = hashlib.blake2b(
+            json.dumps(stable_signature, sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+
         return {
             'insight_type': insight_type,
             'driver_entity_types': driver_types,
-            'pattern_signature': pattern_signature
+            'pattern_signature': pattern_signature,
+            'pattern_hash': pattern_hash
         }
 
     def _extract_keywords(self, text: str) -> List[str]:
@@ -296,23 +591,17 @@ class FeedbackProcessor:
 
         Simple keyword extraction - removes stop words and short words.
         """
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
-            'for', 'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-            'could', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-            'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who',
-            'when', 'where', 'why', 'how', 'your', 'their', 'our'
-        }
-
-        # Clean and split text
-        words = text.lower().replace(':', ' ').replace(',', ' ').replace('.', ' ').split()
-
-        # Filter out stop words and short words
-        keywords = [w for w in words if w not in stop_words and len(w) > 3]
-
-        # Return top 5 keywords
-        return keywords[:5]
+        # Scan lazily and lowercase per match, so long bodies are neither
+        # copied nor tokenized past the fifth keyword
+        keywords = []
+        for match in _KEYWORD_RE.finditer(text):
+            word = match.group().lower()
+            if word not in _STOP_WORDS:
+                keywords.append(word)
+                # Return top 5 keywords
+                if len(keywords) == 5:
+                    break
+        return keywords
 
 
 # Singleton instance
@@ -3,14 +3,67 @@ from datetime import datetime, timedelta
 from services.database import DatabaseService
 from config import settings
 from models.chat import ChatMessage, ChatResponse
+from models.entity import Entity
 from prompts.prompt_manager import prompt_manager
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import logging
 import json
 import re
+import threading
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
+# The three digest cards only read the shared context, so their Claude calls run side by side
+_DIGEST_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix='mentor-digest')
+
+# Independent reads made while gathering chat context
+_CHAT_CONTEXT_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix='mentor-chat-context')
+
+# Most relevant entities and relationships kept in a chat turn's context
+CHAT_MAX_RELEVANT_ENTITIES = 15
+CHAT_MAX_RELATIONSHIPS = 10
+
+# Core identity entities (values, goals, mission) change rarely, so chat
+# and digest reuse one lookup for CORE_IDENTITY_TTL seconds
+CORE_IDENTITY_TTL = 300.0
+
+# Digest responses keyed by (insight type, prompt hash): an unchanged graph
+# produces the same prompt, which is answered from here instead of Claude
+RESPONSE_CACHE_SIZE = 64
+RESPONSE_CACHE_TTL = 3600.0
+_CACHED_INSIGHT_TYPES = frozenset({'delta_watch', 'connection', 'prompt'})
+
+# Connection cards look back from the newest recent entities to their
+# historical matches (same type, older than CONNECTION_HISTORY_DAYS)
+CONNECTION_RECENT_ENTITIES = 5
+CONNECTION_SIMILAR_LIMIT = 3
+CONNECTION_HISTORY_DAYS = 30
+
+# Similar-entity lookups keyed by (entity ID, limit, days). The historical
+# side of the graph barely moves between mornings, so they are kept a day
+SIMILAR_CACHE_SIZE = 256
+SIMILAR_CACHE_TTL = 86400.0
+
+# A reply wrapped in a markdown code fence (optionally tagged, e.g. ```json)
+_CODE_FENCE_RE = re.compile(r'^```[\w-]*\s*(.*?)\s*```$', re.DOTALL)
+
+# Common words dropped from chat messages before searching for entities
+_CHAT_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'we', 'they', 'my', 'your', 'our'
+})
+
+# Capitalised phrases ("Water Initiative") or single lowercase words
+_CHAT_KEYWORD_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b|\b[a-z]+\b')
+
 
 class Mentor:
     """
@@ -23,10 +76,131 @@ class Mentor:
     - Prompt: Forward-looking question
     """
 
-    def __init__(self, db: DatabaseService = None):
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+    _shared_client: Optional[Anthropic] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db: DatabaseService = None, client: Anthropic = None):
+        self.client = client or self._get_shared_client()
         self.model = "claude-sonnet-4-5"
+        # Cards that recall or ask rather than reason over goal alignment run
+        # on the faster, cheaper model; everything else uses self.model
+        self.models = {
+            "connection": "claude-haiku-4-5",
+            "prompt": "claude-haiku-4-5",
+        }
         self.db = db or DatabaseService()
+        self._core_identity = None
+        self._core_identity_expires = 0.0
+        self._core_identity_lock = threading.Lock()
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._similar_cache = OrderedDict()
+        self._similar_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_shared_client(cls) -> Anthropic:
+        """Return the Anthropic client shared by all instances (and their pooled connections)"""
+        with cls._shared_lock:
+            if cls._shared_client is None:
+                cls._shared_client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+            return cls._shared_client
+
+    def clear_cache(self) -> None:
+        """Drop the cached core identity, similar entities and digest responses (called after database reset)"""
+        with self._core_identity_lock:
+            self._core_identity = None
+            self._core_identity_expires = 0.0
+        with self._response_cache_lock:
+            self._response_cache.clear()
+        with self._similar_cache_lock:
+            self._similar_cache.clear()
+
+    def _get_core_identity(self) -> List[Entity]:
+        """
+        Fetch the user's core identity entities, reusing a recent lookup
+
+        Returns:
+            List of core_identity entities
+        """
+        with self._core_identity_lock:
+            if self._core_identity is not None and self._core_identity_expires > time.monotonic():
+                return list(self._core_identity)
+
+        core_identity = self.db.get_entities_by_type("core_identity")
+
+        with self._core_identity_lock:
+            self._core_identity = core_identity
+            self._core_identity_expires = time.monotonic() + CORE_IDENTITY_TTL
+        return list(core_identity)
+
+    def _get_similar_entities(
+        self, entities: List[Entity], limit: int, exclude_recent_days: int
+    ) -> Dict[str, List[Entity]]:
+        """
+        Find similar historical entities, reusing lookups from the last day
+
+        Only entities without a cached result are sent to the database, in
+        one batch.
+
+        Args:
+            entities: Entities to find similar entities for
+            limit: Maximum number of similar entities per entity
+            exclude_recent_days: Only return entities older than this
+
+        Returns:
+            Dict mapping each entity ID to its similar entities
+        """
+        similar = {}
+        misses = []
+        now = time.monotonic()
+        with self._similar_cache_lock:
+            for entity in entities:
+                key = (entity.id, limit, exclude_recent_days)
+                entry = self._similar_cache.get(key)
+                if entry is not None and entry[0] > now:
+                    self._similar_cache.move_to_end(key)
+                    similar[entity.id] = list(entry[1])
+                else:
+                    misses.append(entity)
+
+        if misses:
+            fetched = self.db.get_similar_entities_batch(
+                misses, limit=limit, exclude_recent_days=exclude_recent_days
+            )
+            expires = time.monotonic() + SIMILAR_CACHE_TTL
+            with self._similar_cache_lock:
+                for entity in misses:
+                    found = fetched.get(entity.id, [])
+                    similar[entity.id] = list(found)
+                    key = (entity.id, limit, exclude_recent_days)
+                    self._similar_cache[key] = (expires, found)
+                    self._similar_cache.move_to_end(key)
+                while len(self._similar_cache) > SIMILAR_CACHE_SIZE:
+                    self._similar_cache.popitem(last=False)
+
+        return similar
+
+    def warm_similar_cache(self) -> int:
+        """
+        Pre-fetch the Connection card's similar-entity lookups
+
+        Called at startup so the next digest finds them cached.
+
+        Returns:
+            Number of recent entities whose lookups were warmed
+        """
+        try:
+            yesterday = datetime.now() - timedelta(days=1)
+            recent = self.db.get_entities_created_since(yesterday)[:CONNECTION_RECENT_ENTITIES]
+            if recent:
+                self._get_similar_entities(
+                    recent, limit=CONNECTION_SIMILAR_LIMIT, exclude_recent_days=CONNECTION_HISTORY_DAYS
+                )
+            logger.info(f"Warmed similar-entity cache for {len(recent)} recent entities")
+            return len(recent)
+        except Exception as e:
+            logger.warning(f"Could not warm similar-entity cache: {e}")
+            return 0
 
     def generate_daily_digest(self) -> dict:
         """
@@ -46,10 +220,22 @@ class Mentor:
             # Gather context from knowledge graph
             context = self._gather_context()
 
-            # Generate each card type
-            delta_watch = self._generate_delta_watch(context)
-            connection = self._generate_connection(context)
-            prompt = self._generate_prompt(context)
+            # Generate each card type concurrently
+            futures = {
+                insight_type: _DIGEST_POOL.submit(generate, context)
+                for insight_type, generate in (
+                    ("delta_watch", self._generate_delta_watch),
+                    ("connection", self._generate_connection),
+                    ("prompt", self._generate_prompt),
+                )
+            }
+            cards = {
+                insight_type: self._collect_card(insight_type, future)
+                for insight_type, future in futures.items()
+            }
+            delta_watch = cards["delta_watch"]
+            connection = cards["connection"]
+            prompt = cards["prompt"]
 
             insights_created = sum(
                 1 for insight in [delta_watch, connection, prompt] if insight is not None
@@ -68,6 +254,14 @@ class Mentor:
             logger.error(f"Error generating daily digest: {e}", exc_info=True)
             raise
 
+    def _collect_card(self, insight_type: str, future) -> Optional[dict]:
+        """Wait for one digest card, falling back if its generator raised"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Error generating {insight_type}: {e}", exc_info=True)
+            return self._create_fallback_insight(insight_type)
+
     def chat(
         self,
         message: str,
@@ -106,62 +300,123 @@ class Mentor:
             # Step 3: Call Claude
             response = self._call_claude(prompt, "chat")
 
-            # Step 4: Extract entity mentions from user message
-            entities_mentioned = self._extract_entity_mentions(message, context)
-
-            # Step 5: Save user message to raw_events
-            user_event_id = self.db.create_raw_event({
-                "payload": {
-                    "type": "text",
-                    "content": message,
-                    "metadata": {
-                        "source_type": "mentor_chat",
-                        "role": "user"
-                    },
-                    "user_id": "default_user",
-                    "user_entity_id": user_entity_id
-                },
-                "source": "mentor_chat",
-                "status": "pending_processing"
-            })
-
-            # Step 6: Save assistant response to raw_events
-            assistant_event_id = self.db.create_raw_event({
-                "payload": {
-                    "type": "text",
-                    "content": response,
-                    "metadata": {
-                        "source_type": "mentor_chat",
-                        "role": "assistant",
-                        "user_message_event_id": user_event_id
-                    },
-                    "user_id": "default_user",
-                    "user_entity_id": user_entity_id
-                },
-                "source": "mentor_chat",
-                "status": "pending_processing"
-            })
-
-            logger.info(f"Chat response generated. Events: {user_event_id}, {assistant_event_id}")
-
-            return ChatResponse(
-                response=response,
-                user_event_id=user_event_id,
-                assistant_event_id=assistant_event_id,
-                entities_mentioned=entities_mentioned,
-                context_used={
-                    "core_identity_count": len(context.get("core_identity", [])),
-                    "high_priority_count": len(context.get("high_priority", [])),
-                    "active_work_count": len(context.get("active_work", [])),
-                    "relevant_entities_count": len(context.get("relevant_entities", [])),
-                    "relationships_count": len(context.get("relationships", []))
-                }
-            )
+            return self._save_chat_turn(message, response, context, user_entity_id)
 
         except Exception as e:
             logger.error(f"Error in chat: {e}", exc_info=True)
             raise
 
+    def chat_stream(
+        self,
+        message: str,
+        conversation_history: Optional[List[ChatMessage]] = None,
+        user_entity_id: Optional[str] = None
+    ) -> Iterator[Union[str, ChatResponse]]:
+        """
+        Conversational chat with Mentor, streaming the reply as Claude generates it.
+
+        Same context, prompt and raw_events bookkeeping as chat(); the turn is
+        saved once the full reply has arrived.
+
+        Args:
+            message: User's message
+            conversation_history: Previous messages in conversation
+            user_entity_id: UUID of user's entity
+
+        Yields:
+            Reply text chunks, then the final ChatResponse
+        """
+        logger.info(f"Processing streamed chat message: {message[:50]}...")
+
+        try:
+            conversation_history = conversation_history or []
+
+            context = self._gather_chat_context(message)
+            prompt = self._build_chat_prompt(
+                message,
+                conversation_history,
+                context
+            )
+
+            chunks = []
+            for text in self._stream_claude(prompt, "chat"):
+                chunks.append(text)
+                yield text
+
+            yield self._save_chat_turn(message, "".join(chunks).strip(), context, user_entity_id)
+
+        except Exception as e:
+            logger.error(f"Error in streamed chat: {e}", exc_info=True)
+            raise
+
+    def _save_chat_turn(
+        self,
+        message: str,
+        response: str,
+        context: dict,
+        user_entity_id: Optional[str]
+    ) -> ChatResponse:
+        """Save both sides of a chat turn to raw_events and build the ChatResponse"""
+
+        # Extract entity mentions from user message
+        entities_mentioned = self._extract_entity_mentions(message, context)
+
+        # Save both messages to raw_events in one insert; IDs are assigned here
+        # so the assistant event can reference the user event
+        user_event_id = str(uuid.uuid4())
+        assistant_event_id = str(uuid.uuid4())
+
+        user_event = {
+            "id": user_event_id,
+            "payload": {
+                "type": "text",
+                "content": message,
+                "metadata": {
+                    "source_type": "mentor_chat",
+                    "role": "user"
+                },
+                "user_id": "default_user",
+                "user_entity_id": user_entity_id
+            },
+            "source": "mentor_chat",
+            "status": "pending_processing"
+        }
+
+        assistant_event = {
+            "id": assistant_event_id,
+            "payload": {
+                "type": "text",
+                "content": response,
+                "metadata": {
+                    "source_type": "mentor_chat",
+                    "role": "assistant",
+                    "user_message_event_id": user_event_id
+                },
+                "user_id": "default_user",
+                "user_entity_id": user_entity_id
+            },
+            "source": "mentor_chat",
+            "status": "pending_processing"
+        }
+
+        self.db.create_raw_events([user_event, assistant_event])
+
+        logger.info(f"Chat response generated. Events: {user_event_id}, {assistant_event_id}")
+
+        return ChatResponse(
+            response=response,
+            user_event_id=user_event_id,
+            assistant_event_id=assistant_event_id,
+            entities_mentioned=entities_mentioned,
+            context_used={
+                "core_identity_count": len(context.get("core_identity", [])),
+                "high_priority_count": len(context.get("high_priority", [])),
+                "active_work_count": len(context.get("active_work", [])),
+                "relevant_entities_count": len(context.get("relevant_entities", [])),
+                "relationships_count": len(context.get("relationships", []))
+            }
+        )
+
     def _gather_chat_context(self, message: str, is_first_message: bool = False) -> dict:
         """
         Gather relevant context for chat based on message content
@@ -178,60 +433,90 @@ class Mentor:
             Context dict with core_identity, high_priority, active_work, relevant_entities, relationships
         """
 
-        # Always get user's core identity (goals, values, mission)
-        core_identity = self.db.get_entities_by_type("core_identity")
+        # Extract keywords to search for matching entities (repeats dropped, order kept)
+        entity_keywords = list(dict.fromkeys(self._extract_keywords_from_message(message)))
+        logger.info(f"Extracted keywords from message: {entity_keywords}")
 
+        # The active work, high priority and keyword searches don't depend on
+        # each other, so they run side by side
         # Get current active work (high recency)
-        active_work = self.db.get_entities_by_signal_threshold(recency_min=0.8, limit=10)
-
+        active_work_future = _CHAT_CONTEXT_POOL.submit(
+            self.db.get_entities_by_signal_threshold, recency_min=0.8, limit=10
+        )
         # Get highest importance entities (what matters most)
-        high_priority = self.db.get_entities_by_importance(min_importance=0.7, limit=10)
+        high_priority_future = _CHAT_CONTEXT_POOL.submit(
+            self.db.get_entities_by_importance, min_importance=0.7, limit=10
+        )
+        # One search for every keyword and one expansion for every match,
+        # instead of a query per keyword and per matched entity
+        matches_future = _CHAT_CONTEXT_POOL.submit(
+            self.db.search_entities_by_titles, entity_keywords, limit=3
+        ) if entity_keywords else None
 
-        # Extract entities mentioned in message
-        relevant_entities = []
-        relationships = []
+        # Always get user's core identity (goals, values, mission)
+        core_identity = self._get_core_identity()
 
-        # Extract keywords and search for matching entities
-        entity_keywords = self._extract_keywords_from_message(message)
-        logger.info(f"Extracted keywords from message: {entity_keywords}")
+        # Extract entities mentioned in message (keyed by ID, so duplicates
+        # are dropped as they are collected while keeping first-seen order)
+        relevant_entities = {}
+        relationships = []
 
+        matches_by_keyword = matches_future.result() if matches_future else {}
+        # An entity matched by several keywords is expanded once
+        matched_by_id = {}
         for keyword in entity_keywords:
-            matches = self.db.search_entities_by_title(keyword, limit=3)
-
-            for entity in matches:
-                # Add the matched entity
-                relevant_entities.append(entity)
-
-                # Expand: get all entities connected via edges
-                related = self.db.get_entity_relationships(entity.id, limit=5)
-
-                # Add outgoing relationships (this entity -> other entities)
-                for rel in related.outgoing:
-                    relationships.append({
-                        "from": entity,
-                        "to": rel.entity,
-                        "edge": rel.edge
-                    })
-                    # Add connected entity to context
-                    relevant_entities.append(rel.entity)
-
-                # Add incoming relationships (other entities -> this entity)
-                for rel in related.incoming:
-                    relationships.append({
-                        "from": rel.entity,
-                        "to": entity,
-                        "edge": rel.edge
-                    })
-                    # Add connected entity to context
-                    relevant_entities.append(rel.entity)
-
-        # Remove duplicates
-        seen_ids = set()
-        unique_relevant = []
-        for entity in relevant_entities:
-            if entity.id not in seen_ids:
-                seen_ids.add(entity.id)
-                unique_relevant.append(entity)
+            for entity in matches_by_keyword.get(keyword, []):
+                matched_by_id.setdefault(entity.id, entity)
+        # Each matched entity takes a relevant_entities slot, so matches past
+        # the cap could never make it into the context
+        matched = list(matched_by_id.values())[:CHAT_MAX_RELEVANT_ENTITIES]
+        related_by_id = self.db.get_entities_relationships(
+            [entity.id for entity in matched], limit=5
+        ) if matched else {}
+
+        def add_entity(entity):
+            if len(relevant_entities) < CHAT_MAX_RELEVANT_ENTITIES:
+                relevant_entities.setdefault(entity.id, entity)
+
+        def add_relationship(relationship):
+            if len(relationships) < CHAT_MAX_RELATIONSHIPS:
+                relationships.append(relationship)
+
+        for entity in matched:
+            # Stop once both lists are full; nothing further would be kept
+            if (len(relevant_entities) >= CHAT_MAX_RELEVANT_ENTITIES
+                    and len(relationships) >= CHAT_MAX_RELATIONSHIPS):
+                break
+
+            # Add the matched entity
+            add_entity(entity)
+
+            # Expand: get all entities connected via edges
+            related = related_by_id[entity.id]
+
+            # Add outgoing relationships (this entity -> other entities)
+            for rel in related.outgoing:
+                add_relationship({
+                    "from": entity,
+                    "to": rel.entity,
+                    "edge": rel.edge
+                })
+                # Add connected entity to context
+                add_entity(rel.entity)
+
+            # Add incoming relationships (other entities -> this entity)
+            for rel in related.incoming:
+                add_relationship({
+                    "from": rel.entity,
+                    "to": entity,
+                    "edge": rel.edge
+                })
+                # Add connected entity to context
+                add_entity(rel.entity)
+
+        unique_relevant = list(relevant_entities.values())
+        active_work = active_work_future.result()
+        high_priority = high_priority_future.result()
 
         logger.info(
             f"Context gathered: {len(core_identity)} core identity, "
@@ -243,8 +528,8 @@ class Mentor:
             "core_identity": core_identity,
             "active_work": active_work,
             "high_priority": high_priority,
-            "relevant_entities": unique_relevant[:15],  # Top 15 most relevant
-            "relationships": relationships[:10]  # Top 10 relationships
+            "relevant_entities": unique_relevant,  # Top 15 most relevant
+            "relationships": relationships  # Top 10 relationships
         }
 
     def _build_chat_prompt(
@@ -263,21 +548,10 @@ class Mentor:
     def _extract_keywords_from_message(self, message: str) -> List[str]:
         """Extract potential entity keywords from message"""
 
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                      'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                      'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                      'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
-                      'these', 'those', 'i', 'you', 'we', 'they', 'my', 'your', 'our'}
-
-        # Simple word extraction
-        words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b|\b[a-z]+\b', message)
-
-        # Filter and clean
         keywords = []
-        for word in words:
-            clean_word = word.lower().strip()
-            if clean_word not in stop_words and len(clean_word) > 2:
+        for word in _CHAT_KEYWORD_RE.findall(message):
+            clean_word = word.lower()
+            if clean_word not in _CHAT_STOP_WORDS and len(clean_word) > 2:
                 keywords.append(clean_word)
 
         return keywords
@@ -285,21 +559,18 @@ class Mentor:
     def _extract_entity_mentions(self, message: str, context: dict) -> List[str]:
         """Extract entity titles mentioned in message"""
 
+        message_lower = message.lower()
         mentioned = []
-
-        # Check against relevant entities
-        for entity in context.get("relevant_entities", []):
-            title = entity.title.lower()
-            if title in message.lower():
+        seen = set()
+
+        # Check relevant entities first, then active work
+        for entity in context.get("relevant_entities", []) + context.get("active_work", []):
+            if entity.title in seen:
+                continue
+            if entity.title.lower() in message_lower:
+                seen.add(entity.title)
                 mentioned.append(entity.title)
 
-        # Check against active work
-        for entity in context.get("active_work", []):
-            title = entity.title.lower()
-            if title in message.lower():
-                if entity.title not in mentioned:
-                    mentioned.append(entity.title)
-
         return mentioned
 
     def _gather_context(self) -> dict:
@@ -308,29 +579,32 @@ class Mentor:
         logger.info("Gathering context from knowledge graph...")
 
         # Get user's core identity (values, goals, mission)
-        core_identity = self.db.get_entities_by_type("core_identity")
+        core_identity = self._get_core_identity()
 
-        # Get recent activity (last 24 hours)
+        # Get recent activity (last 24 hours), high-importance entities,
+        # high-recency entities (active work) and dismissed patterns (to avoid)
+        # in one round trip
         yesterday = datetime.now() - timedelta(days=1)
-        recent_entities = self.db.get_entities_created_since(yesterday)
-
-        # Get high-importance entities
-        high_priority = self.db.get_entities_by_signal_threshold(
-            importance_min=0.7, limit=20
-        )
-
-        # Get recent high-recency entities (active work)
-        recent_work = self.db.get_entities_by_signal_threshold(recency_min=0.8, limit=20)
-
-        # Get dismissed patterns (to avoid)
-        dismissed = self.db.get_dismissed_patterns(days_back=30)
+        digest_context = self.db.get_digest_context(yesterday, signal_limit=20, dismissed_days=30)
+        recent_entities = digest_context["recent_entities"]
+        high_priority = digest_context["high_priority"]
+        recent_work = digest_context["recent_work"]
+        dismissed = digest_context["dismissed_patterns"]
+
+        # Stated goals and dismissed patterns per card type, shared by the cards
+        goals = [e for e in core_identity if "goal" in e.metadata.get("tags", [])]
+        dismissed_by_type = {}
+        for pattern in dismissed:
+            dismissed_by_type.setdefault(pattern.insight_type, []).append(pattern)
 
         context = {
             "core_identity": core_identity,
+            "goals": goals,
             "recent_entities": recent_entities,
             "high_priority": high_priority,
             "recent_work": recent_work,
             "dismissed_patterns": dismissed,
+            "dismissed_by_type": dismissed_by_type,
         }
 
         logger.info(
@@ -349,12 +623,8 @@ class Mentor:
         logger.info("Generating Delta Watch insight...")
 
         try:
-            # Extract stated goals from core identity
-            goals = [
-                e
-                for e in context["core_identity"]
-                if "goal" in e.metadata.get("tags", [])
-            ]
+            # Stated goals from core identity
+            goals = context["goals"]
 
             # Get what user actually worked on
             actual_work = context["recent_work"]
@@ -366,7 +636,7 @@ class Mentor:
 
             # Build prompt for Claude
             prompt = self._build_delta_watch_prompt(
-                goals, actual_work, context["dismissed_patterns"]
+                goals, actual_work, context["dismissed_by_type"].get("Delta Watch", [])
             )
 
             # Call Claude
@@ -403,18 +673,20 @@ class Mentor:
 
         try:
             # Get recent work and search for similar past work
-            recent = context["recent_entities"][:5]  # Last 5 entities
+            recent = context["recent_entities"][:CONNECTION_RECENT_ENTITIES]
 
             if not recent:
                 logger.info("No recent entities - skipping Connection")
                 return None
 
             # For each recent entity, find semantically similar historical entities
+            # (cached for a day; misses are fetched in one batch)
+            similar_by_id = self._get_similar_entities(
+                recent, limit=CONNECTION_SIMILAR_LIMIT, exclude_recent_days=CONNECTION_HISTORY_DAYS
+            )
             historical_connections = []
             for entity in recent:
-                similar = self.db.get_similar_entities(
-                    entity_id=entity.id, limit=3, exclude_recent_days=30  # Historical only
-                )
+                similar = similar_by_id.get(entity.id)
                 if similar:
                     historical_connections.append(
                         {"current": entity, "historical": similar}
@@ -426,7 +698,7 @@ class Mentor:
 
             # Build prompt
             prompt = self._build_connection_prompt(
-                historical_connections, context["dismissed_patterns"]
+                historical_connections, context["dismissed_by_type"].get("Connection", [])
             )
 
             # Call Claude
@@ -463,11 +735,7 @@ class Mentor:
         try:
             # Use recent work to generate a challenging question
             recent_work = context["recent_work"]
-            goals = [
-                e
-                for e in context["core_identity"]
-                if "goal" in e.metadata.get("tags", [])
-            ]
+            goals = context["goals"]
 
             if not recent_work and not goals:
                 logger.info("No recent work or goals - skipping Prompt")
@@ -475,7 +743,7 @@ class Mentor:
 
             # Build prompt
             prompt = self._build_prompt_card_prompt(
-                recent_work, goals, context["dismissed_patterns"]
+                recent_work, goals, context["dismissed_by_type"].get("Prompt", [])
             )
 
             # Call Claude
@@ -505,13 +773,23 @@ class Mentor:
             return self._create_fallback_insight("prompt")
 
     def _call_claude(self, prompt: str, insight_type: str) -> str:
-        """Make API call to Claude"""
+        """Make API call to Claude, reusing a recent response to an identical digest prompt"""
+
+        cache_key = None
+        if insight_type in _CACHED_INSIGHT_TYPES:
+            cache_key = (insight_type, hashlib.sha256(prompt.encode()).hexdigest())
+            with self._response_cache_lock:
+                entry = self._response_cache.get(cache_key)
+                if entry is not None and entry[0] > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                    logger.info(f"Reusing cached Claude response for {insight_type}")
+                    return entry[1]
 
         try:
             logger.info(f"Calling Claude for {insight_type}...")
 
             response = self.client.messages.create(
-                model=self.model,
+                model=self.models.get(insight_type, self.model),
                 max_tokens=2048,
                 temperature=0.7,  # Higher for creative insights
                 messages=[{"role": "user", "content": prompt}],
@@ -520,19 +798,46 @@ class Mentor:
             content = response.content[0].text.strip()
 
             # Strip markdown if present
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1]) if len(lines) > 2 else content
-                content = content.replace("```json", "").replace("```", "").strip()
+            fenced = _CODE_FENCE_RE.match(content)
+            if fenced:
+                content = fenced.group(1)
 
             logger.info(f"Claude response received for {insight_type}")
 
+            if cache_key is not None:
+                with self._response_cache_lock:
+                    self._response_cache[cache_key] = (time.monotonic() + RESPONSE_CACHE_TTL, content)
+                    self._response_cache.move_to_end(cache_key)
+                    while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+
             return content
 
         except Exception as e:
             logger.error(f"Error calling Claude for {insight_type}: {e}")
             raise
 
+    def _stream_claude(self, prompt: str, insight_type: str) -> Iterator[str]:
+        """Stream a Claude reply, yielding text chunks as they arrive"""
+
+        try:
+            logger.info(f"Streaming Claude for {insight_type}...")
+
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=2048,
+                temperature=0.7,
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+
+            logger.info(f"Claude stream finished for {insight_type}")
+
+        except Exception as e:
+            logger.error(f"Error streaming Claude for {insight_type}: {e}")
+            raise
+
     def _create_fallback_insight(self, insight_type: str) -> dict:
         """Create fallback insight when Claude fails"""
 
@@ -571,44 +876,41 @@ class Mentor:
             logger.error(f"Error creating fallback insight: {e}")
             return None
 
+    def _format_dismissed_context(self, dismissed_patterns, heading: str) -> str:
+        """Prompt section listing up to 3 of a card's dismissed patterns, or "" if none"""
+
+        if not dismissed_patterns:
+            return ""
+        lines = [
+            f"- Pattern: {p.pattern} (dismissed {p.dismiss_count}x)\n" for p in dismissed_patterns[:3]
+        ]
+        return f"\n\nIMPORTANT: {heading}\n" + "".join(lines)
+
     def _build_delta_watch_prompt(
         self, goals, actual_work, dismissed_patterns
     ) -> str:
         """Build prompt for Delta Watch card"""
 
         # Build entity lists with IDs explicitly mapped
-        goal_list = []
-        goal_id_map = {}
-        for g in goals:
-            entity_id = g.id
-            goal_list.append(f"- [{entity_id}] {g.title}: {g.summary or 'No summary'}")
-            goal_id_map[g.title] = entity_id
-
-        work_list = []
-        work_id_map = {}
-        for w in actual_work:
-            entity_id = w.id
-            work_list.append(f"- [{entity_id}] {w.title} ({w.type}): {w.summary or 'No summary'}")
-            work_id_map[w.title] = entity_id
-
-        # Build dismissed pattern context
-        dismissed_context = ""
-        delta_dismissed = [
-            p for p in dismissed_patterns if p["insight_type"] == "Delta Watch"
-        ]
-        if delta_dismissed:
-            dismissed_context = "\n\nIMPORTANT: The user previously dismissed these Delta Watch patterns - avoid similar insights:\n"
-            for p in delta_dismissed[:3]:
-                sig = p.get("pattern_signature", {})
-                dismissed_context += f"- Pattern: {sig}\n"
+        goal_text = "\n".join(
+            f"- [{g.id}] {g.title}: {g.summary or 'No summary'}" for g in goals
+        ) or "- No explicit goals stated"
+        work_text = "\n".join(
+            f"- [{w.id}] {w.title} ({w.type}): {w.summary or 'No summary'}" for w in actual_work
+        ) or "- No recent activity"
+
+        dismissed_context = self._format_dismissed_context(
+            dismissed_patterns,
+            "The user previously dismissed these Delta Watch patterns - avoid similar insights:"
+        )
 
         prompt = f"""You are analyzing a user's stated goals versus their actual work to detect potential misalignment.
 
 User's Stated Goals (from core identity):
-{chr(10).join(goal_list) if goal_list else "- No explicit goals stated"}
+{goal_text}
 
 Actual Work (last 24 hours):
-{chr(10).join(work_list) if work_list else "- No recent activity"}
+{work_text}
 {dismissed_context}
 
 Task: Generate a "Delta Watch" insight that either:
@@ -647,28 +949,21 @@ IMPORTANT:
             historical = conn["historical"][0]  # Best match
             created_date = str(historical.created_at)[:10] if historical.created_at else ""
 
-            current_id = current.id
-            historical_id = historical.id
-
             connection_list.append(
-                f"Current: [{current_id}] {current.title} ({current.type})\n"
-                f"  → Historical: [{historical_id}] {historical.title} from {created_date}"
+                f"Current: [{current.id}] {current.title} ({current.type})\n"
+                f"  → Historical: [{historical.id}] {historical.title} from {created_date}"
             )
+        connection_text = "\n".join(connection_list)
 
-        dismissed_context = ""
-        conn_dismissed = [
-            p for p in dismissed_patterns if p["insight_type"] == "Connection"
-        ]
-        if conn_dismissed:
-            dismissed_context = "\n\nIMPORTANT: User dismissed these Connection patterns - avoid:\n"
-            for p in conn_dismissed[:3]:
-                sig = p.get("pattern_signature", {})
-                dismissed_context += f"- Pattern: {sig}\n"
+        dismissed_context = self._format_dismissed_context(
+            dismissed_patterns,
+            "User dismissed these Connection patterns - avoid:"
+        )
 
         prompt = f"""You are finding valuable connections between current work and historical context.
 
 Potential Connections:
-{chr(10).join(connection_list)}
+{connection_text}
 {dismissed_context}
 
 Task: Create a "Connection" insight that shows how historical work informs current challenges.
@@ -700,33 +995,25 @@ IMPORTANT:
     ) -> str:
         """Build prompt for Prompt card"""
 
-        work_summary = []
-        for w in recent_work[:5]:
-            entity_id = w.id
-            work_summary.append(f"- [{entity_id}] {w.title}: {w.summary or 'No summary'}")
-
-        goal_summary = []
-        for g in goals:
-            entity_id = g.id
-            goal_summary.append(f"- [{entity_id}] {g.title}")
+        work_text = "\n".join(
+            f"- [{w.id}] {w.title}: {w.summary or 'No summary'}" for w in recent_work[:5]
+        )
+        goal_text = "\n".join(
+            f"- [{g.id}] {g.title}" for g in goals
+        ) or "- No explicit goals"
 
-        dismissed_context = ""
-        prompt_dismissed = [
-            p for p in dismissed_patterns if p["insight_type"] == "Prompt"
-        ]
-        if prompt_dismissed:
-            dismissed_context = "\n\nIMPORTANT: User dismissed these Prompt types - avoid:\n"
-            for p in prompt_dismissed[:3]:
-                sig = p.get("pattern_signature", {})
-                dismissed_context += f"- Pattern: {sig}\n"
+        dismissed_context = self._format_dismissed_context(
+            dismissed_patterns,
+            "User dismissed these Prompt types - avoid:"
+        )
 
         prompt = f"""You are a thought partner helping the user think critically about their work.
 
 Recent Work:
-{chr(10).join(work_summary)}
+{work_text}
 
 Goals:
-{chr(10).join(goal_summary) if goal_summary else "- No explicit goals"}
+{goal_text}
 {dismissed_context}
 
 Task: Generate a challenging, forward-looking question that:
@@ -756,5 +1043,17 @@ IMPORTANT:
         return prompt
 
 
-# Singleton instance
-mentor = Mentor()
+# Process-wide instance, created on first use so importing this module
+# doesn't open Anthropic and Supabase clients
+_mentor: Optional[Mentor] = None
+_mentor_lock = threading.Lock()
+
+
+def get_mentor() -> Mentor:
+    """Return the process-wide Mentor, creating it on first use"""
+    global _mentor
+    if _mentor is None:
+        with _mentor_lock:
+            if _mentor is None:
+                _mentor = Mentor()
+    return _mentor
@@ -12,7 +12,7 @@ Based on neuroscientific principles:
 - Synaptic Homeostasis: Weak connections are pruned
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from services.database import DatabaseService
 from anthropic import Anthropic
@@ -74,13 +74,13 @@ class RelationshipEngine:
         import time
         start_time = time.time()
 
-        logger.info(f"Running incremental mode for event {event_id}")
+        logger.info("Running incremental mode for event %s", event_id)
 
         # Get entities created by this event
         entities = self.db.get_entities_by_event(event_id)
 
         if len(entities) < 2:
-            logger.info(f"Event {event_id} has <2 entities, skipping incremental analysis")
+            logger.info("Event %s has <2 entities, skipping incremental analysis", event_id)
             return {
                 'edges_created': 0,
                 'edges_updated': 0,
@@ -88,61 +88,96 @@ class RelationshipEngine:
                 'processing_time': 0
             }
 
+        # Also get recent entities for cross-event connections
+        existing_entities = self.db.get_recent_entities(limit=50)
+
         # Get text context for this event
         event = self.db.get_event_by_id(event_id)
-        context_text = event.payload.get('content', '') if event else None
+        context_text = event.payload.content if event else None
 
-        # Also get recent entities for cross-event connections
-        existing_entities = self.db.get_recent_entities(limit=50)
-        all_entities_objs = entities + existing_entities
+        edges_created, edges_updated, strategies_used = self._analyze_event_entities(
+            event_id, entities, existing_entities, context_text
+        )
 
-        # Convert to dicts for strategy methods
-        all_entities = [
-            {
-                'id': e.id,
-                'title': e.title,
-                'type': e.type,
-                'summary': e.summary if hasattr(e, 'summary') else None,
-                'metadata': e.metadata if hasattr(e, 'metadata') else {}
-            }
-            for e in all_entities_objs
-        ]
+        elapsed = time.time() - start_time
 
-        # Run CHEAP strategies only (fast, synchronous)
-        strategies = [
-            ('pattern_based', self.strategy_pattern_based(all_entities)),
-            ('semantic_llm', self.strategy_semantic_llm(all_entities, context_text))
+        result = {
+            'edges_created': edges_created,
+            'edges_updated': edges_updated,
+            'strategies_used': strategies_used,
+            'processing_time': elapsed
+        }
+
+        logger.info("Incremental mode complete: %s", result)
+        return result
+
+    def run_incremental_batch(
+        self,
+        event_ids: List[str],
+        event_texts: Optional[Dict[str, Optional[str]]] = None
+    ) -> Dict:
+        """
+        Incremental Mode for a batch of events processed together.
+
+        Fetches the entities of every event in one query and the recent
+        entities once, instead of repeating both lookups per event. Event
+        texts the caller already has are reused; the rest are fetched in
+        one query.
+
+        Args:
+            event_ids: The events that were just processed
+            event_texts: Optional mapping of event ID to its raw text
+
+        Returns:
+            Same shape as run_incremental, plus 'events_analyzed': int
+        """
+        import time
+        start_time = time.time()
+
+        logger.info("Running incremental mode for %d events", len(event_ids))
+
+        entities_by_event = self.db.get_entities_by_source_events(event_ids)
+        eligible_ids = [
+            event_id for event_id in event_ids
+            if len(entities_by_event.get(event_id, [])) >= 2
         ]
 
         edges_created = 0
         edges_updated = 0
+        strategies_used: List[str] = []
 
-        for strategy_name, relationships in strategies:
-            filtered = self._filter_by_confidence(relationships)
+        if eligible_ids:
+            existing_entities = self.db.get_recent_entities(limit=50)
 
-            for rel in filtered:
-                # Add metadata about source strategy
-                rel['metadata'] = rel.get('metadata', {})
-                rel['metadata']['source_strategy'] = strategy_name
-                rel['metadata']['source_event_id'] = event_id
-
-                # Create or reinforce edge
-                was_updated = self.create_or_update_edge(rel)
-                if was_updated:
-                    edges_updated += 1
-                else:
-                    edges_created += 1
+            context_texts = {
+                event_id: text for event_id, text in (event_texts or {}).items()
+                if event_id in eligible_ids
+            }
+            missing_ids = [event_id for event_id in eligible_ids if event_id not in context_texts]
+            if missing_ids:
+                events = self.db.get_events_by_ids(missing_ids)
+                for event_id in missing_ids:
+                    event = events.get(event_id)
+                    context_texts[event_id] = event.payload.content if event else None
+
+            for event_id in eligible_ids:
+                created, updated, strategies_used = self._analyze_event_entities(
+                    event_id, entities_by_event[event_id], existing_entities, context_texts[event_id]
+                )
+                edges_created += created
+                edges_updated += updated
 
         elapsed = time.time() - start_time
 
         result = {
             'edges_created': edges_created,
             'edges_updated': edges_updated,
-            'strategies_used': [s[0] for s in strategies],
+            'strategies_used': strategies_used,
+            'events_analyzed': len(eligible_ids),
             'processing_time': elapsed
         }
 
-        logger.info(f"Incremental mode complete: {result}")
+        logger.info("Incremental batch complete: %s", result)
         return result
 
     def run_nightly(self, full_scan: bool = False) -> Dict:
@@ -168,7 +203,7 @@ class RelationshipEngine:
         import time
         start_time = time.time()
 
-        logger.info(f"Starting nightly mode (full_scan={full_scan})")
+        logger.info("Starting nightly mode (full_scan=%s)", full_scan)
 
         # Determine scope
         if full_scan:
@@ -190,7 +225,7 @@ class RelationshipEngine:
             for e in entities
         ]
 
-        logger.info(f"Analyzing {len(entity_dicts)} entities")
+        logger.info("Analyzing %d entities", len(entity_dicts))
 
         # Run ALL strategies (including expensive ones)
         strategies = [
@@ -233,7 +268,7 @@ class RelationshipEngine:
             'processing_time': elapsed
         }
 
-        logger.info(f"Nightly mode complete: {result}")
+        logger.info("Nightly mode complete: %s", result)
         return result
 
     def run_on_demand(self, entity_ids: Optional[List[str]] = None) -> Dict:
@@ -251,10 +286,10 @@ class RelationshipEngine:
         if entity_ids:
             entities = [self.db.get_entity_by_id(eid) for eid in entity_ids]
             entities = [e for e in entities if e]  # Filter out None
-            logger.info(f"On-demand mode: analyzing {len(entities)} specified entities")
+            logger.info("On-demand mode: analyzing %d specified entities", len(entities))
         else:
             entities = self.db.get_all_entities()
-            logger.info(f"On-demand mode: analyzing entire graph ({len(entities)} entities)")
+            logger.info("On-demand mode: analyzing entire graph (%d entities)", len(entities))
 
         # Run with same logic as nightly mode
         return self.run_nightly(full_scan=True)
@@ -285,7 +320,7 @@ class RelationshipEngine:
 
         # Limit to avoid huge prompts (process in batches if needed)
         if len(entities) > 20:
-            logger.warning(f"Truncating entity list from {len(entities)} to 20 for LLM analysis")
+            logger.warning("Truncating entity list from %d to 20 for LLM analysis", len(entities))
             entities = entities[:20]
 
         # Build entity list with short IDs for the prompt
@@ -385,15 +420,15 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
             # Filter out relationships with missing IDs
             relationships = [r for r in relationships if 'from_id' in r and 'to_id' in r]
 
-            logger.info(f"LLM strategy found {len(relationships)} relationships")
+            logger.info("LLM strategy found %d relationships", len(relationships))
             return relationships
 
         except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error in LLM strategy: {e}")
-            logger.error(f"Raw response: {content[:500] if 'content' in locals() else 'N/A'}")
+            logger.error("JSON parsing error in LLM strategy: %s", e)
+            logger.error("Raw response: %s", content[:500] if 'content' in locals() else 'N/A')
             return []
         except Exception as e:
-            logger.error(f"Error in LLM strategy: {e}", exc_info=True)
+            logger.error("Error in LLM strategy: %s", e, exc_info=True)
             return []
 
     def strategy_pattern_based(self, entities: List[Dict]) -> List[Dict]:
@@ -454,11 +489,11 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                                 }
                             })
 
-                            logger.debug(f"Pattern match: {role_title} -> {org_title}")
+                            logger.debug("Pattern match: %s -> %s", role_title, org_title)
                             break  # Only create one edge per role
                     break  # Stop after first pattern match
 
-        logger.info(f"Pattern-based strategy found {len(relationships)} relationships")
+        logger.info("Pattern-based strategy found %d relationships", len(relationships))
         return relationships
 
     def strategy_embedding_similarity(
@@ -497,8 +532,8 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                 entity_texts.append(text)
 
             # Generate embeddings using the embeddings service
-            from services.embeddings import EmbeddingsService
-            embeddings_service = EmbeddingsService()
+            from services.embeddings import get_embeddings_service
+            embeddings_service = get_embeddings_service()
             embeddings = embeddings_service.generate_embeddings_batch(entity_texts)
 
             # Calculate pairwise cosine similarity
@@ -520,8 +555,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                         # (likely duplicates that should be merged instead)
                         if entity_a.get('type') == entity_b.get('type') and similarity > 0.95:
                             logger.debug(
-                                f"Skipping very similar same-type entities (likely duplicates): "
-                                f"{entity_a.get('title')} <-> {entity_b.get('title')} (sim={similarity:.2f})"
+                                "Skipping very similar same-type entities (likely duplicates): %s <-> %s (sim=%.2f)", entity_a.get('title'), entity_b.get('title'), similarity
                             )
                             continue
 
@@ -539,11 +573,11 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                             }
                         })
 
-            logger.info(f"Embedding similarity strategy found {len(relationships)} connections")
+            logger.info("Embedding similarity strategy found %d connections", len(relationships))
             return relationships
 
         except Exception as e:
-            logger.error(f"Embedding similarity strategy failed: {e}")
+            logger.error("Embedding similarity strategy failed: %s", e)
             return []
 
     def strategy_temporal(self, entities: List[Dict]) -> List[Dict]:
@@ -574,7 +608,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                 })
 
         if len(temporal_entities) < 2:
-            logger.debug(f"Only {len(temporal_entities)} entities with temporal data, skipping temporal strategy")
+            logger.debug("Only %d entities with temporal data, skipping temporal strategy", len(temporal_entities))
             return []
 
         # Parse dates
@@ -654,7 +688,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                         }
                     })
 
-        logger.info(f"Temporal strategy found {len(relationships)} connections")
+        logger.info("Temporal strategy found %d connections", len(relationships))
         return relationships
 
     def strategy_graph_topology(self, entity_ids: List[str]) -> List[Dict]:
@@ -739,11 +773,11 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                             }
                         })
 
-            logger.info(f"Graph topology strategy found {len(relationships)} transitive connections")
+            logger.info("Graph topology strategy found %d transitive connections", len(relationships))
             return relationships
 
         except Exception as e:
-            logger.error(f"Graph topology strategy failed: {e}")
+            logger.error("Graph topology strategy failed: %s", e)
             return []
 
     # ==================== EDGE MANAGEMENT ====================
@@ -792,7 +826,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                 )
             })
 
-            logger.info(f"Reinforced edge {existing_edge.id[:8]}... (weight: {existing_edge.weight if hasattr(existing_edge, 'weight') else 1.0}  {new_weight})")
+            logger.info("Reinforced edge %s (weight: %s  %s)", existing_edge.id, existing_edge.weight if hasattr(existing_edge, 'weight') else 1.0, new_weight)
             return True  # Updated
 
         else:
@@ -821,7 +855,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
                 edge_data['source_event_id'] = event_id
 
             edge_id = self.db.create_edge(edge_data)
-            logger.info(f"Created edge {edge_id[:8]}... ({kind}): {from_id[:8]}...  {to_id[:8]}...")
+            logger.info("Created edge %s (%s): %s  %s", edge_id, kind, from_id, to_id)
             return False  # Created
 
     def prune_weak_edges(self, threshold: float = 0.1) -> int:
@@ -835,7 +869,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
             Number of edges deleted
         """
         deleted_count = self.db.delete_edges_below_weight(threshold)
-        logger.info(f"Pruned {deleted_count} edges below weight {threshold}")
+        logger.info("Pruned %s edges below weight %s", deleted_count, threshold)
         return deleted_count
 
     def apply_global_decay(self, decay_factor: float = 0.99) -> int:
@@ -864,7 +898,7 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
 
             updated_count += 1
 
-        logger.info(f"Applied global decay ({decay_factor}) to {updated_count} edges")
+        logger.info("Applied global decay (%s) to %s edges", decay_factor, updated_count)
         return updated_count
 
     # ==================== UTILITIES ====================
@@ -884,5 +918,62 @@ Return ONLY valid JSON with a "relationships" array. If no relationships exist,
         """Filter out low-confidence relationships."""
         filtered = [r for r in relationships if r.get('confidence', 0) >= self.min_confidence]
         if len(filtered) < len(relationships):
-            logger.debug(f"Filtered {len(relationships) - len(filtered)} low-confidence relationships")
+            logger.debug("Filtered %s low-confidence relationships", len(relationships) - len(filtered))
         return filtered
+
+    def _analyze_event_entities(
+        self,
+        event_id: str,
+        entities: List,
+        existing_entities: List,
+        context_text: Optional[str]
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Run the cheap incremental strategies for one event's entities.
+
+        Args:
+            context_text: The event's raw text, or None if unavailable
+
+        Returns:
+            (edges_created, edges_updated, strategies_used)
+        """
+        all_entities_objs = entities + existing_entities
+
+        # Convert to dicts for strategy methods
+        all_entities = [
+            {
+                'id': e.id,
+                'title': e.title,
+                'type': e.type,
+                'summary': e.summary if hasattr(e, 'summary') else None,
+                'metadata': e.metadata if hasattr(e, 'metadata') else {}
+            }
+            for e in all_entities_objs
+        ]
+
+        # Run CHEAP strategies only (fast, synchronous)
+        strategies = [
+            ('pattern_based', self.strategy_pattern_based(all_entities)),
+            ('semantic_llm', self.strategy_semantic_llm(all_entities, context_text))
+        ]
+
+        edges_created = 0
+        edges_updated = 0
+
+        for strategy_name, relationships in strategies:
+            filtered = self._filter_by_confidence(relationships)
+
+            for rel in filtered:
+                # Add metadata about source strategy
+                rel['metadata'] = rel.get('metadata', {})
+                rel['metadata']['source_strategy'] = strategy_name
+                rel['metadata']['source_event_id'] = event_id
+
+                # Create or reinforce edge
+                was_updated = self.create_or_update_edge(rel)
+                if was_updated:
+                    edges_updated += 1
+                else:
+                    edges_created += 1
+
+        return edges_created, edges_updated, [s[0] for s in strategies]
@@ -1,11 +1,14 @@
 from fastapi import FastAPI, HTTPException, Header
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from config import settings
 from agents.archivist import Archivist
-from agents.mentor import mentor
+from agents.mentor import get_mentor
 from agents.feedback_processor import feedback_processor
 from services.database import DatabaseService
 from services.undo_service import UndoService
+import asyncio
+import json
 import logging
 import threading
 
@@ -55,6 +58,8 @@ async def reset_cache():
     try:
         logger.info("Cache reset requested via API")
         archivist.clear_cache()
+        feedback_processor.clear_cache()
+        get_mentor().clear_cache()
         return {
             "status": "success",
             "message": "Archivist cache cleared successfully"
@@ -83,6 +88,17 @@ async def trigger_processing(batch_size: int = 10):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/process/notify")
+async def notify_pending_events():
+    """Wake the continuous Archivist worker after new events are queued
+
+    Returns:
+        Acknowledgement; processing happens in the background worker
+    """
+    archivist.notify_pending()
+    return {"status": "queued"}
+
+
 @app.post("/process/event/{event_id}")
 async def process_single_event(event_id: str):
     """Process a specific event by ID
@@ -194,12 +210,20 @@ async def startup_event():
     # Scheduler removed - Mentor now uses dynamic context gathering instead of scheduled digests
     logger.info("Mentor using dynamic context gathering (no scheduled digests)")
 
+    # Pre-fetch the Connection card's similar-entity lookups off the request
+    # path so the next digest (triggered by the external cron) finds them cached
+    threading.Thread(target=lambda: get_mentor().warm_similar_cache(), daemon=True).start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on server shutdown"""
     logger.info("Shutting down UMG AI Core - Archivist & Mentor")
 
+    # Signal scoring runs on a daemon thread; store whatever is still queued
+    # so those entities don't keep stale signals until their next mention
+    await asyncio.to_thread(archivist.wait_for_signals)
+
 
 # Mentor Agent Endpoints
 
@@ -220,7 +244,8 @@ async def generate_daily_digest():
     """
     try:
         logger.info("Manual digest generation triggered via API")
-        digest = mentor.generate_daily_digest()
+        # Digest generation blocks on Claude; keep it off the event loop
+        digest = await asyncio.to_thread(get_mentor().generate_daily_digest)
         return {
             "status": "success",
             "insights_generated": digest["insights_created"],
@@ -255,7 +280,8 @@ async def mentor_status():
         return {
             "status": "ready",
             "context_mode": "dynamic",
-            "model": mentor.model,
+            "model": get_mentor().model,
+            "card_models": get_mentor().models,
             "entity_count": entity_count,
             "signal_count": signal_count
         }
@@ -284,7 +310,7 @@ async def trigger_daily_digest(x_api_key: str = Header(None, alias="X-API-Key"))
 
     try:
         logger.info("External trigger for daily digest received")
-        digest = mentor.generate_daily_digest()
+        digest = await asyncio.to_thread(get_mentor().generate_daily_digest)
         return {
             "status": "success",
             "digest_generated": True,
@@ -372,31 +398,22 @@ async def mentor_chat(request: dict):
             "context_used": {...}
         }
     """
-    from models.chat import ChatMessage
-
     try:
-        message = request.get("message")
-        if not message:
-            raise HTTPException(status_code=400, detail="Message is required")
-
-        # Parse conversation history
-        conversation_history = []
-        for msg in request.get("conversation_history", []):
-            conversation_history.append(
-                ChatMessage(role=msg["role"], content=msg["content"])
-            )
-
-        user_entity_id = request.get("user_entity_id")
+        message, conversation_history, user_entity_id = _parse_chat_request(request)
 
         logger.info(f"Chat request received: {message[:50]}...")
 
         # Call mentor chat method
-        response = mentor.chat(
+        response = get_mentor().chat(
             message=message,
             conversation_history=conversation_history,
             user_entity_id=user_entity_id
         )
 
+        # Both chat turns were queued as raw events; wake the Archivist worker
+        if response.user_event_id:
+            archivist.notify_pending()
+
         # Convert ChatResponse to dict
         return {
             "response": response.response,
@@ -413,6 +430,67 @@ async def mentor_chat(request: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/mentor/chat/stream")
+async def mentor_chat_stream(request: dict):
+    """Chat with Mentor, streaming the reply as server-sent events
+
+    Same request body and bookkeeping as /mentor/chat, but each chunk of the
+    reply is sent as soon as Claude produces it.
+
+    Args:
+        request: Same as /mentor/chat
+
+    Returns:
+        text/event-stream of JSON events:
+        {"type": "delta", "text": str} for each reply chunk, then
+        {"type": "done", ...same fields as /mentor/chat} or
+        {"type": "error", "detail": str}
+    """
+    message, conversation_history, user_entity_id = _parse_chat_request(request)
+
+    logger.info(f"Streamed chat request received: {message[:50]}...")
+
+    def events():
+        try:
+            for item in get_mentor().chat_stream(
+                message=message,
+                conversation_history=conversation_history,
+                user_entity_id=user_entity_id
+            ):
+                if isinstance(item, str):
+                    event = {"type": "delta", "text": item}
+                else:
+                    # Both chat turns were queued as raw events; wake the Archivist worker
+                    if item.user_event_id:
+                        archivist.notify_pending()
+                    event = {"type": "done", **item.model_dump()}
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Error in streamed mentor chat: {e}", exc_info=True)
+            yield f"data: {json.dumps({'type': 'error', 'detail': str(e)})}\n\n"
+
+    # Sync generator: Starlette iterates it in the threadpool, off the event loop
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _parse_chat_request(request: dict):
+    """Pull message, conversation history and user entity id out of a chat request body"""
+    from models.chat import ChatMessage
+
+    message = request.get("message")
+    if not message:
+        raise HTTPException(status_code=400, detail="Message is required")
+
+    # Parse conversation history
+    conversation_history = []
+    for msg in request.get("conversation_history", []):
+        conversation_history.append(
+            ChatMessage(role=msg["role"], content=msg["content"])
+        )
+
+    return message, conversation_history, request.get("user_entity_id")
+
+
 @app.post("/mentor/seed-test-data")
 async def seed_test_data():
     """Seed database with test data for Mentor testing"""
@@ -592,9 +670,11 @@ async def acknowledge_insight(request: FeedbackRequest):
         result = feedback_processor.process_acknowledge(request.insight_id)
 
         if result.get('status') == 'error':
-            raise HTTPException(status_code=400, detail=result.get('message', 'Unknown error'))
+            status_code = 503 if result.get('retryable') else 400
+            raise HTTPException(status_code=status_code, detail=result.get('message', 'Unknown error'))
 
-        return result
+        # The result holds only JSON-native values, so skip FastAPI's encoder pass
+        return JSONResponse(content=result)
     except HTTPException:
         raise
     except Exception as e:
@@ -619,7 +699,7 @@ async def dismiss_insight(request: FeedbackRequest):
             "status": "success",
             "action": "dismiss",
             "entities_updated": int,
-            "pattern_recorded": {...}
+            "pattern_recorded": {...}  # or "pattern_skipped": true if recorded recently
         }
     """
     try:
@@ -627,9 +707,11 @@ async def dismiss_insight(request: FeedbackRequest):
         result = feedback_processor.process_dismiss(request.insight_id)
 
         if result.get('status') == 'error':
-            raise HTTPException(status_code=400, detail=result.get('message', 'Unknown error'))
+            status_code = 503 if result.get('retryable') else 400
+            raise HTTPException(status_code=status_code, detail=result.get('message', 'Unknown error'))
 
-        return result
+        # The result holds only JSON-native values, so skip FastAPI's encoder pass
+        return JSONResponse(content=result)
     except HTTPException:
         raise
     except Exception as e:
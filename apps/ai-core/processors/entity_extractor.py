@@ -2,6 +2,7 @@ from typing import List, Dict
 from config import settings
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ class EntityExtractor:
 
             self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
         except Exception as e:
-            logger.warning(f"Anthropic client not available: {e}")
+            logger.warning("Anthropic client not available: %s", e)
 
     def extract_entities(
         self, text: str, use_llm: bool = True
@@ -89,7 +90,7 @@ Output:
 """
 
         try:
-            logger.info(f"🔍 [DEBUG] Sending extraction request to Claude (text length: {len(text)} chars, prompt length: {len(prompt)} chars)")
+            logger.debug("🔍 [DEBUG] Sending extraction request to Claude (text length: %d chars, prompt length: %d chars)", len(text), len(prompt))
 
             response = self.client.messages.create(
                 model="claude-sonnet-4-5",
@@ -99,8 +100,8 @@ Output:
 
             # Parse JSON response from Claude
             content = response.content[0].text.strip()
-            logger.info(f"🔍 [DEBUG] Claude response length: {len(content)} chars")
-            logger.info(f"🔍 [DEBUG] Claude response preview: {content[:500]}...")
+            logger.debug("🔍 [DEBUG] Claude response length: %d chars", len(content))
+            logger.debug("🔍 [DEBUG] Claude response preview: %s...", content[:500])
 
             # Remove markdown code blocks if present
             if content.startswith("```"):
@@ -112,18 +113,18 @@ Output:
             result = json.loads(content)
             entities = result.get("entities", [])
 
-            logger.info(f"✅ [DEBUG] Successfully extracted {len(entities)} entities from Claude response")
+            logger.debug("✅ [DEBUG] Successfully extracted %d entities from Claude response", len(entities))
 
             for entity in entities:
                 entity["source"] = "llm"
 
             return entities
         except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
-            logger.error(f"Raw content that failed to parse: {content[:1000]}")
+            logger.error("JSON parsing error: %s", e)
+            logger.error("Raw content that failed to parse: %s", content[:1000])
             return []
         except Exception as e:
-            logger.error(f"Error extracting entities with LLM: {e}", exc_info=True)
+            logger.error("Error extracting entities with LLM: %s", e, exc_info=True)
             return []
 
     def _map_spacy_type(self, spacy_label: str) -> str:
@@ -135,3 +136,17 @@ Output:
             "EVENT": "meeting_note",
         }
         return mapping.get(spacy_label, "reference_document")
+
+
+_entity_extractor = None
+_entity_extractor_lock = threading.Lock()
+
+
+def get_entity_extractor() -> EntityExtractor:
+    """Return the process-wide EntityExtractor, creating it on first use"""
+    global _entity_extractor
+    if _entity_extractor is None:
+        with _entity_extractor_lock:
+            if _entity_extractor is None:
+                _entity_extractor = EntityExtractor()
+    return _entity_extractor
@@ -1,5 +1,6 @@
 from typing import Dict, Optional, List
 from datetime import datetime
+import threading
 
 
 class MentionTracker:
@@ -9,6 +10,8 @@ class MentionTracker:
         # In production, this would be database-backed
         # For now, maintain in-memory cache
         self.mention_cache: Dict[str, Dict] = {}
+        # Guards mention_cache; events may be processed on several threads
+        self._lock = threading.RLock()
 
     def record_mention(
         self,
@@ -16,29 +19,31 @@ class MentionTracker:
         entity_type: str,
         event_id: str,
         is_primary_subject: bool = False,
+        count: int = 1,
     ) -> Dict:
-        """Record a mention of an entity"""
+        """Record a mention of an entity (count mentions at once if it repeats in the event)"""
         normalized_key = self._normalize_entity_name(entity_text)
 
-        if normalized_key not in self.mention_cache:
-            self.mention_cache[normalized_key] = {
-                "text": entity_text,
-                "type": entity_type,
-                "mention_count": 0,
-                "events": [],
-                "first_seen": datetime.now(),
-                "last_seen": datetime.now(),
-                "is_promoted": False,
-            }
+        with self._lock:
+            if normalized_key not in self.mention_cache:
+                self.mention_cache[normalized_key] = {
+                    "text": entity_text,
+                    "type": entity_type,
+                    "mention_count": 0,
+                    "events": [],
+                    "first_seen": datetime.now(),
+                    "last_seen": datetime.now(),
+                    "is_promoted": False,
+                }
 
-        mention = self.mention_cache[normalized_key]
-        mention["mention_count"] += 1
-        mention["last_seen"] = datetime.now()
+            mention = self.mention_cache[normalized_key]
+            mention["mention_count"] += count
+            mention["last_seen"] = datetime.now()
 
-        if event_id not in mention["events"]:
-            mention["events"].append(event_id)
+            if event_id not in mention["events"]:
+                mention["events"].append(event_id)
 
-        return mention
+            return mention
 
     def should_promote(
         self, entity_text: str, is_primary_subject: bool = False, entity_type: str = None
@@ -89,18 +94,19 @@ class MentionTracker:
         # require multiple mentions before promoting
         normalized_key = self._normalize_entity_name(entity_text)
 
-        if normalized_key not in self.mention_cache:
-            return False
+        with self._lock:
+            if normalized_key not in self.mention_cache:
+                return False
 
-        mention = self.mention_cache[normalized_key]
+            mention = self.mention_cache[normalized_key]
 
-        # Don't re-promote if already promoted
-        if mention["is_promoted"]:
-            return False
+            # Don't re-promote if already promoted
+            if mention["is_promoted"]:
+                return False
 
-        # Promote after 2+ mentions across different events
-        if mention["mention_count"] >= 2 and len(mention["events"]) >= 2:
-            return True
+            # Promote after 2+ mentions across different events
+            if mention["mention_count"] >= 2 and len(mention["events"]) >= 2:
+                return True
 
         return False
 
@@ -108,27 +114,42 @@ class MentionTracker:
         """Mark entity as promoted to avoid duplicate creation"""
         normalized_key = self._normalize_entity_name(entity_text)
 
-        if normalized_key in self.mention_cache:
-            self.mention_cache[normalized_key]["is_promoted"] = True
-            self.mention_cache[normalized_key]["entity_id"] = entity_id
+        with self._lock:
+            if normalized_key in self.mention_cache:
+                self.mention_cache[normalized_key]["is_promoted"] = True
+                self.mention_cache[normalized_key]["entity_id"] = entity_id
 
     def get_existing_entity_id(self, entity_text: str) -> Optional[str]:
         """Get entity ID if already promoted"""
         normalized_key = self._normalize_entity_name(entity_text)
-        mention = self.mention_cache.get(normalized_key)
 
-        if mention and mention.get("is_promoted"):
-            return mention.get("entity_id")
+        with self._lock:
+            mention = self.mention_cache.get(normalized_key)
+
+            if mention and mention.get("is_promoted"):
+                return mention.get("entity_id")
 
         return None
 
+    def get_existing_entity_ids(self, entity_texts: List[str]) -> Dict[str, str]:
+        """Get entity IDs for every already-promoted entity in entity_texts"""
+        existing = {}
+        with self._lock:
+            for entity_text in entity_texts:
+                entity_id = self.get_existing_entity_id(entity_text)
+                if entity_id:
+                    existing[entity_text] = entity_id
+        return existing
+
     def get_mention_count(self, entity_text: str) -> int:
         """Get the mention count for an entity"""
         normalized_key = self._normalize_entity_name(entity_text)
-        mention = self.mention_cache.get(normalized_key)
 
-        if mention:
-            return mention.get("mention_count", 0)
+        with self._lock:
+            mention = self.mention_cache.get(normalized_key)
+
+            if mention:
+                return mention.get("mention_count", 0)
 
         return 0
 
@@ -60,6 +60,7 @@ class RelationshipMapper:
                     entity_str += f" [also referred to as: {', '.join(matching_refs)}]"
 
                 entity_list.append(entity_str)
+            entity_text = "\n".join(entity_list)
 
             prompt = f"""Given this text and list of entities, identify relationships. Focus on:
 
@@ -76,7 +77,7 @@ DO NOT skip any skills. Connect ALL of them.
 Text: {text}
 
 Entities (new + existing from knowledge graph):
-{chr(10).join(entity_list)}
+{entity_text}
 
 IMPORTANT: Pay attention to pronouns like "I", "me", "my" which may refer to existing entities. These are shown in [also referred to as: ...] hints.
 
@@ -217,21 +218,21 @@ If no relationships exist, return {{"relationships": []}}"""
                 if last_complete > 0:
                     # Truncate to last complete relationship and close the JSON
                     content = content[:last_complete + 1] + '\n  ]\n}'
-                    logger.info(f"Salvaged truncated response, will process partial relationships")
+                    logger.info("Salvaged truncated response, will process partial relationships")
 
             result = json.loads(content)
             relationships = result.get('relationships', [])
 
-            logger.info(f"Detected {len(relationships)} relationships via LLM")
+            logger.info("Detected %d relationships via LLM", len(relationships))
             return relationships
 
         except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
-            logger.error(f"Full raw Claude response that failed to parse:")
+            logger.error("JSON parsing error: %s", e)
+            logger.error("Full raw Claude response that failed to parse:")
             logger.error(content)  # Log the FULL response
             return []
         except Exception as e:
-            logger.error(f"Error detecting relationships with LLM: {str(e)}", exc_info=True)
+            logger.error("Error detecting relationships with LLM: %s", e, exc_info=True)
             return []
 
     def detect_explicit_relationships(self, text: str) -> List[Dict]:
@@ -287,7 +288,7 @@ If no relationships exist, return {{"relationships": []}}"""
             })
 
         if relationships:
-            logger.info(f"Detected {len(relationships)} explicit relationship signals")
+            logger.info("Detected %d explicit relationship signals", len(relationships))
 
         return relationships
 
@@ -324,7 +325,7 @@ If no relationships exist, return {{"relationships": []}}"""
                 old_name = match.group(1).strip()
                 new_name = match.group(2).strip()
 
-                logger.debug(f"Found potential rename: '{old_name}' -> '{new_name}'")
+                logger.debug("Found potential rename: '%s' -> '%s'", old_name, new_name)
 
                 # Find matching entity in the current entity list
                 for entity in entities:
@@ -344,7 +345,7 @@ If no relationships exist, return {{"relationships": []}}"""
                                 # Add old name to aliases if not already present
                                 if old_name not in aliases:
                                     aliases.append(old_name)
-                                    logger.info(f"Adding alias '{old_name}' to entity '{entity_title}'")
+                                    logger.info("Adding alias '%s' to entity '%s'", old_name, entity_title)
 
                                 # Update entity metadata
                                 db.update_entity_metadata(entity_id, {
@@ -360,12 +361,12 @@ If no relationships exist, return {{"relationships": []}}"""
                                     'type': 'rename'
                                 })
                             except Exception as e:
-                                logger.error(f"Error updating entity metadata: {str(e)}")
+                                logger.error("Error updating entity metadata: %s", e)
                         else:
-                            logger.debug(f"Entity '{entity_title}' not yet created, cannot update aliases")
+                            logger.debug("Entity '%s' not yet created, cannot update aliases", entity_title)
 
         if alias_updates:
-            logger.info(f"Updated {len(alias_updates)} entity aliases")
+            logger.info("Updated %d entity aliases", len(alias_updates))
 
         return alias_updates
 
@@ -393,7 +394,7 @@ If no relationships exist, return {{"relationships": []}}"""
         rel_type = relationship.get('relationship_type')
 
         if not all([from_title, to_title, rel_type]):
-            logger.warning(f"Incomplete relationship data: {relationship}")
+            logger.warning("Incomplete relationship data: %s", relationship)
             return False
 
         # Get entity IDs from map
@@ -401,7 +402,7 @@ If no relationships exist, return {{"relationships": []}}"""
         to_id = entity_map.get(to_title)
 
         if not from_id or not to_id:
-            logger.warning(f"Could not find entity IDs for: {from_title} -> {to_title}")
+            logger.warning("Could not find entity IDs for: %s -> %s", from_title, to_title)
             return False
 
         try:
@@ -453,5 +454,5 @@ If no relationships exist, return {{"relationships": []}}"""
             return True
 
         except Exception as e:
-            logger.error(f"Error creating edge: {str(e)}")
+            logger.error("Error creating edge: %s", e)
             return False
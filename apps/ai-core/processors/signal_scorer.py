@@ -1,9 +1,24 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 import math
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Base importance by entity type
+IMPORTANCE_MAP = {
+    'core_identity': 1.0,
+    'project': 0.85,
+    'feature': 0.8,
+    'decision': 0.75,
+    'person': 0.7,
+    'reflection': 0.65,
+    'task': 0.6,
+    'meeting_note': 0.5,
+    'company': 0.5,
+    'reference_document': 0.4,
+}
+
 
 class SignalScorer:
     """Calculates importance, recency, and novelty scores for entities"""
@@ -15,6 +30,7 @@ class SignalScorer:
             recency_half_life_days: Number of days for recency to decay to 0.5
         """
         self.recency_half_life_days = recency_half_life_days
+        self._decay_rate = math.log(2) / recency_half_life_days
 
     def calculate_importance(self, entity_type: str, metadata: dict = None) -> float:
         """Calculate importance score based on entity type and metadata
@@ -40,41 +56,28 @@ class SignalScorer:
         if metadata is None:
             metadata = {}
 
-        # Base importance by entity type
-        importance_map = {
-            'core_identity': 1.0,
-            'project': 0.85,
-            'feature': 0.8,
-            'decision': 0.75,
-            'person': 0.7,
-            'reflection': 0.65,
-            'task': 0.6,
-            'meeting_note': 0.5,
-            'company': 0.5,
-            'reference_document': 0.4,
-        }
-
-        base_score = importance_map.get(entity_type, 0.5)
+        base_score = IMPORTANCE_MAP.get(entity_type, 0.5)
 
         # Adjust based on user-provided importance in metadata
         user_importance = metadata.get('user_importance')
 
         if user_importance == 'high':
             base_score = min(1.0, base_score + 0.2)
-            logger.debug(f"Boosted importance for user_importance=high: {base_score}")
+            logger.debug("Boosted importance for user_importance=high: %s", base_score)
         elif user_importance == 'low':
             base_score = max(0.1, base_score - 0.2)
-            logger.debug(f"Reduced importance for user_importance=low: {base_score}")
+            logger.debug("Reduced importance for user_importance=low: %s", base_score)
 
         # Ensure score is within bounds
         return max(0.0, min(1.0, base_score))
 
-    def calculate_recency(self, created_at: datetime, updated_at: datetime = None) -> float:
+    def calculate_recency(self, created_at: datetime, updated_at: datetime = None, now: datetime = None) -> float:
         """Calculate recency score with exponential decay
 
         Args:
             created_at: When the entity was created
             updated_at: When the entity was last updated (optional)
+            now: Current time to measure age against (optional, defaults to now)
 
         Returns:
             Float between 0.0 and 1.0 representing recency
@@ -95,18 +98,14 @@ class SignalScorer:
             reference_time = created_at
 
         # Calculate age in days
-        now = datetime.now()
-        if reference_time.tzinfo is not None:
-            # Make now timezone-aware to match
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
+        if now is None:
+            now = self._current_time(reference_time)
 
         age = now - reference_time
         age_days = age.total_seconds() / 86400  # Convert to days
 
         # Exponential decay formula
-        decay_rate = math.log(2) / self.recency_half_life_days
-        recency = math.exp(-decay_rate * age_days)
+        recency = math.exp(-self._decay_rate * age_days)
 
         # Clamp to [0.0, 1.0]
         return max(0.0, min(1.0, recency))
@@ -153,7 +152,8 @@ class SignalScorer:
         created_at: datetime,
         updated_at: datetime = None,
         edge_count: int = 0,
-        metadata: dict = None
+        metadata: dict = None,
+        now: datetime = None
     ) -> dict:
         """Calculate all three signal scores at once
 
@@ -163,24 +163,58 @@ class SignalScorer:
             updated_at: Last update timestamp (optional)
             edge_count: Number of edges (default 0)
             metadata: Entity metadata (optional)
+            now: Current time to measure age against (optional, defaults to now)
 
         Returns:
             Dictionary with importance, recency, and novelty scores
         """
-        now = datetime.now()
-        if created_at.tzinfo is not None:
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
+        if now is None:
+            now = self._current_time(created_at)
 
         age = now - created_at
         age_days = int(age.total_seconds() / 86400)
 
         return {
             'importance': self.calculate_importance(entity_type, metadata),
-            'recency': self.calculate_recency(created_at, updated_at),
+            'recency': self.calculate_recency(created_at, updated_at, now=now),
             'novelty': self.calculate_novelty(edge_count, age_days)
         }
 
+    def calculate_all_signals_batch(
+        self,
+        entities: List[Tuple[str, datetime, Optional[datetime], int, Optional[dict]]]
+    ) -> List[Dict[str, float]]:
+        """Calculate signals for many entities against a single clock reading
+
+        Args:
+            entities: (entity_type, created_at, updated_at, edge_count, metadata)
+                      tuples, one per entity
+
+        Returns:
+            One signals dict per input entity, in the same order
+        """
+        now_naive = datetime.now()
+        now_aware = datetime.now(timezone.utc)
+
+        return [
+            self.calculate_all_signals(
+                entity_type=entity_type,
+                created_at=created_at,
+                updated_at=updated_at,
+                edge_count=edge_count,
+                metadata=metadata,
+                now=now_aware if created_at.tzinfo is not None else now_naive
+            )
+            for entity_type, created_at, updated_at, edge_count, metadata in entities
+        ]
+
+    @staticmethod
+    def _current_time(reference_time: datetime) -> datetime:
+        """Current time, timezone-aware only if reference_time is"""
+        if reference_time.tzinfo is not None:
+            return datetime.now(timezone.utc)
+        return datetime.now()
+
     def calculate_composite_score(
         self,
         importance: float,
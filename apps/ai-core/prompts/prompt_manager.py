@@ -37,12 +37,12 @@ class PromptManager:
         """
         filepath = self.prompts_dir / f"{prompt_name}.yaml"
 
-        if not filepath.exists():
+        # Get file modification time for hot-reload (one stat also checks existence)
+        try:
+            mtime = os.path.getmtime(filepath)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {filepath}")
 
-        # Get file modification time for hot-reload
-        mtime = os.path.getmtime(filepath)
-
         cache_key = prompt_name
 
         # Check if we need to reload (file changed or not in cache)
@@ -89,6 +89,19 @@ class PromptManager:
         sections.append(f"\n{config['message_header']}")
         sections.append(message)
 
+        # Add instructions, critical guidelines and final instruction; these only
+        # change with the YAML file, so they are built once per (re)load
+        cache_entry = self.cache["mentor_chat"]
+        if 'footer' not in cache_entry:
+            cache_entry['footer'] = self._build_chat_footer(config)
+        sections.append(cache_entry['footer'])
+
+        return "\n".join(sections)
+
+    def _build_chat_footer(self, config: Dict[str, Any]) -> str:
+        """Build the static instructions that close the mentor chat prompt"""
+        sections = []
+
         # Add instructions
         if config.get('instructions'):
             sections.append("\nINSTRUCTIONS:")
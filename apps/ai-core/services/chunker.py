@@ -17,6 +17,7 @@ class Chunker:
         chunks = []
         current_chunk = []
         current_tokens = 0
+        last_para_tokens = 0
 
         for para in paragraphs:
             para_tokens = len(self.encoding.encode(para))
@@ -36,12 +37,11 @@ class Chunker:
                 current_chunk = (
                     current_chunk[-1:] if current_chunk else []
                 )  # Keep last paragraph for overlap
-                current_tokens = (
-                    len(self.encoding.encode(current_chunk[0])) if current_chunk else 0
-                )
+                current_tokens = last_para_tokens if current_chunk else 0
 
             current_chunk.append(para)
             current_tokens += para_tokens
+            last_para_tokens = para_tokens
 
         # Add final chunk
         if current_chunk:
@@ -1,6 +1,6 @@
 from supabase import create_client, Client
 from config import settings
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from models.raw_event import RawEvent
 from models.entity import Entity
 from models.edge import Edge
@@ -13,15 +13,61 @@ from models.entity_with_signal import EntityWithSignal
 from models.entity_relationship import EntityRelationships, EntityRelationshipItem
 from datetime import datetime, timedelta, date
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Error codes meaning an optional migration hasn't been applied: PostgREST
+# can't find the function/column in its schema cache, or Postgres reports it
+# as undefined (or the ON CONFLICT target has no unique index yet)
+_MISSING_FUNCTION_CODES = {"PGRST202", "42883"}
+_MISSING_COLUMN_CODES = {"PGRST204", "42703", "42P10"}
+
+# Upper bound on rows fetched per title when batch-matching entity titles
+TITLE_MATCH_ROWS_PER_TITLE = 20
+
+_shared_client: Optional[Client] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_supabase_client() -> Client:
+    """Return the process-wide Supabase client, creating it on first use
+
+    All DatabaseService instances share this client so they reuse one
+    HTTP connection pool instead of opening their own.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = create_client(
+                    settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY
+                )
+    return _shared_client
+
+
+def _is_missing_function(error: Exception) -> bool:
+    """Whether an RPC failed because its database function doesn't exist"""
+    return getattr(error, "code", None) in _MISSING_FUNCTION_CODES
+
+
+def _is_missing_column(error: Exception) -> bool:
+    """Whether a write failed because a column or its unique index doesn't exist"""
+    return getattr(error, "code", None) in _MISSING_COLUMN_CODES
+
 
 class DatabaseService:
     def __init__(self):
-        self.client: Client = create_client(
-            settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY
-        )
+        self.client: Client = get_supabase_client()
+        # Cleared the first time the corresponding RPC turns out to be missing
+        self._bulk_metadata_rpc_available = True
+        self._edge_counts_rpc_available = True
+        # Cleared the first time dismissed_patterns turns out to lack pattern_hash
+        self._pattern_hash_available = True
+        self._insight_feedback_rpc_available = True
+        self._digest_context_rpc_available = True
+        self._similar_entities_rpc_available = True
+        self._changed_signals_rpc_available = True
 
     # Raw Events
     def get_pending_events(self, limit: int = 10) -> List[RawEvent]:
@@ -37,6 +83,31 @@ class DatabaseService:
 
         return [RawEvent(**event) for event in response.data]
 
+    def iter_pending_events(self, limit: int = 10, page_size: int = 10) -> Iterator[RawEvent]:
+        """Yield up to limit pending events, fetching page_size rows per request
+
+        Same ordering as get_pending_events. Later pages are only requested once
+        the caller has consumed the earlier ones, so work on the first events can
+        start before the whole batch is fetched.
+        """
+        fetched = 0
+        while fetched < limit:
+            size = min(page_size, limit - fetched)
+            response = (
+                self.client.table("raw_events")
+                .select("*")
+                .eq("status", "pending_processing")
+                .order("created_at", desc=False)
+                .range(fetched, fetched + size - 1)
+                .execute()
+            )
+            rows = response.data or []
+            for event in rows:
+                yield RawEvent(**event)
+            fetched += len(rows)
+            if len(rows) < size:
+                return
+
     def get_event_by_id(self, event_id: str) -> Optional[RawEvent]:
         """Get event by ID"""
         response = (
@@ -48,18 +119,60 @@ class DatabaseService:
         )
         return RawEvent(**response.data) if response.data else None
 
+    def get_events_by_ids(self, event_ids: List[str]) -> Dict[str, RawEvent]:
+        """Get multiple events by ID in one query, keyed by event ID"""
+        if not event_ids:
+            return {}
+        response = (
+            self.client.table("raw_events").select("*").in_("id", list(event_ids)).execute()
+        )
+        return {event["id"]: RawEvent(**event) for event in response.data} if response.data else {}
+
     def update_event_status(self, event_id: str, status: str):
         """Update event status after processing"""
         self.client.table("raw_events").update({"status": status}).eq(
             "id", event_id
         ).execute()
 
+    def bulk_update_event_statuses(self, statuses: Dict[str, str]):
+        """Update the status of many events, one request per distinct status
+
+        Args:
+            statuses: Mapping of event ID to new status
+        """
+        ids_by_status: Dict[str, List[str]] = {}
+        for event_id, status in statuses.items():
+            ids_by_status.setdefault(status, []).append(event_id)
+
+        for status, event_ids in ids_by_status.items():
+            self.client.table("raw_events").update({"status": status}).in_(
+                "id", event_ids
+            ).execute()
+
     # Entities
     def create_entity(self, entity_data: dict) -> str:
         """Create new entity, return ID"""
         response = self.client.table("entity").insert(entity_data).execute()
         return response.data[0]["id"]
 
+    def bulk_create_entities(
+        self, entities_data: List[dict], is_hub: Optional[List[bool]] = None
+    ) -> List[str]:
+        """Create multiple entities in a single insert, return IDs in input order
+
+        Args:
+            entities_data: Entity rows, all with the same columns
+            is_hub: Optional flag per row; hub rows are marked like create_hub_entity does
+        """
+        if not entities_data:
+            return []
+        for entity_data, hub in zip(entities_data, is_hub or []):
+            if hub:
+                entity_data["metadata"] = entity_data.get("metadata", {})
+                entity_data["metadata"]["is_hub"] = True
+        response = self.client.table("entity").insert(entities_data).execute()
+        return [entity["id"] for entity in response.data]
+
     def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
         """Get entity by ID"""
         try:
@@ -71,6 +184,19 @@ class DatabaseService:
             logger.error(f"Error getting entity by ID {entity_id}: {e}")
             return None
 
+    def get_entities_by_ids(self, entity_ids: List[str]) -> Dict[str, Entity]:
+        """Get multiple entities by ID in one query, keyed by entity ID"""
+        if not entity_ids:
+            return {}
+        try:
+            response = (
+                self.client.table("entity").select("*").in_("id", list(entity_ids)).execute()
+            )
+            return {e["id"]: Entity(**e) for e in response.data} if response.data else {}
+        except Exception as e:
+            logger.error(f"Error getting entities by IDs: {e}")
+            return {}
+
     def get_entity_by_title(self, title: str, entity_type: Optional[str] = None) -> Optional[Entity]:
         """Get entity by title (case-insensitive), optionally filtered by type"""
         try:
@@ -83,6 +209,87 @@ class DatabaseService:
             logger.error(f"Error getting entity by title: {e}")
             return None
 
+    def get_entities_by_titles(
+        self, lookups: List[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], Entity]:
+        """Batch version of get_entity_by_title
+
+        Resolves each (title, type) pair with a case-insensitive exact title
+        match first. Only pairs still unresolved fall back to the partial
+        match get_entity_by_title uses, in one ordered, bounded query, so a
+        short title can't pull in every entity containing it.
+
+        Args:
+            lookups: List of (title, entity_type) pairs; entity_type may be None
+
+        Returns:
+            Dict mapping each matched (title, entity_type) pair to an Entity
+        """
+        lookups = [(title, entity_type) for title, entity_type in dict.fromkeys(lookups) if title]
+        if not lookups:
+            return {}
+
+        try:
+            matches = {}
+            candidates = self._get_entities_matching_titles(
+                [title for title, _ in lookups], partial=False
+            )
+            for title, entity_type in lookups:
+                title_lower = title.lower()
+                for entity in candidates:
+                    if entity.title.lower() == title_lower and (not entity_type or entity.type == entity_type):
+                        matches[(title, entity_type)] = entity
+                        break
+
+            unresolved = [lookup for lookup in lookups if lookup not in matches]
+            if not unresolved:
+                return matches
+
+            candidates = self._get_entities_matching_titles(
+                [title for title, _ in unresolved], partial=True
+            )
+            for title, entity_type in unresolved:
+                title_lower = title.lower()
+                for entity in candidates:
+                    if title_lower in entity.title.lower() and (not entity_type or entity.type == entity_type):
+                        matches[(title, entity_type)] = entity
+                        break
+            return matches
+        except Exception as e:
+            logger.error(f"Error getting entities by titles: {e}")
+            return {}
+
+    def _get_entities_matching_titles(self, titles: List[str], partial: bool) -> List[Entity]:
+        """Fetch entities whose title ilike-matches any of titles, oldest first
+
+        Args:
+            titles: Titles to match; LIKE wildcards in them are matched literally
+            partial: Match titles containing each title instead of equal to it
+
+        Returns:
+            At most TITLE_MATCH_ROWS_PER_TITLE rows per distinct title
+        """
+        titles = list(dict.fromkeys(titles))
+        filters = []
+        for title in titles:
+            # Escape LIKE wildcards, then quote so commas/parentheses in
+            # titles don't break the or() filter
+            pattern = title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            if partial:
+                pattern = f"%{pattern}%"
+            quoted = pattern.replace("\\", "\\\\").replace('"', '\\"')
+            filters.append(f'title.ilike."{quoted}"')
+
+        response = (
+            self.client.table("entity")
+            .select("*")
+            .or_(",".join(filters))
+            .order("created_at")
+            .limit(TITLE_MATCH_ROWS_PER_TITLE * len(titles))
+            .execute()
+        )
+        return [Entity(**e) for e in response.data] if response.data else []
+
     def get_entity_metadata(self, entity_id: str) -> dict:
         """Get entity metadata"""
         response = (
@@ -100,6 +307,40 @@ class DatabaseService:
             "id", entity_id
         ).execute()
 
+    def bulk_update_entity_metadata(self, updates: Dict[str, dict]):
+        """Replace the metadata of many entities in one call
+
+        Uses the bulk_update_entity_metadata database function
+        (docs/migrations/add_bulk_update_entity_metadata.sql) and falls back to
+        one update per entity if it hasn't been applied.
+
+        Args:
+            updates: Mapping of entity ID to its full new metadata
+        """
+        if not updates:
+            return
+
+        if len(updates) > 1 and self._bulk_metadata_rpc_available:
+            try:
+                self.client.rpc(
+                    "bulk_update_entity_metadata",
+                    {"updates": [
+                        {"id": entity_id, "metadata": metadata}
+                        for entity_id, metadata in updates.items()
+                    ]},
+                ).execute()
+                return
+            except Exception as e:
+                if not _is_missing_function(e):
+                    raise
+                logger.warning(
+                    "bulk_update_entity_metadata RPC unavailable, using per-entity updates: %s", e
+                )
+                self._bulk_metadata_rpc_available = False
+
+        for entity_id, metadata in updates.items():
+            self.update_entity_metadata(entity_id, metadata)
+
     def create_hub_entity(self, entity_data: dict) -> str:
         """Create hub entity for complex concepts (e.g., 'Feed feature')"""
         # Mark as hub in metadata
@@ -136,6 +377,21 @@ class DatabaseService:
         )
         return [Entity(**entity) for entity in response.data]
 
+    def get_entities_by_source_events(self, event_ids: List[str]) -> Dict[str, List[Entity]]:
+        """Get entities created from several events in one query, grouped by source event ID"""
+        if not event_ids:
+            return {}
+        response = (
+            self.client.table("entity")
+            .select("*")
+            .in_("source_event_id", list(event_ids))
+            .execute()
+        )
+        grouped: Dict[str, List[Entity]] = {}
+        for entity in response.data or []:
+            grouped.setdefault(entity["source_event_id"], []).append(Entity(**entity))
+        return grouped
+
     # Edges
     def create_edge(self, edge_data: dict) -> str:
         """Create new edge, return ID"""
@@ -152,6 +408,50 @@ class DatabaseService:
         )
         return (from_count.count or 0) + (to_count.count or 0)
 
+    def get_edge_counts_for_entities(self, entity_ids: List[str]) -> Dict[str, int]:
+        """Get edge counts (incoming + outgoing) for multiple entities
+
+        Uses the get_edge_counts database function
+        (docs/migrations/add_get_edge_counts.sql) and falls back to fetching
+        edge endpoints in two queries if it hasn't been applied.
+
+        Returns:
+            Dict mapping entity ID to edge count (entities without edges map to 0)
+        """
+        counts = {entity_id: 0 for entity_id in entity_ids}
+        if not entity_ids:
+            return counts
+
+        ids = list(counts)
+
+        if self._edge_counts_rpc_available:
+            try:
+                response = self.client.rpc("get_edge_counts", {"entity_ids": ids}).execute()
+                for row in response.data or []:
+                    counts[row["entity_id"]] = row["edge_count"]
+                return counts
+            except Exception as e:
+                if not _is_missing_function(e):
+                    raise
+                logger.warning(
+                    "get_edge_counts RPC unavailable, counting edges client-side: %s", e
+                )
+                self._edge_counts_rpc_available = False
+
+        from_response = (
+            self.client.table("edge").select("from_id").in_("from_id", ids).execute()
+        )
+        to_response = (
+            self.client.table("edge").select("to_id").in_("to_id", ids).execute()
+        )
+
+        for edge in from_response.data or []:
+            counts[edge["from_id"]] += 1
+        for edge in to_response.data or []:
+            counts[edge["to_id"]] += 1
+
+        return counts
+
     def get_current_relationships(self, entity_id: str, relationship_type: str = None) -> List[Edge]:
         """Get active/current relationships for an entity (end_date is NULL or in future)
 
@@ -223,6 +523,19 @@ class DatabaseService:
         response = self.client.table("chunk").insert(chunk_data).execute()
         return response.data[0]["id"]
 
+    def create_chunks_bulk(self, chunks_data: List[dict]) -> List[str]:
+        """Create multiple chunks in a single insert, return IDs in input order"""
+        if not chunks_data:
+            return []
+        response = self.client.table("chunk").insert(chunks_data).execute()
+        return [chunk["id"] for chunk in response.data]
+
+    def delete_chunks(self, chunk_ids: List[str]):
+        """Delete chunks by ID (their embeddings cascade)"""
+        if not chunk_ids:
+            return
+        self.client.table("chunk").delete().in_("id", chunk_ids).execute()
+
     def get_chunks_by_entity_id(self, entity_id: str) -> List[Chunk]:
         """Get all chunks for an entity"""
         response = (
@@ -235,6 +548,12 @@ class DatabaseService:
         """Create embedding for chunk"""
         self.client.table("embedding").insert(embedding_data).execute()
 
+    def create_embeddings_bulk(self, embeddings_data: List[dict]):
+        """Create embeddings for multiple chunks in a single insert"""
+        if not embeddings_data:
+            return
+        self.client.table("embedding").insert(embeddings_data).execute()
+
     def get_embeddings_by_chunk_id(self, chunk_id: str) -> List[Embedding]:
         """Get embeddings for a chunk"""
         response = (
@@ -250,6 +569,48 @@ class DatabaseService:
             on_conflict="entity_id"  # Use entity_id for conflict detection instead of primary key
         ).execute()
 
+    def create_signals_bulk(self, signals_data: List[dict]):
+        """Create or update signals for multiple entities in a single upsert"""
+        if not signals_data:
+            return
+        self.client.table("signal").upsert(
+            signals_data,
+            on_conflict="entity_id"
+        ).execute()
+
+    def upsert_changed_signals(self, signals_data: List[dict]) -> int:
+        """Upsert signals, leaving rows whose scores are unchanged untouched
+
+        Uses the upsert_changed_signals RPC
+        (docs/migrations/add_upsert_changed_signals.sql) and falls back to a
+        plain upsert of every row if it hasn't been applied.
+
+        Args:
+            signals_data: Signal rows (entity_id, importance, recency, novelty, last_surfaced_at)
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        if not signals_data:
+            return 0
+
+        if self._changed_signals_rpc_available:
+            try:
+                response = self.client.rpc(
+                    "upsert_changed_signals", {"signals": signals_data}
+                ).execute()
+                return response.data or 0
+            except Exception as e:
+                if not _is_missing_function(e):
+                    raise
+                logger.warning(
+                    "upsert_changed_signals RPC unavailable, upserting every row: %s", e
+                )
+                self._changed_signals_rpc_available = False
+
+        self.create_signals_bulk(signals_data)
+        return len(signals_data)
+
     def get_signal_by_entity_id(self, entity_id: str) -> Optional[Signal]:
         """Get signal for entity"""
         response = (
@@ -261,6 +622,18 @@ class DatabaseService:
         )
         return Signal(**response.data) if response.data else None
 
+    def get_signals_by_entity_ids(self, entity_ids: List[str]) -> Dict[str, Signal]:
+        """Get signals for multiple entities in one query, keyed by entity ID"""
+        if not entity_ids:
+            return {}
+        response = (
+            self.client.table("signal")
+            .select("*")
+            .in_("entity_id", list(entity_ids))
+            .execute()
+        )
+        return {s["entity_id"]: Signal(**s) for s in response.data} if response.data else {}
+
     def update_signal(self, entity_id: str, updates: dict):
         """Update signal scores"""
         self.client.table("signal").update(updates).eq("entity_id", entity_id).execute()
@@ -284,14 +657,107 @@ class DatabaseService:
         ).execute()
 
     def record_dismissed_pattern(self, pattern: dict):
-        """Record dismissed insight pattern"""
-        self.client.table("dismissed_patterns").insert(pattern).execute()
+        """Record dismissed insight pattern
+
+        Patterns carrying a pattern_hash share one row per hash
+        (docs/migrations/add_dismissed_pattern_hash.sql): dismissing an
+        equivalent insight again refreshes that row and increments its
+        dismissed_count, matching apply_insight_feedback. Falls back to a
+        plain insert if the column hasn't been added yet.
+        """
+        if pattern.get("pattern_hash") and self._pattern_hash_available:
+            row = dict(pattern)
+            dismissed_at = pattern.get("pattern_signature", {}).get("dismissed_at")
+            row["last_dismissed_at"] = dismissed_at or datetime.now().isoformat()
+            try:
+                response = (
+                    self.client.table("dismissed_patterns")
+                    .select("id, dismissed_count")
+                    .eq("pattern_hash", row["pattern_hash"])
+                    .limit(1)
+                    .execute()
+                )
+                if response.data:
+                    existing = response.data[0]
+                    self.client.table("dismissed_patterns").update({
+                        "pattern_signature": row.get("pattern_signature"),
+                        "last_dismissed_at": row["last_dismissed_at"],
+                        "dismissed_count": (existing.get("dismissed_count") or 1) + 1,
+                    }).eq("id", existing["id"]).execute()
+                else:
+                    self.client.table("dismissed_patterns").insert(row).execute()
+                return
+            except Exception as e:
+                if not _is_missing_column(e):
+                    raise
+                logger.warning(
+                    "dismissed_patterns.pattern_hash unavailable, inserting without it: %s", e
+                )
+                self._pattern_hash_available = False
+
+        row = {key: value for key, value in pattern.items() if key != "pattern_hash"}
+        self.client.table("dismissed_patterns").insert(row).execute()
+
+    def apply_insight_feedback(
+        self,
+        insight_id: str,
+        status: str,
+        signals_data: List[dict],
+        pattern: Optional[dict] = None,
+    ):
+        """Write everything one acknowledge/dismiss changes in one transaction
+
+        Uses the apply_insight_feedback database function
+        (docs/migrations/add_apply_insight_feedback.sql) and falls back to
+        separate signal, pattern and status writes if it hasn't been applied.
+
+        Args:
+            insight_id: UUID of the insight
+            status: New insight status
+            signals_data: Signal rows (entity_id, importance, recency, last_surfaced_at)
+            pattern: Dismissed pattern to record, if any
+        """
+        if self._insight_feedback_rpc_available:
+            try:
+                self.client.rpc(
+                    "apply_insight_feedback",
+                    {
+                        "insight_id": insight_id,
+                        "new_status": status,
+                        "signals": signals_data,
+                        "pattern": pattern,
+                    },
+                ).execute()
+                return
+            except Exception as e:
+                if not _is_missing_function(e):
+                    raise
+                logger.warning(
+                    "apply_insight_feedback RPC unavailable, using separate writes: %s", e
+                )
+                self._insight_feedback_rpc_available = False
+
+        self.create_signals_bulk(signals_data)
+        if pattern is not None:
+            self.record_dismissed_pattern(pattern)
+        self.update_insight_status(insight_id, status)
 
     def create_raw_event(self, event_data: dict) -> str:
         """Create a new raw event (for testing)"""
         response = self.client.table("raw_events").insert(event_data).execute()
         return response.data[0]["id"]
 
+    def create_raw_events(self, events_data: List[dict]) -> List[str]:
+        """Create multiple raw events in a single insert, return IDs in input order
+
+        Args:
+            events_data: Raw event rows, all with the same columns
+        """
+        if not events_data:
+            return []
+        response = self.client.table("raw_events").insert(events_data).execute()
+        return [event["id"] for event in response.data]
+
     def get_recent_entities(self, limit: int = 20) -> List[Entity]:
         """
         Fetch recent entities for entity resolution
@@ -336,6 +802,48 @@ class DatabaseService:
             logger.error(f"Error searching entities by title: {e}")
             return []
 
+    def search_entities_by_titles(
+        self, search_terms: List[str], limit: int = 5
+    ) -> Dict[str, List[Entity]]:
+        """
+        Search entity titles for several terms in one query
+
+        Matches each term the same way as search_entities_by_title
+        (case-insensitive partial title match) using a single query, then
+        assigns rows back to every term whose text they contain.
+
+        Args:
+            search_terms: Texts to search for in entity titles
+            limit: Maximum number of results per term
+
+        Returns:
+            Dict mapping each search term to its matching Entity objects
+        """
+        terms = list(dict.fromkeys(search_terms))
+        if not terms:
+            return {}
+
+        try:
+            # Quote each pattern so commas/parentheses in terms don't break the or() filter
+            filters = []
+            for term in terms:
+                escaped = term.replace("\\", "\\\\").replace('"', '\\"')
+                filters.append(f'title.ilike."%{escaped}%"')
+
+            response = self.client.table("entity").select("*").or_(",".join(filters)).execute()
+            candidates = [Entity(**e) for e in response.data] if response.data else []
+
+            results = {}
+            for term in terms:
+                term_lower = term.lower()
+                results[term] = [
+                    entity for entity in candidates if term_lower in entity.title.lower()
+                ][:limit]
+            return results
+        except Exception as e:
+            logger.error(f"Error searching entities by titles: {e}")
+            return {term: [] for term in terms}
+
     # Mentor Agent Methods
     def get_entities_by_type(self, entity_type: str) -> List[Entity]:
         """Get all entities of a specific type"""
@@ -435,6 +943,66 @@ class DatabaseService:
             logger.error(f"Error fetching dismissed patterns: {e}")
             return []
 
+    def get_digest_context(
+        self,
+        since: datetime,
+        signal_limit: int = 20,
+        dismissed_days: int = 30,
+    ) -> dict:
+        """Fetch what the daily digest reads from the graph in one round trip
+
+        Uses the get_digest_context database function
+        (docs/migrations/add_get_digest_context.sql) and falls back to the
+        individual queries if it hasn't been applied.
+
+        Args:
+            since: Only entities created after this time count as recent
+            signal_limit: Maximum high-importance / high-recency entities each
+            dismissed_days: How far back to look for dismissed patterns
+
+        Returns:
+            Dict with recent_entities, high_priority, recent_work and dismissed_patterns
+        """
+        if self._digest_context_rpc_available:
+            try:
+                response = self.client.rpc(
+                    "get_digest_context",
+                    {
+                        "since": since.isoformat(),
+                        "dismissed_since": (datetime.now() - timedelta(days=dismissed_days)).isoformat(),
+                        "signal_limit": signal_limit,
+                    },
+                ).execute()
+                payload = response.data or {}
+                return {
+                    "recent_entities": [Entity(**e) for e in payload.get("recent_entities") or []],
+                    "high_priority": [EntityWithSignal(**e) for e in payload.get("high_priority") or []],
+                    "recent_work": [EntityWithSignal(**e) for e in payload.get("recent_work") or []],
+                    "dismissed_patterns": self._parse_dismissed_patterns(payload.get("dismissed_patterns") or []),
+                }
+            except Exception as e:
+                if not _is_missing_function(e):
+                    raise
+                logger.warning(
+                    "get_digest_context RPC unavailable, using separate queries: %s", e
+                )
+                self._digest_context_rpc_available = False
+
+        return {
+            "recent_entities": self.get_entities_created_since(since),
+            "high_priority": self.get_entities_by_signal_threshold(importance_min=0.7, limit=signal_limit),
+            "recent_work": self.get_entities_by_signal_threshold(recency_min=0.8, limit=signal_limit),
+            "dismissed_patterns": self.get_dismissed_patterns(days_back=dismissed_days),
+        }
+
+    def _parse_dismissed_patterns(self, rows: List[dict]) -> List[DismissedPattern]:
+        """Build DismissedPattern models, or [] if the rows don't fit the model"""
+        try:
+            return [DismissedPattern(**p) for p in rows]
+        except Exception as e:
+            logger.error(f"Error fetching dismissed patterns: {e}")
+            return []
+
     def create_insight(self, insight_data: dict) -> str:
         """Create new insight, return ID"""
         try:
@@ -498,6 +1066,77 @@ class DatabaseService:
             logger.error(f"Error fetching similar entities: {e}")
             return []
 
+    def get_similar_entities_batch(
+        self, entities: List[Entity], limit: int = 5, exclude_recent_days: int = 30
+    ) -> Dict[str, List[Entity]]:
+        """
+        Find similar entities for several entities at once
+
+        Uses the same heuristic as get_similar_entities (same type, older
+        than X days). Uses the get_similar_entities_batch database function
+        (docs/migrations/add_get_similar_entities_batch.sql) for a single
+        round trip, and falls back to one query per entity type if it
+        hasn't been applied.
+
+        Args:
+            entities: Entities to find similar entities for
+            limit: Maximum number of similar entities per entity
+            exclude_recent_days: Only return entities older than this
+
+        Returns:
+            Dict mapping each entity ID to its similar entities
+        """
+        cutoff = datetime.now() - timedelta(days=exclude_recent_days)
+
+        if self._similar_entities_rpc_available and entities:
+            try:
+                response = self.client.rpc(
+                    "get_similar_entities_batch",
+                    {
+                        "entity_ids": [entity.id for entity in entities],
+                        "max_per_entity": limit,
+                        "created_before": cutoff.isoformat(),
+                    },
+                ).execute()
+                similar = {entity.id: [] for entity in entities}
+                for row in response.data or []:
+                    similar[row["source_id"]].append(Entity(**row["similar"]))
+                return similar
+            except Exception as e:
+                if not _is_missing_function(e):
+                    raise
+                logger.warning(
+                    "get_similar_entities_batch RPC unavailable, using per-type queries: %s", e
+                )
+                self._similar_entities_rpc_available = False
+
+        ids_by_type: Dict[str, List[str]] = {}
+        for entity in entities:
+            ids_by_type.setdefault(entity.type, []).append(entity.id)
+
+        similar: Dict[str, List[Entity]] = {}
+        for entity_type, entity_ids in ids_by_type.items():
+            try:
+                # Over-fetch by the entities of this type so excluding each
+                # entity itself still leaves `limit` candidates
+                response = (
+                    self.client.table("entity")
+                    .select("*")
+                    .eq("type", entity_type)
+                    .lt("created_at", cutoff.isoformat())
+                    .limit(limit + len(entity_ids))
+                    .execute()
+                )
+                candidates = [Entity(**e) for e in response.data] if response.data else []
+            except Exception as e:
+                logger.error(f"Error fetching similar entities for type {entity_type}: {e}")
+                candidates = []
+
+            for entity_id in entity_ids:
+                similar[entity_id] = [c for c in candidates if c.id != entity_id][:limit]
+
+        return similar
+
     def get_entity_relationships(self, entity_id: str, limit: int = 10) -> EntityRelationships:
         """
         Get all entities connected to this entity via edges
@@ -547,6 +1186,59 @@ class DatabaseService:
             logger.error(f"Error fetching entity relationships for {entity_id}: {e}")
             return EntityRelationships(outgoing=[], incoming=[])
 
+    def get_entities_relationships(
+        self, entity_ids: List[str], limit: int = 10
+    ) -> Dict[str, EntityRelationships]:
+        """
+        Get the entities connected to several entities via edges
+
+        Fetches every edge touching any of the entities in one query, with
+        both endpoint entities embedded, and groups them client-side.
+
+        Args:
+            entity_ids: UUIDs of the entities to expand
+            limit: Maximum outgoing (and incoming) items kept per entity
+
+        Returns:
+            Dict mapping each entity ID to its EntityRelationships
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        relationships = {
+            entity_id: EntityRelationships(outgoing=[], incoming=[]) for entity_id in ids
+        }
+        if not ids:
+            return relationships
+
+        id_list = ",".join(ids)
+        try:
+            response = (
+                self.client.table("edge")
+                .select("*, to:entity!edge_to_id_fkey(*), from:entity!edge_from_id_fkey(*)")
+                .or_(f"from_id.in.({id_list}),to_id.in.({id_list})")
+                .execute()
+            )
+        except Exception as e:
+            logger.error(f"Error fetching relationships for {len(ids)} entities: {e}")
+            return relationships
+
+        for edge_data in response.data or []:
+            to_entity_data = edge_data.pop("to", None)
+            from_entity_data = edge_data.pop("from", None)
+            edge = Edge(**edge_data)
+
+            # An edge between two requested entities is outgoing for one and incoming for the other
+            if edge.from_id in relationships and to_entity_data:
+                items = relationships[edge.from_id].outgoing
+                if len(items) < limit:
+                    items.append(EntityRelationshipItem(edge=edge, entity=Entity(**to_entity_data)))
+
+            if edge.to_id in relationships and from_entity_data:
+                items = relationships[edge.to_id].incoming
+                if len(items) < limit:
+                    items.append(EntityRelationshipItem(edge=edge, entity=Entity(**from_entity_data)))
+
+        return relationships
+
     def get_entities_by_importance(self, min_importance: float = 0.7, limit: int = 10) -> List[EntityWithSignal]:
         """
         Get top entities by importance score
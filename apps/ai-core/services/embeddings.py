@@ -1,6 +1,7 @@
 from typing import List
 from config import settings
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,7 @@ class EmbeddingsService:
         self.client = None  # Embeddings disabled
         self.model = "none"
         self.dimensions = 1536
+        self._zero_vector_literal = '[' + ','.join(['0'] * self.dimensions) + ']'
         logger.warning("Embeddings service disabled - Anthropic doesn't provide embeddings")
 
     def generate_embedding(self, text: str) -> List[float]:
@@ -35,9 +37,26 @@ class EmbeddingsService:
         Returns:
             List of zero vectors (embeddings disabled)
         """
-        logger.debug(f"Embeddings disabled - returning {len(texts)} zero vectors")
+        logger.debug("Embeddings disabled - returning %d zero vectors", len(texts))
         return [[0.0] * self.dimensions] * len(texts)
 
+    def to_vector_literal(self, embedding: List[float]) -> str:
+        """Encode an embedding as a pgvector text literal for storage
+
+        pgvector stores float4, so values are written with float32 precision
+        ('%.7g') instead of JSON-encoding full float64 reprs, roughly halving
+        the payload per vector. All-zero vectors reuse a precomputed literal.
+
+        Args:
+            embedding: The embedding vector
+
+        Returns:
+            String such as '[0.0123,-0.456,...]'
+        """
+        if not any(embedding) and len(embedding) == self.dimensions:
+            return self._zero_vector_literal
+        return '[' + ','.join(['%.7g' % value for value in embedding]) + ']'
+
     def get_model_info(self) -> dict:
         """Get information about the embedding model being used
 
@@ -49,3 +68,17 @@ class EmbeddingsService:
             "dimensions": self.dimensions,
             "provider": "Disabled (Anthropic doesn't provide embeddings)"
         }
+
+
+_embeddings_service = None
+_embeddings_service_lock = threading.Lock()
+
+
+def get_embeddings_service() -> EmbeddingsService:
+    """Return the process-wide EmbeddingsService, creating it on first use"""
+    global _embeddings_service
+    if _embeddings_service is None:
+        with _embeddings_service_lock:
+            if _embeddings_service is None:
+                _embeddings_service = EmbeddingsService()
+    return _embeddings_service
@@ -1,8 +1,13 @@
 from typing import Dict, Optional, List
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Cheap precheck: any first-person pronoun as a standalone word. Matches a
+# superset of what resolve_pronouns accepts, so texts without a hit can skip it.
+_FIRST_PERSON_RE = re.compile(r"\b(?:i|me|my|mine|myself)\b", re.IGNORECASE)
+
 
 class EntityResolver:
     """Resolves references in text (pronouns, contextual references) to existing entity IDs"""
@@ -30,9 +35,9 @@ class EntityResolver:
             Dictionary mapping pronouns to entity IDs
             Example: {"i": "uuid-123", "me": "uuid-123", "my": "uuid-123"}
         """
-        logger.info(f"\n🔍 [DEBUG] resolve_pronouns() called")
-        logger.info(f"🔍 [DEBUG] user_entity_id: {user_entity_id}")
-        logger.info(f"🔍 [DEBUG] text preview: {text[:100]}...")
+        logger.debug("\n🔍 [DEBUG] resolve_pronouns() called")
+        logger.debug("🔍 [DEBUG] user_entity_id: %s", user_entity_id)
+        logger.debug("🔍 [DEBUG] text preview: %s...", text[:100])
 
         resolutions = {}
 
@@ -40,20 +45,25 @@ class EntityResolver:
             logger.warning("⚠️  [DEBUG] No user_entity_id provided, skipping pronoun resolution")
             return resolutions
 
+        if not _FIRST_PERSON_RE.search(text):
+            logger.info("No first-person pronouns in text, skipping pronoun resolution")
+            return resolutions
+
         text_lower = text.lower()
+        padded_text = f' {text_lower} '
 
         # Check if any first-person pronouns appear in text
         for pronoun in self.first_person_pronouns:
             # Use word boundary checking to avoid partial matches
             # e.g., don't match "i" in "India"
-            if f' {pronoun} ' in f' {text_lower} ' or text_lower.startswith(f'{pronoun} '):
+            if f' {pronoun} ' in padded_text or text_lower.startswith(f'{pronoun} '):
                 resolutions[pronoun] = user_entity_id
-                logger.info(f"✅ [DEBUG] Resolved '{pronoun}' to user entity {user_entity_id[:8]}...")
+                logger.debug("✅ [DEBUG] Resolved '%s' to user entity %s", pronoun, user_entity_id)
 
         if resolutions:
-            logger.info(f"✅ [DEBUG] Resolved {len(resolutions)} pronoun references: {list(resolutions.keys())}")
+            logger.debug("✅ [DEBUG] Resolved %d pronoun references: %s", len(resolutions), list(resolutions.keys()))
         else:
-            logger.warning(f"⚠️  [DEBUG] No pronouns found in text")
+            logger.debug("⚠️  [DEBUG] No pronouns found in text")
 
         return resolutions
 
@@ -3,19 +3,29 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from agents.archivist import Archivist
 from datetime import datetime
+from types import SimpleNamespace
 import json
 
 
+class MockPayload:
+    """Mock RawEventPayload for testing"""
+    def __init__(self, content, user_entity_id=None):
+        self.type = 'text'
+        self.content = content
+        self.metadata = {}
+        self.user_id = None
+        self.user_entity_id = user_entity_id
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
 class MockRawEvent:
     """Mock RawEvent for testing"""
     def __init__(self, event_id, content, source="quick_capture"):
         self.id = event_id
         self.source = source
-        self.payload = {
-            'type': 'text',
-            'content': content,
-            'metadata': {}
-        }
+        self.payload = MockPayload(content)
         self.status = 'pending_processing'
         self.created_at = datetime.now()
 
@@ -44,16 +54,32 @@ def mock_db():
     db.create_entity = Mock(return_value='entity-1')
     db.create_hub_entity = Mock(return_value='hub-entity-1')
     db.create_spoke_entity = Mock(return_value='spoke-entity-1')
+    db.bulk_create_entities = Mock(side_effect=lambda payloads, is_hub: [
+        db.create_hub_entity(payload) if hub else db.create_entity(payload)
+        for payload, hub in zip(payloads, is_hub)
+    ])
     db.create_edge = Mock(return_value='edge-1')
     db.create_chunk = Mock(return_value='chunk-1')
+    db.create_chunks_bulk = Mock(side_effect=lambda payloads: [f'chunk-{i}' for i in range(len(payloads))])
     db.create_embedding = Mock()
+    db.create_embeddings_bulk = Mock()
     db.create_signal = Mock()
+    db.create_signals_bulk = Mock()
+    db.upsert_changed_signals = Mock(side_effect=lambda payloads: len(payloads))
     db.update_event_status = Mock()
+    db.bulk_update_event_statuses = Mock()
     db.get_entity_by_id = Mock()
+    db.get_entity_by_title = Mock(return_value=None)
+    db.get_entities_by_titles = Mock(return_value={})
+    db.get_recent_entities = Mock(return_value=[])
     db.get_entity_metadata = Mock(return_value={})
     db.update_entity_metadata = Mock()
+    db.bulk_update_entity_metadata = Mock()
     db.get_edge_count_for_entity = Mock(return_value=0)
+    db.get_entities_by_ids = Mock(return_value={})
+    db.get_edge_counts_for_entities = Mock(side_effect=lambda ids: {entity_id: 0 for entity_id in ids})
     db.get_pending_events = Mock(return_value=[])
+    db.iter_pending_events = Mock(side_effect=lambda limit=10, page_size=10: iter(db.get_pending_events(limit=limit)))
 
     return db
 
@@ -67,6 +93,25 @@ def archivist(mock_db):
         return archivist
 
 
+@pytest.fixture
+def mock_pipeline(archivist):
+    """Mock the extractor, embeddings service and alias detection process_event calls
+
+    Extraction returns no entities and every chunk gets a dummy embedding;
+    tests set extractor.extract_entities to the entities they need.
+    """
+    extractor = Mock()
+    extractor.extract_entities.return_value = []
+    archivist.entity_extractor = extractor
+
+    embeddings = Mock()
+    embeddings.generate_embeddings_batch.side_effect = lambda texts: [[0.1] * 1536 for _ in texts]
+    archivist.embeddings_service = embeddings
+
+    archivist.relationship_mapper.detect_alias_and_update = Mock(return_value=[])
+    return SimpleNamespace(extractor=extractor, embeddings=embeddings)
+
+
 def test_archivist_initialization():
     """Test Archivist initializes all components"""
     archivist = Archivist()
@@ -81,9 +126,7 @@ def test_archivist_initialization():
     assert archivist.signal_scorer is not None
 
 
-@patch('agents.archivist.EntityExtractor')
-@patch('agents.archivist.EmbeddingsService')
-def test_process_event_basic_flow(mock_embeddings_cls, mock_extractor_cls, archivist, mock_db):
+def test_process_event_basic_flow(archivist, mock_db, mock_pipeline):
     """Test basic event processing flow"""
     # Setup mocks
     event = MockRawEvent(
@@ -93,8 +136,7 @@ def test_process_event_basic_flow(mock_embeddings_cls, mock_extractor_cls, archi
     mock_db.get_event_by_id.return_value = event
 
     # Mock entity extraction
-    mock_extractor = Mock()
-    mock_extractor.extract_entities.return_value = [
+    mock_pipeline.extractor.extract_entities.return_value = [
         {
             'title': 'Feed',
             'type': 'feature',
@@ -110,16 +152,9 @@ def test_process_event_basic_flow(mock_embeddings_cls, mock_extractor_cls, archi
             'metadata': {}
         }
     ]
-    archivist.entity_extractor = mock_extractor
-
-    # Mock embeddings
-    mock_embeddings = Mock()
-    mock_embeddings.generate_embeddings_batch.return_value = [[0.1] * 1536]
-    archivist.embeddings_service = mock_embeddings
 
     # Mock relationship mapper
     archivist.relationship_mapper.detect_relationships = Mock(return_value=[])
-    archivist.relationship_mapper.detect_alias_and_update = Mock(return_value=[])
 
     # Mock entity fetch for signal scoring
     mock_db.get_entity_by_id.return_value = MockEntity('entity-1', 'feature', 'Feed')
@@ -137,10 +172,210 @@ def test_process_event_basic_flow(mock_embeddings_cls, mock_extractor_cls, archi
     mock_db.get_event_by_id.assert_called_once_with('event-1')
     mock_db.update_event_status.assert_called_with('event-1', 'processed')
 
+    # Chunks and embeddings are written with one insert each
+    mock_db.create_chunks_bulk.assert_called_once()
+    chunk_rows = mock_db.create_chunks_bulk.call_args[0][0]
+    assert all(set(row) == {'entity_id', 'text', 'token_count', 'hash'} for row in chunk_rows)
+    mock_db.create_embeddings_bulk.assert_called_once()
+    mock_db.create_chunk.assert_not_called()
+
+
+def test_failed_embedding_insert_removes_chunks(archivist, mock_db, mock_pipeline):
+    """Test that chunks are deleted again when their embeddings can't be stored"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-1', 'Sarah joined Willow Education.')
+    mock_db.create_embeddings_bulk.side_effect = Exception("insert failed")
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': False, 'metadata': {}}
+    ]
+
+    result = archivist.process_event('event-1')
+
+    # Chunk storage failures don't fail the event
+    assert result['status'] == 'success'
+    mock_db.delete_chunks.assert_called_once_with(['chunk-0'])
+
+
+def test_signal_assignment_uses_bulk_queries(archivist, mock_db, mock_pipeline):
+    """Test that signals are scored from one entity fetch and written in one upsert"""
+    event = MockRawEvent('event-1', 'Sarah joined Willow Education.')
+    mock_db.get_event_by_id.return_value = event
+    mock_db.create_entity.side_effect = ['entity-1', 'entity-2']
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': False, 'metadata': {}},
+        {'title': 'Willow Education', 'type': 'organization', 'summary': '', 'is_primary_subject': False, 'metadata': {}}
+    ]
+
+    mock_db.get_entities_by_ids.return_value = {
+        'entity-1': MockEntity('entity-1', 'person', 'Sarah'),
+        'entity-2': MockEntity('entity-2', 'organization', 'Willow Education')
+    }
+
+    result = archivist.process_event('event-1')
+    archivist.wait_for_signals()
+
+    assert result['status'] == 'success'
+    mock_db.get_entities_by_ids.assert_called_once_with(['entity-1', 'entity-2'])
+    mock_db.get_edge_counts_for_entities.assert_called_once()
+    mock_db.get_edge_count_for_entity.assert_not_called()
+
+    signal_payloads = mock_db.upsert_changed_signals.call_args[0][0]
+    assert [p['entity_id'] for p in signal_payloads] == ['entity-1', 'entity-2']
+    mock_db.create_signal.assert_not_called()
+
+
+def test_signal_assignment_is_queued_off_the_critical_path(archivist, mock_db, mock_pipeline):
+    """Test that process_event hands entities to the signal queue instead of scoring inline"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-1', 'Sarah joined Willow Education.')
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': False, 'metadata': {}}
+    ]
+
+    archivist._enqueue_signals = Mock()
+
+    result = archivist.process_event('event-1')
+
+    assert result['status'] == 'success'
+    archivist._enqueue_signals.assert_called_once_with(['entity-1'])
+    mock_db.upsert_changed_signals.assert_not_called()
+    mock_db.update_event_status.assert_called_with('event-1', 'processed')
+
 
-@patch('agents.archivist.EntityExtractor')
-@patch('agents.archivist.EmbeddingsService')
-def test_process_event_with_hub_and_spoke(mock_embeddings_cls, mock_extractor_cls, archivist, mock_db):
+def test_signals_are_rounded_before_the_conditional_upsert(archivist, mock_db):
+    """Test that scores are rounded so an unchanged entity matches its stored row"""
+    mock_db.get_entities_by_ids.return_value = {
+        'entity-1': MockEntity('entity-1', 'person', 'Sarah')
+    }
+    archivist.signal_scorer.calculate_all_signals_batch = Mock(side_effect=[
+        [{'importance': 0.61234, 'recency': 0.99991, 'novelty': 0.70049}],
+        [{'importance': 0.61238, 'recency': 0.99989, 'novelty': 0.70001}],
+    ])
+
+    archivist.compute_and_store_signals(['entity-1'])
+    archivist.compute_and_store_signals(['entity-1'])
+
+    first_payloads = mock_db.upsert_changed_signals.call_args_list[0][0][0]
+    second_payloads = mock_db.upsert_changed_signals.call_args_list[1][0][0]
+    assert first_payloads == [{
+        'entity_id': 'entity-1',
+        'importance': 0.612,
+        'recency': 1.0,
+        'novelty': 0.7,
+        'last_surfaced_at': None
+    }]
+    # Sub-precision drift produces an identical row for the database to skip
+    assert second_payloads == first_payloads
+    mock_db.create_signals_bulk.assert_not_called()
+
+
+def test_existing_entities_use_prefetched_rows(archivist, mock_db, mock_pipeline):
+    """Test that reference tracking for existing entities reuses the batch lookup"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-2', 'Caught up with Sarah again.')
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': True, 'metadata': {}}
+    ]
+
+    sarah = MockEntity('entity-9', 'person', 'Sarah', {'referenced_by_event_ids': ['event-1'], 'mention_count': 1})
+    mock_db.get_entities_by_titles.return_value = {('Sarah', 'person'): sarah}
+
+    result = archivist.process_event('event-2')
+
+    assert result['status'] == 'success'
+    mock_db.get_entity_by_id.assert_not_called()
+    mock_db.create_entity.assert_not_called()
+    mock_db.bulk_update_entity_metadata.assert_any_call({'entity-9': {
+        'referenced_by_event_ids': ['event-1', 'event-2'],
+        'mention_count': 2
+    }})
+    mock_db.update_entity_metadata.assert_not_called()
+
+
+def test_new_entities_created_in_one_insert(archivist, mock_db, mock_pipeline):
+    """Test that all entities promoted by an event are created with one bulk insert"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-1', 'Sarah joined Willow Education.')
+    mock_db.bulk_create_entities = Mock(return_value=['entity-1', 'entity-2'])
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': True, 'metadata': {}},
+        {'title': 'Willow Education', 'type': 'organization', 'summary': '', 'is_primary_subject': True, 'metadata': {}}
+    ]
+
+    result = archivist.process_event('event-1')
+
+    assert result['status'] == 'success'
+    mock_db.bulk_create_entities.assert_called_once()
+    payloads = mock_db.bulk_create_entities.call_args[0][0]
+    assert [p['title'] for p in payloads] == ['Sarah', 'Willow Education']
+    mock_db.create_entity.assert_not_called()
+
+    # Chunks are linked to the first entity in extraction order
+    chunk_rows = mock_db.create_chunks_bulk.call_args[0][0]
+    assert all(row['entity_id'] == 'entity-1' for row in chunk_rows)
+
+
+def test_entity_created_in_event_is_not_refetched(archivist, mock_db, mock_pipeline):
+    """Test that a title promoted earlier in the same event reuses the created row"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-1', 'Willow launched the Willow app.')
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Willow', 'type': 'organization', 'summary': '', 'is_primary_subject': True, 'metadata': {}},
+        {'title': 'Willow', 'type': 'product', 'summary': '', 'is_primary_subject': True, 'metadata': {}}
+    ]
+
+    result = archivist.process_event('event-1')
+
+    assert result['status'] == 'success'
+    mock_db.create_entity.assert_called_once()
+    mock_db.get_entity_by_id.assert_not_called()
+    created = mock_db.create_entity.call_args[0][0]
+    assert created['metadata']['mention_count'] == 2
+    assert result['entities_created'] == 2
+
+
+def test_duplicate_extractions_processed_once(archivist, mock_db, mock_pipeline):
+    """Test that repeated extractions of one entity create it once and count every mention"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-1', 'Sarah said hi. Later sarah left.')
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': False, 'metadata': {}},
+        {'title': ' sarah', 'type': 'person', 'summary': '', 'is_primary_subject': False, 'metadata': {}}
+    ]
+
+    result = archivist.process_event('event-1')
+
+    assert result['status'] == 'success'
+    assert result['entities_created'] == 1
+    mock_db.create_entity.assert_called_once()
+    assert mock_db.create_entity.call_args[0][0]['metadata']['mention_count'] == 2
+    assert archivist.mention_tracker.get_mention_count('Sarah') == 2
+
+
+def test_duplicate_extractions_of_existing_entity_count_every_mention(archivist, mock_db, mock_pipeline):
+    """Test that an existing entity extracted twice in one event gains two mentions"""
+    mock_db.get_event_by_id.return_value = MockRawEvent('event-2', 'Sarah called. Then sarah emailed.')
+
+    mock_pipeline.extractor.extract_entities.return_value = [
+        {'title': 'Sarah', 'type': 'person', 'summary': '', 'is_primary_subject': True, 'metadata': {}},
+        {'title': 'sarah', 'type': 'person', 'summary': '', 'is_primary_subject': True, 'metadata': {}}
+    ]
+
+    sarah = MockEntity('entity-9', 'person', 'Sarah', {'referenced_by_event_ids': ['event-1'], 'mention_count': 3})
+    mock_db.get_entities_by_titles.return_value = {('Sarah', 'person'): sarah}
+
+    result = archivist.process_event('event-2')
+
+    assert result['status'] == 'success'
+    mock_db.create_entity.assert_not_called()
+    mock_db.bulk_update_entity_metadata.assert_any_call({'entity-9': {
+        'referenced_by_event_ids': ['event-1', 'event-2'],
+        'mention_count': 5
+    }})
+
+
+def test_process_event_with_hub_and_spoke(archivist, mock_db, mock_pipeline):
     """Test hub-and-spoke entity creation"""
     # Setup event
     event = MockRawEvent(
@@ -151,8 +386,7 @@ def test_process_event_with_hub_and_spoke(mock_embeddings_cls, mock_extractor_cl
     mock_db.get_event_by_id.return_value = event
 
     # Mock entity extraction - feature is primary subject
-    mock_extractor = Mock()
-    mock_extractor.extract_entities.return_value = [
+    mock_pipeline.extractor.extract_entities.return_value = [
         {
             'title': 'Feed',
             'type': 'feature',
@@ -161,16 +395,9 @@ def test_process_event_with_hub_and_spoke(mock_embeddings_cls, mock_extractor_cl
             'metadata': {}
         }
     ]
-    archivist.entity_extractor = mock_extractor
-
-    # Mock embeddings
-    mock_embeddings = Mock()
-    mock_embeddings.generate_embeddings_batch.return_value = [[0.1] * 1536]
-    archivist.embeddings_service = mock_embeddings
 
     # Mock relationship mapper
     archivist.relationship_mapper.detect_relationships = Mock(return_value=[])
-    archivist.relationship_mapper.detect_alias_and_update = Mock(return_value=[])
 
     # Mock entity fetch
     mock_db.get_entity_by_id.return_value = MockEntity('hub-entity-1', 'feature', 'Feed')
@@ -188,13 +415,10 @@ def test_process_event_with_hub_and_spoke(mock_embeddings_cls, mock_extractor_cl
     mock_db.create_spoke_entity.assert_called_once()
 
 
-@patch('agents.archivist.EntityExtractor')
-@patch('agents.archivist.EmbeddingsService')
-def test_mention_tracking_promotion(mock_embeddings_cls, mock_extractor_cls, archivist, mock_db):
+def test_mention_tracking_promotion(archivist, mock_db, mock_pipeline):
     """Test that entities are promoted after multiple mentions"""
     # Mock entity extraction
-    mock_extractor = Mock()
-    mock_extractor.extract_entities.return_value = [
+    mock_pipeline.extractor.extract_entities.return_value = [
         {
             'title': 'Sarah',
             'type': 'person',
@@ -203,16 +427,9 @@ def test_mention_tracking_promotion(mock_embeddings_cls, mock_extractor_cls, arc
             'metadata': {}
         }
     ]
-    archivist.entity_extractor = mock_extractor
-
-    # Mock embeddings
-    mock_embeddings = Mock()
-    mock_embeddings.generate_embeddings_batch.return_value = [[0.1] * 1536]
-    archivist.embeddings_service = mock_embeddings
 
     # Mock relationship mapper
     archivist.relationship_mapper.detect_relationships = Mock(return_value=[])
-    archivist.relationship_mapper.detect_alias_and_update = Mock(return_value=[])
 
     # Mock entity fetch
     mock_db.get_entity_by_id.return_value = MockEntity('entity-1', 'person', 'Sarah')
@@ -228,9 +445,7 @@ def test_mention_tracking_promotion(mock_embeddings_cls, mock_extractor_cls, arc
     assert mock_db.create_entity.call_count >= 1
 
 
-@patch('agents.archivist.EntityExtractor')
-@patch('agents.archivist.EmbeddingsService')
-def test_alias_detection(mock_embeddings_cls, mock_extractor_cls, archivist, mock_db):
+def test_alias_detection(archivist, mock_db, mock_pipeline):
     """Test alias detection and metadata update"""
     # Setup event with rename pattern
     event = MockRawEvent(
@@ -240,8 +455,7 @@ def test_alias_detection(mock_embeddings_cls, mock_extractor_cls, archivist, moc
     mock_db.get_event_by_id.return_value = event
 
     # Mock entity extraction
-    mock_extractor = Mock()
-    mock_extractor.extract_entities.return_value = [
+    mock_pipeline.extractor.extract_entities.return_value = [
         {
             'title': 'feed',
             'type': 'feature',
@@ -250,12 +464,6 @@ def test_alias_detection(mock_embeddings_cls, mock_extractor_cls, archivist, moc
             'metadata': {}
         }
     ]
-    archivist.entity_extractor = mock_extractor
-
-    # Mock embeddings
-    mock_embeddings = Mock()
-    mock_embeddings.generate_embeddings_batch.return_value = [[0.1] * 1536]
-    archivist.embeddings_service = mock_embeddings
 
     # Mock relationship mapper
     archivist.relationship_mapper.detect_relationships = Mock(return_value=[])
@@ -291,9 +499,7 @@ def test_process_pending_events_empty(archivist, mock_db):
     assert result['events_failed'] == 0
 
 
-@patch('agents.archivist.EntityExtractor')
-@patch('agents.archivist.EmbeddingsService')
-def test_process_pending_events_batch(mock_embeddings_cls, mock_extractor_cls, archivist, mock_db):
+def test_process_pending_events_batch(archivist, mock_db, mock_pipeline):
     """Test batch processing multiple events"""
     # Setup pending events
     events = [
@@ -302,19 +508,8 @@ def test_process_pending_events_batch(mock_embeddings_cls, mock_extractor_cls, a
     ]
     mock_db.get_pending_events.return_value = events
 
-    # Mock entity extraction
-    mock_extractor = Mock()
-    mock_extractor.extract_entities.return_value = []
-    archivist.entity_extractor = mock_extractor
-
-    # Mock embeddings
-    mock_embeddings = Mock()
-    mock_embeddings.generate_embeddings_batch.return_value = [[0.1] * 1536]
-    archivist.embeddings_service = mock_embeddings
-
     # Mock relationship mapper
     archivist.relationship_mapper.detect_relationships = Mock(return_value=[])
-    archivist.relationship_mapper.detect_alias_and_update = Mock(return_value=[])
 
     # Mock get_event_by_id to return different events
     def get_event_side_effect(event_id):
@@ -334,6 +529,97 @@ def test_process_pending_events_batch(mock_embeddings_cls, mock_extractor_cls, a
     assert result['events_succeeded'] == 2
     assert result['events_failed'] == 0
 
+    # Terminal statuses are written together at the end of the batch
+    mock_db.bulk_update_event_statuses.assert_called_once_with({
+        'event-1': 'processed',
+        'event-2': 'processed'
+    })
+    mock_db.update_event_status.assert_not_called()
+
+    # Pending events are processed from the rows already fetched
+    mock_db.get_event_by_id.assert_not_called()
+
+
+def test_process_pending_events_single_embedding_call(archivist, mock_db, mock_pipeline):
+    """Test that chunks from every event in a batch are embedded in one call"""
+    events = [
+        MockRawEvent('event-1', 'Event 1 content'),
+        MockRawEvent('event-2', 'Event 2 content')
+    ]
+    mock_db.get_pending_events.return_value = events
+    mock_db.get_event_by_id.side_effect = lambda event_id: next(e for e in events if e.id == event_id)
+
+    result = archivist.process_pending_events(batch_size=10)
+
+    assert result['events_succeeded'] == 2
+    mock_pipeline.embeddings.generate_embeddings_batch.assert_called_once_with(['Event 1 content', 'Event 2 content'])
+
+
+def test_process_pending_events_runs_relationship_engine_once(archivist, mock_db, mock_pipeline):
+    """Test that a batch runs relationship detection once for all events"""
+    events = [
+        MockRawEvent('event-1', 'Sarah joined Willow Education.'),
+        MockRawEvent('event-2', 'Marcus met Sarah.')
+    ]
+    mock_db.get_pending_events.return_value = events
+
+    mock_pipeline.extractor.extract_entities.side_effect = lambda text: [
+        {'title': text.split()[0], 'type': 'person', 'summary': '', 'is_primary_subject': True, 'metadata': {}}
+    ]
+
+    mock_engine = Mock()
+    mock_engine.run_incremental_batch.return_value = {'edges_created': 0, 'edges_updated': 0}
+    archivist._get_relationship_engine = Mock(return_value=mock_engine)
+
+    result = archivist.process_pending_events(batch_size=10)
+
+    assert result['events_succeeded'] == 2
+    mock_engine.run_incremental.assert_not_called()
+    mock_engine.run_incremental_batch.assert_called_once_with(['event-1', 'event-2'], {
+        'event-1': 'Sarah joined Willow Education.',
+        'event-2': 'Marcus met Sarah.'
+    })
+    mock_db.get_event_by_id.assert_not_called()
+
+
+def test_generate_embeddings_sorts_by_length_and_restores_order(archivist):
+    """Test that chunks are embedded shortest first but returned in original order"""
+    mock_embeddings = Mock()
+    mock_embeddings.generate_embeddings_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    archivist.embeddings_service = mock_embeddings
+
+    chunk_lists = [
+        [{'text': 'a long chunk of text', 'token_count': 5}, {'text': 'short', 'token_count': 1}],
+        [{'text': 'mid chunk', 'token_count': 2}]
+    ]
+
+    result = archivist._generate_embeddings(chunk_lists)
+
+    mock_embeddings.generate_embeddings_batch.assert_called_once_with(
+        ['short', 'mid chunk', 'a long chunk of text']
+    )
+    assert result == [[[20.0], [5.0]], [[9.0]]]
+
+
+def test_generate_embeddings_splits_token_buckets(archivist):
+    """Test that chunks from different token-length buckets are embedded separately"""
+    mock_embeddings = Mock()
+    mock_embeddings.generate_embeddings_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    archivist.embeddings_service = mock_embeddings
+
+    chunk_lists = [[
+        {'text': 'long', 'token_count': 300},
+        {'text': 'tiny', 'token_count': 10},
+        {'text': 'small', 'token_count': 40}
+    ]]
+
+    result = archivist._generate_embeddings(chunk_lists)
+
+    assert [c.args[0] for c in mock_embeddings.generate_embeddings_batch.call_args_list] == [
+        ['tiny', 'small'], ['long']
+    ]
+    assert result == [[[4.0], [4.0], [5.0]]]
+
 
 def test_run_continuous_with_max_iterations(archivist, mock_db):
     """Test continuous mode with max iterations"""
@@ -346,18 +632,14 @@ def test_run_continuous_with_max_iterations(archivist, mock_db):
     assert mock_db.get_pending_events.call_count == 2
 
 
-@patch('agents.archivist.EntityExtractor')
-@patch('agents.archivist.EmbeddingsService')
-def test_process_event_error_handling(mock_embeddings_cls, mock_extractor_cls, archivist, mock_db):
+def test_process_event_error_handling(archivist, mock_db, mock_pipeline):
     """Test error handling in event processing"""
     # Setup event
     event = MockRawEvent('event-1', 'Test content')
     mock_db.get_event_by_id.return_value = event
 
     # Make entity extraction raise an error
-    mock_extractor = Mock()
-    mock_extractor.extract_entities.side_effect = Exception("Extraction failed")
-    archivist.entity_extractor = mock_extractor
+    mock_pipeline.extractor.extract_entities.side_effect = Exception("Extraction failed")
 
     # Process event
     result = archivist.process_event('event-1')
@@ -371,5 +653,27 @@ def test_process_event_error_handling(mock_embeddings_cls, mock_extractor_cls, a
     mock_db.update_event_status.assert_called_with('event-1', 'error')
 
 
+def test_run_continuous_drains_full_batches_without_waiting(archivist):
+    """Test continuous mode re-polls immediately after a full batch and waits otherwise"""
+    archivist.process_pending_events = Mock(side_effect=[
+        {'events_processed': 2},
+        {'events_processed': 0},
+    ])
+    archivist._pending_event = Mock()
+
+    archivist.run_continuous(interval_seconds=30, max_iterations=2, batch_size=2)
+
+    assert archivist.process_pending_events.call_count == 2
+    # Only the second (partial) batch waits for a notification or timeout
+    archivist._pending_event.wait.assert_called_once_with(30)
+
+
+def test_notify_pending_wakes_continuous_mode(archivist):
+    """Test notify_pending sets the wake event used by run_continuous"""
+    archivist.notify_pending()
+
+    assert archivist._pending_event.is_set()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,223 @@
+"""Tests for DatabaseService RPC paths and their fallbacks"""
+import httpx
+import pytest
+from unittest.mock import Mock, patch
+from postgrest.exceptions import APIError
+from services.database import DatabaseService
+
+
+SIGNAL_ROWS = [
+    {'entity_id': 'entity-1', 'importance': 0.612, 'recency': 1.0, 'novelty': 0.7, 'last_surfaced_at': None},
+    {'entity_id': 'entity-2', 'importance': 0.5, 'recency': 0.25, 'novelty': 0.1, 'last_surfaced_at': None},
+]
+
+
+def missing_function_error(name):
+    """APIError PostgREST raises when an RPC's migration hasn't been applied"""
+    return APIError({
+        'code': 'PGRST202',
+        'message': f'Could not find the function public.{name} in the schema cache',
+        'details': None,
+        'hint': None,
+    })
+
+
+@pytest.fixture
+def client():
+    return Mock()
+
+
+@pytest.fixture
+def db(client):
+    with patch('services.database.get_supabase_client', return_value=client):
+        return DatabaseService()
+
+
+def test_upsert_changed_signals_uses_rpc(db, client):
+    """Test that the conditional upsert runs server-side and reports rows written"""
+    client.rpc.return_value.execute.return_value = Mock(data=1)
+
+    assert db.upsert_changed_signals(SIGNAL_ROWS) == 1
+
+    client.rpc.assert_called_once_with('upsert_changed_signals', {'signals': SIGNAL_ROWS})
+    client.table.assert_not_called()
+
+
+def test_upsert_changed_signals_falls_back_when_function_missing(db, client):
+    """Test that a missing RPC falls back to upserting every row, once"""
+    client.rpc.return_value.execute.side_effect = missing_function_error('upsert_changed_signals')
+
+    assert db.upsert_changed_signals(SIGNAL_ROWS) == 2
+    assert db.upsert_changed_signals(SIGNAL_ROWS) == 2
+
+    client.rpc.assert_called_once()
+    client.table.assert_called_with('signal')
+    client.table.return_value.upsert.assert_called_with(SIGNAL_ROWS, on_conflict='entity_id')
+    assert client.table.return_value.upsert.call_count == 2
+
+
+def test_upsert_changed_signals_skips_empty_batches(db, client):
+    """Test that nothing is sent when there are no signals"""
+    assert db.upsert_changed_signals([]) == 0
+    client.rpc.assert_not_called()
+    client.table.assert_not_called()
+
+
+def test_apply_insight_feedback_uses_rpc(db, client):
+    """Test that feedback writes go through the single-transaction RPC"""
+    db.apply_insight_feedback('insight-1', 'dismissed', SIGNAL_ROWS, {'pattern_hash': 'abc'})
+
+    client.rpc.assert_called_once_with('apply_insight_feedback', {
+        'insight_id': 'insight-1',
+        'new_status': 'dismissed',
+        'signals': SIGNAL_ROWS,
+        'pattern': {'pattern_hash': 'abc'},
+    })
+    client.table.assert_not_called()
+
+
+def test_apply_insight_feedback_transient_error_keeps_rpc(db, client):
+    """Test that a network failure is raised and doesn't switch to separate writes"""
+    client.rpc.return_value.execute.side_effect = [httpx.ReadTimeout('timed out'), Mock(data=None)]
+
+    with pytest.raises(httpx.ReadTimeout):
+        db.apply_insight_feedback('insight-1', 'acknowledged', SIGNAL_ROWS)
+    db.apply_insight_feedback('insight-1', 'acknowledged', SIGNAL_ROWS)
+
+    assert client.rpc.call_count == 2
+    client.table.assert_not_called()
+
+
+def test_apply_insight_feedback_constraint_violation_is_raised(db, client):
+    """Test that database errors other than a missing function propagate"""
+    client.rpc.return_value.execute.side_effect = APIError({
+        'code': '23503', 'message': 'violates foreign key constraint', 'details': None, 'hint': None
+    })
+
+    with pytest.raises(APIError):
+        db.apply_insight_feedback('insight-1', 'acknowledged', SIGNAL_ROWS)
+
+    assert db._insight_feedback_rpc_available
+    client.table.assert_not_called()
+
+
+def test_apply_insight_feedback_falls_back_when_function_missing(db, client):
+    """Test that a missing RPC switches to separate signal and status writes"""
+    client.rpc.return_value.execute.side_effect = missing_function_error('apply_insight_feedback')
+
+    db.apply_insight_feedback('insight-1', 'acknowledged', SIGNAL_ROWS)
+
+    assert not db._insight_feedback_rpc_available
+    client.table.return_value.upsert.assert_called_once_with(SIGNAL_ROWS, on_conflict='entity_id')
+    client.table.return_value.update.assert_called_once_with({'status': 'acknowledged'})
+
+
+def test_get_edge_counts_transient_error_is_raised(db, client):
+    """Test that the edge count RPC only falls back when the function is missing"""
+    client.rpc.return_value.execute.side_effect = httpx.ConnectError('connection refused')
+
+    with pytest.raises(httpx.ConnectError):
+        db.get_edge_counts_for_entities(['entity-1'])
+
+    assert db._edge_counts_rpc_available
+
+
+DISMISSED_PATTERN = {
+    'insight_type': 'Delta Watch',
+    'driver_entity_types': ['feature'],
+    'pattern_signature': {'insight_type': 'Delta Watch', 'dismissed_at': '2026-10-16T09:00:00'},
+    'pattern_hash': 'abc123',
+}
+
+
+def test_record_dismissed_pattern_increments_existing_row(db, client):
+    """Test that dismissing an equivalent insight again bumps dismissed_count"""
+    table = client.table.return_value
+    table.select.return_value.eq.return_value.limit.return_value.execute.return_value = Mock(
+        data=[{'id': 'pattern-1', 'dismissed_count': 2}]
+    )
+
+    db.record_dismissed_pattern(DISMISSED_PATTERN)
+
+    table.update.assert_called_once_with({
+        'pattern_signature': DISMISSED_PATTERN['pattern_signature'],
+        'last_dismissed_at': '2026-10-16T09:00:00',
+        'dismissed_count': 3,
+    })
+    table.update.return_value.eq.assert_called_once_with('id', 'pattern-1')
+    table.insert.assert_not_called()
+
+
+def test_record_dismissed_pattern_inserts_new_hash(db, client):
+    """Test that a first dismissal inserts a row carrying its hash"""
+    table = client.table.return_value
+    table.select.return_value.eq.return_value.limit.return_value.execute.return_value = Mock(data=[])
+
+    db.record_dismissed_pattern(DISMISSED_PATTERN)
+
+    inserted = table.insert.call_args[0][0]
+    assert inserted['pattern_hash'] == 'abc123'
+    assert inserted['last_dismissed_at'] == '2026-10-16T09:00:00'
+    table.update.assert_not_called()
+
+
+def test_record_dismissed_pattern_without_hash_column_inserts(db, client):
+    """Test that a missing pattern_hash column falls back to one row per dismissal"""
+    table = client.table.return_value
+    table.select.return_value.eq.return_value.limit.return_value.execute.side_effect = APIError({
+        'code': '42703', 'message': 'column dismissed_patterns.pattern_hash does not exist',
+        'details': None, 'hint': None
+    })
+
+    db.record_dismissed_pattern(DISMISSED_PATTERN)
+
+    assert not db._pattern_hash_available
+    inserted = table.insert.call_args[0][0]
+    assert 'pattern_hash' not in inserted
+
+
+def entity_row(entity_id, title, entity_type='concept'):
+    return {
+        'id': entity_id,
+        'source_event_id': 'event-1',
+        'type': entity_type,
+        'title': title,
+        'summary': '',
+        'created_at': '2026-10-01T00:00:00',
+        'updated_at': '2026-10-01T00:00:00',
+    }
+
+
+def title_query(client):
+    """The or() -> order -> limit chain both title lookups go through"""
+    return client.table.return_value.select.return_value.or_.return_value.order.return_value.limit.return_value
+
+
+def test_get_entities_by_titles_prefers_exact_matches(db, client):
+    """Test that exact title matches resolve without the partial-match query"""
+    title_query(client).execute.return_value = Mock(data=[
+        entity_row('entity-1', 'ai'),
+    ])
+
+    matches = db.get_entities_by_titles([('AI', 'concept')])
+
+    assert matches[('AI', 'concept')].id == 'entity-1'
+    client.table.return_value.select.return_value.or_.assert_called_once_with('title.ilike."AI"')
+    client.table.return_value.select.return_value.or_.return_value.order.assert_called_once_with('created_at')
+    client.table.return_value.select.return_value.or_.return_value.order.return_value.limit.assert_called_once_with(20)
+
+
+def test_get_entities_by_titles_partial_match_only_for_unresolved(db, client):
+    """Test that only unmatched titles fall back to an escaped partial match"""
+    title_query(client).execute.side_effect = [
+        Mock(data=[entity_row('entity-1', 'Water OS', 'project')]),
+        Mock(data=[entity_row('entity-2', 'The 100%_club', 'organization')]),
+    ]
+
+    matches = db.get_entities_by_titles([('Water OS', 'project'), ('100%_club', 'organization')])
+
+    assert matches[('Water OS', 'project')].id == 'entity-1'
+    assert matches[('100%_club', 'organization')].id == 'entity-2'
+    or_calls = client.table.return_value.select.return_value.or_.call_args_list
+    assert or_calls[0][0][0] == 'title.ilike."Water OS",title.ilike."100\\\\%\\\\_club"'
+    assert or_calls[1][0][0] == 'title.ilike."%100\\\\%\\\\_club%"'
@@ -0,0 +1,317 @@
+"""Tests for FeedbackProcessor"""
+import httpx
+import logging
+import pytest
+from unittest.mock import Mock
+from datetime import datetime, timezone
+from agents.feedback_processor import FeedbackProcessor
+from models.entity import Entity
+from models.insight import Insight
+from models.signal import Signal
+
+
+INSIGHT_ID = '33333333-3333-3333-3333-333333333333'
+
+ENTITY_IDS = [
+    '11111111-1111-1111-1111-111111111111',
+    '22222222-2222-2222-2222-222222222222'
+]
+
+
+def make_insight(entity_ids):
+    return Insight(
+        id=INSIGHT_ID,
+        title='Delta Watch: Feed launch',
+        body='The Feed launch is slipping',
+        drivers={'entity_ids': entity_ids},
+        status='open',
+        created_at=datetime(2025, 10, 1, tzinfo=timezone.utc)
+    )
+
+
+def make_entity(entity_id):
+    created = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    return Entity(
+        id=entity_id,
+        source_event_id='event-1',
+        type='project',
+        title='Feed',
+        summary='',
+        created_at=created,
+        updated_at=created
+    )
+
+
+@pytest.fixture
+def processor():
+    """Create FeedbackProcessor with a mocked database"""
+    processor = FeedbackProcessor()
+    processor.db = Mock()
+    processor.db.get_signals_by_entity_ids.side_effect = lambda ids: {
+        entity_id: Signal(entity_id=entity_id, importance=0.5, recency=0.3, novelty=0.5)
+        for entity_id in ids
+    }
+    processor.db.get_entities_by_ids.side_effect = lambda ids: {
+        entity_id: make_entity(entity_id) for entity_id in ids
+    }
+    return processor
+
+
+def test_acknowledge_batches_signal_reads_and_writes(processor):
+    """Test that acknowledge reads and writes all driver signals in one call each without reading entities"""
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    result = processor.process_acknowledge(INSIGHT_ID)
+
+    assert result['status'] == 'success'
+    assert result['entities_updated'] == 2
+    processor.db.get_signals_by_entity_ids.assert_called_once_with(ENTITY_IDS)
+    processor.db.get_entities_by_ids.assert_not_called()
+    processor.db.get_signal_by_entity_id.assert_not_called()
+    processor.db.update_signal.assert_not_called()
+
+    rows = processor.db.apply_insight_feedback.call_args[0][2]
+    assert [row['entity_id'] for row in rows] == ENTITY_IDS
+    assert all(row['importance'] == pytest.approx(0.6) for row in rows)
+    assert all(row['recency'] == pytest.approx(1.0) for row in rows)
+
+
+def test_dismiss_lowers_importance_without_fetching_entities_for_recency(processor):
+    """Test that dismiss lowers importance and keeps recency unchanged"""
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    result = processor.process_dismiss(INSIGHT_ID)
+
+    assert result['status'] == 'success'
+    rows = processor.db.apply_insight_feedback.call_args[0][2]
+    assert all(row['importance'] == pytest.approx(0.4) for row in rows)
+    assert all(row['recency'] == pytest.approx(0.3) for row in rows)
+
+
+def test_missing_signal_reported_per_entity(processor):
+    """Test that an entity without a signal is reported and the rest still update"""
+    processor.db.get_signals_by_entity_ids.side_effect = lambda ids: {
+        ENTITY_IDS[0]: Signal(entity_id=ENTITY_IDS[0], importance=0.95, recency=0.5, novelty=0.5)
+    }
+
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    result = processor.process_acknowledge(INSIGHT_ID)
+
+    assert result['entities_updated'] == 1
+    assert result['signal_changes'][0]['importance']['new'] == pytest.approx(1.0)
+    rows = processor.db.apply_insight_feedback.call_args[0][2]
+    assert [row['entity_id'] for row in rows] == [ENTITY_IDS[0]]
+    processor.db.create_signals_bulk.assert_not_called()
+
+
+def test_title_drivers_resolved_with_one_query(processor):
+    """Test that title-like driver ids are resolved together and UUIDs pass through"""
+    processor.db.get_entities_by_titles.return_value = {
+        ('Feed', None): make_entity(ENTITY_IDS[1])
+    }
+
+    resolved = processor._resolve_entity_ids_bulk([ENTITY_IDS[0], 'Feed', 'Unknown'])
+
+    assert resolved == {ENTITY_IDS[0]: ENTITY_IDS[0], 'Feed': ENTITY_IDS[1], 'Unknown': None}
+    processor.db.get_entities_by_titles.assert_called_once_with([('Feed', None), ('Unknown', None)])
+    processor.db.get_entity_by_title.assert_not_called()
+
+
+def test_extract_keywords_matches_split_semantics(processor):
+    """Test keyword extraction splits on whitespace and ':,.' and stops at five"""
+    keywords = processor._extract_keywords(
+        "Delta Watch: Feed launch, hiring.plan slipping again... what would they think of roadmap"
+    )
+
+    assert keywords == ['delta', 'watch', 'feed', 'launch', 'hiring']
+
+
+@pytest.mark.parametrize('title,expected', [
+    ('Delta Watch: Feed launch', 'Delta Watch'),
+    ('Connection: Feed and Willow', 'Connection'),
+    ('Prompt: What is next for Feed?', 'Prompt'),
+    ('Weekly summary', 'Unknown')
+])
+def test_extract_pattern_identifies_insight_type(processor, title, expected):
+    """Test that the insight type is read from the title"""
+    insight = make_insight([])
+    insight.title = title
+
+    assert processor._extract_pattern(insight)['insight_type'] == expected
+
+
+def test_hyphenated_title_is_not_mistaken_for_uuid(processor):
+    """Test that a long hyphenated title is looked up by title rather than used as an id"""
+    title = 'Feed - Q4 launch plan - marketing site refresh'
+    processor.db.get_entities_by_titles.return_value = {
+        (title, None): make_entity(ENTITY_IDS[0])
+    }
+
+    resolved = processor._resolve_entity_ids_bulk([title])
+
+    assert resolved == {title: ENTITY_IDS[0]}
+    processor.db.get_entities_by_titles.assert_called_once_with([(title, None)])
+
+
+def test_only_dismiss_records_pattern(processor):
+    """Test that both actions share one path and only dismiss records a pattern"""
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    acknowledged = processor.process_acknowledge(INSIGHT_ID)
+    insight_id, status, _, pattern = processor.db.apply_insight_feedback.call_args[0]
+    assert (insight_id, status, pattern) == (INSIGHT_ID, 'acknowledged', None)
+    assert 'pattern_recorded' not in acknowledged
+
+    dismissed = processor.process_dismiss(INSIGHT_ID)
+    insight_id, status, _, pattern = processor.db.apply_insight_feedback.call_args[0]
+    assert (insight_id, status, pattern) == (INSIGHT_ID, 'dismissed', dismissed['pattern_recorded'])
+    assert dismissed['action'] == 'dismiss'
+
+    # Every write goes through the single combined call
+    assert processor.db.apply_insight_feedback.call_count == 2
+    processor.db.create_signals_bulk.assert_not_called()
+    processor.db.record_dismissed_pattern.assert_not_called()
+    processor.db.update_insight_status.assert_not_called()
+
+
+def test_entity_lookups_cached_across_requests(processor):
+    """Test that repeated dismissals reuse resolved titles and fetched entities"""
+    processor.db.get_insight_by_id.return_value = make_insight(['Feed', ENTITY_IDS[1]])
+    processor.db.get_entities_by_titles.return_value = {
+        ('Feed', None): make_entity(ENTITY_IDS[0])
+    }
+
+    first = processor.process_dismiss(INSIGHT_ID)
+    second = processor.process_dismiss(INSIGHT_ID)
+
+    assert first['pattern_recorded']['driver_entity_types'] == ['project', 'project']
+    # The repeat dismissal's identical pattern is reported as skipped, not recorded
+    assert 'pattern_recorded' not in second
+    assert second['pattern_skipped'] is True
+    assert processor.db.apply_insight_feedback.call_args_list[1][0][3] is None
+    processor.db.get_entities_by_titles.assert_called_once()
+    processor.db.get_entities_by_ids.assert_called_once_with([ENTITY_IDS[1]])
+    processor.db.get_entity_by_id.assert_not_called()
+
+    processor.clear_cache()
+    processor.process_dismiss(INSIGHT_ID)
+    assert processor.db.get_entities_by_titles.call_count == 2
+
+
+def test_dismiss_resolves_drivers_once(processor):
+    """Test that the dismissal pattern reuses the drivers resolved by the request"""
+    processor.db.get_insight_by_id.return_value = make_insight(['Feed', ENTITY_IDS[1], 'Unknown'])
+    processor.db.get_entities_by_titles.return_value = {
+        ('Feed', None): make_entity(ENTITY_IDS[0])
+    }
+
+    result = processor.process_dismiss(INSIGHT_ID)
+
+    assert result['pattern_recorded']['driver_entity_types'] == ['project', 'project']
+    processor.db.get_entities_by_titles.assert_called_once_with([('Feed', None), ('Unknown', None)])
+    processor.db.get_entities_by_ids.assert_called_once_with([ENTITY_IDS[1]])
+
+
+def test_pattern_hash_stable_across_dismissals(processor):
+    """Test that equivalent dismissals hash the same and keep driver type order"""
+    insight = make_insight([])
+    processor._get_entities_by_ids = Mock(return_value={
+        ENTITY_IDS[0]: make_entity(ENTITY_IDS[0]),
+        ENTITY_IDS[1]: make_entity(ENTITY_IDS[1]).model_copy(update={'type': 'person'})
+    })
+
+    first = processor._extract_pattern(insight, datetime(2025, 10, 1, tzinfo=timezone.utc), resolved_ids=ENTITY_IDS)
+    second = processor._extract_pattern(insight, datetime(2025, 10, 2, tzinfo=timezone.utc), resolved_ids=ENTITY_IDS)
+
+    assert first['pattern_signature']['driver_types'] == ['project', 'person']
+    assert first['pattern_signature']['dismissed_at'] != second['pattern_signature']['dismissed_at']
+    assert first['pattern_hash'] == second['pattern_hash']
+
+
+def test_extract_keywords_lowercases_and_skips_mixed_case_stop_words(processor):
+    """Test that stop words are matched case-insensitively"""
+    assert processor._extract_keywords("THEIR Roadmap WOULD Slip") == ['roadmap', 'slip']
+
+
+def test_processors_share_database_and_scorer(monkeypatch):
+    """Test that re-instantiating FeedbackProcessor reuses one DatabaseService and SignalScorer"""
+    import agents.feedback_processor as module
+    created = Mock(side_effect=lambda: Mock())
+    monkeypatch.setattr(module, 'DatabaseService', created)
+    monkeypatch.setattr(FeedbackProcessor, '_shared_db', None)
+
+    first = FeedbackProcessor()
+    second = FeedbackProcessor()
+
+    assert first.db is second.db
+    assert first.signal_scorer is second.signal_scorer
+    created.assert_called_once()
+
+    injected = Mock()
+    assert FeedbackProcessor(db=injected).db is injected
+
+
+def test_signal_at_clamp_bound_is_not_rewritten(processor):
+    """Test that a dismissal leaving importance clamped at 0.0 skips that row's write"""
+    processor.db.get_signals_by_entity_ids.side_effect = lambda ids: {
+        ENTITY_IDS[0]: Signal(entity_id=ENTITY_IDS[0], importance=0.0, recency=0.5, novelty=0.5),
+        ENTITY_IDS[1]: Signal(entity_id=ENTITY_IDS[1], importance=0.5, recency=0.5, novelty=0.5)
+    }
+
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    result = processor.process_dismiss(INSIGHT_ID)
+
+    assert result['signal_changes'][0]['importance'] == {'old': 0.0, 'new': 0.0}
+    rows = processor.db.apply_insight_feedback.call_args[0][2]
+    assert [row['entity_id'] for row in rows] == [ENTITY_IDS[1]]
+
+
+def test_invalid_insight_id_rejected_before_database(processor):
+    """Test that a non-UUID insight id returns an error without querying"""
+    result = processor.process_acknowledge('not-a-uuid')
+
+    assert result == {'status': 'error', 'message': 'Invalid insight_id'}
+    processor.db.get_insight_by_id.assert_not_called()
+
+
+def test_database_connection_error_marked_retryable(processor):
+    """Test that network failures are reported as retryable and other errors are not"""
+    processor.db.get_insight_by_id.side_effect = httpx.ConnectError('connection refused')
+    assert processor.process_dismiss(INSIGHT_ID)['retryable'] is True
+
+    processor.db.get_insight_by_id.side_effect = ValueError('bad row')
+    assert 'retryable' not in processor.process_dismiss(INSIGHT_ID)
+
+
+def test_signal_changes_logged_once_per_batch(processor, caplog):
+    """Test that per-entity changes are one debug line and absent at INFO"""
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    with caplog.at_level(logging.INFO, logger='agents.feedback_processor'):
+        processor.process_acknowledge(INSIGHT_ID)
+    assert not any(ENTITY_IDS[0] in record.getMessage() for record in caplog.records)
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger='agents.feedback_processor'):
+        processor.process_acknowledge(INSIGHT_ID)
+    lines = [record.getMessage() for record in caplog.records if ENTITY_IDS[0] in record.getMessage()]
+    assert len(lines) == 1
+    assert ENTITY_IDS[1] in lines[0]
+
+
+def test_repeated_dismissal_skips_pattern_write(processor):
+    """Test that a pattern recorded moments ago is not written again"""
+    processor.db.get_insight_by_id.return_value = make_insight(ENTITY_IDS)
+
+    processor.process_dismiss(INSIGHT_ID)
+    assert processor.db.apply_insight_feedback.call_args[0][3] is not None
+
+    result = processor.process_dismiss(INSIGHT_ID)
+    assert result['status'] == 'success'
+    assert processor.db.apply_insight_feedback.call_args[0][3] is None
+
+    processor.clear_cache()
+    processor.process_dismiss(INSIGHT_ID)
+    assert processor.db.apply_insight_feedback.call_args[0][3] is not None
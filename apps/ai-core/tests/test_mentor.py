@@ -17,13 +17,20 @@ Run with:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime, timedelta
 import json
+import threading
 
 from agents.mentor import Mentor
 from agents.feedback_processor import FeedbackProcessor
 from services.database import DatabaseService
+from models.entity import Entity
+from models.edge import Edge
+from models.dismissed_pattern import DismissedPattern
+from models.insight import Insight
+from models.signal import Signal
+from models.entity_relationship import EntityRelationships, EntityRelationshipItem
 from tests.fixtures.mentor_fixtures import (
     sample_core_identity,
     sample_recent_work,
@@ -37,6 +44,12 @@ from tests.fixtures.mentor_fixtures import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_anthropic_client(monkeypatch):
+    """Give each test its own shared Anthropic client, since tests stub its methods"""
+    monkeypatch.setattr(Mentor, '_shared_client', None)
+
+
 # ============================================================================
 # Unit Tests - Mentor Agent
 # ============================================================================
@@ -66,6 +79,44 @@ class TestMentorInitialization:
             mentor = Mentor()
             assert mentor.client is not None
 
+    def test_connection_and_prompt_cards_use_faster_model(self):
+        """Test that only Connection and Prompt cards leave the default model"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            mentor = Mentor(db=Mock(), client=Mock())
+        mentor.client.messages.create.return_value.content = [Mock(text='{"title": "T"}')]
+
+        for insight_type in ["delta_watch", "connection", "prompt", "chat"]:
+            mentor._call_claude(f"prompt for {insight_type}", insight_type)
+
+        models = [c.kwargs["model"] for c in mentor.client.messages.create.call_args_list]
+        assert models == ["claude-sonnet-4-5", "claude-haiku-4-5", "claude-haiku-4-5", "claude-sonnet-4-5"]
+
+    def test_mentors_share_one_anthropic_client(self):
+        """Test that Mentor instances reuse one Anthropic client unless given one"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            first = Mentor(db=Mock())
+            second = Mentor(db=Mock())
+            own_client = Mock()
+            third = Mentor(db=Mock(), client=own_client)
+
+        assert first.client is second.client
+        assert third.client is own_client
+
+    def test_get_mentor_creates_one_instance_on_first_use(self, monkeypatch):
+        """Test that the process-wide Mentor is built lazily and then reused"""
+        import agents.mentor as mentor_module
+        monkeypatch.setattr(mentor_module, '_mentor', None)
+        created = Mock(side_effect=lambda: Mock(spec=Mentor))
+        monkeypatch.setattr(mentor_module, 'Mentor', created)
+
+        first = mentor_module.get_mentor()
+        second = mentor_module.get_mentor()
+
+        assert first is second
+        created.assert_called_once_with()
+
 
 class TestContextGathering:
     """Test Mentor's context gathering"""
@@ -163,6 +214,23 @@ class TestInsightGeneration:
             result = mentor._call_claude("test prompt", "test_type")
             assert result == '{"test": "data"}'
 
+    @pytest.mark.parametrize("reply", [
+        "```\n{\"test\": \"data\"}\n```",
+        "```{\"test\": \"data\"}```",
+        "{\"test\": \"data\"}",
+    ])
+    def test_call_claude_strips_untagged_and_inline_fences(self, reply):
+        """Test that _call_claude unwraps any code fence and leaves bare JSON alone"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            mentor = Mentor()
+
+            mock_response = Mock()
+            mock_response.content = [Mock(text=reply)]
+            mentor.client.messages.create = Mock(return_value=mock_response)
+
+            assert mentor._call_claude("test prompt", "test_type") == '{"test": "data"}'
+
     def test_call_claude_handles_errors_gracefully(self):
         """Test that _call_claude handles API errors and returns fallback"""
         with patch('agents.mentor.settings') as mock_settings:
@@ -276,11 +344,409 @@ class TestMentorIntegration:
             assert digest['connection'] is None
 
 
+# ============================================================================
+# Unit Tests - Daily Digest Generation
+# ============================================================================
+
+
+class TestDailyDigest:
+    """Test how generate_daily_digest runs the three card generators"""
+
+    @pytest.fixture
+    def mentor(self):
+        """Mentor with a mocked database and context"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            mentor = Mentor(db=Mock())
+        mentor.db.create_insight.return_value = "uuid-new-insight"
+        mentor._gather_context = Mock(return_value={"dismissed_patterns": []})
+        return mentor
+
+    def test_cards_generated_concurrently(self, mentor):
+        """Test that all three cards are in flight at the same time"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate(insight_type):
+            def _generate(context):
+                barrier.wait()
+                return {"id": f"uuid-{insight_type}", "title": insight_type}
+            return _generate
+
+        mentor._generate_delta_watch = generate("delta_watch")
+        mentor._generate_connection = generate("connection")
+        mentor._generate_prompt = generate("prompt")
+
+        digest = mentor.generate_daily_digest()
+
+        assert digest["insights_created"] == 3
+        assert digest["delta_watch"]["id"] == "uuid-delta_watch"
+        assert digest["connection"]["id"] == "uuid-connection"
+        assert digest["prompt"]["id"] == "uuid-prompt"
+
+    def test_failed_card_falls_back_without_blocking_others(self, mentor):
+        """Test that a generator raising only replaces its own card with the fallback"""
+        mentor._generate_delta_watch = Mock(return_value={"id": "uuid-delta"})
+        mentor._generate_connection = Mock(side_effect=RuntimeError("boom"))
+        mentor._generate_prompt = Mock(return_value=None)
+
+        digest = mentor.generate_daily_digest()
+
+        assert digest["delta_watch"] == {"id": "uuid-delta"}
+        assert digest["connection"]["title"] == "Past Learning"
+        assert digest["prompt"] is None
+        assert digest["insights_created"] == 2
+
+    def test_digest_context_fetched_in_one_call(self):
+        """Test that _gather_context reads everything but core identity with one database call"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            mentor = Mentor(db=Mock())
+        high_priority = sample_high_priority_entities()
+        recent_work = sample_recent_work()
+        goal = make_entity("uuid-goal", "Launch Water OS", "core_identity")
+        goal.metadata = {"tags": ["goal"]}
+        value = make_entity("uuid-value", "Equity", "core_identity")
+        value.metadata = {"tags": ["value"]}
+        dismissed = [
+            DismissedPattern(id=f"uuid-dismissed-{n}", insight_type=insight_type,
+                             pattern=f"pattern {n}", last_dismissed_at=datetime.now())
+            for n, insight_type in enumerate(["Delta Watch", "Prompt", "Delta Watch"], start=1)
+        ]
+        mentor.db.get_entities_by_type.return_value = [goal, value]
+        mentor.db.get_digest_context.return_value = {
+            "recent_entities": recent_work,
+            "high_priority": high_priority,
+            "recent_work": recent_work,
+            "dismissed_patterns": dismissed,
+        }
+
+        context = mentor._gather_context()
+
+        mentor.db.get_digest_context.assert_called_once()
+        assert mentor.db.get_digest_context.call_args.kwargs == {"signal_limit": 20, "dismissed_days": 30}
+        mentor.db.get_entities_created_since.assert_not_called()
+        mentor.db.get_entities_by_signal_threshold.assert_not_called()
+        mentor.db.get_dismissed_patterns.assert_not_called()
+        assert context["high_priority"] is high_priority
+        assert context["recent_work"] is recent_work
+        assert context["goals"] == [goal]
+        assert context["dismissed_by_type"] == {
+            "Delta Watch": [dismissed[0], dismissed[2]],
+            "Prompt": [dismissed[1]],
+        }
+        dismissed_context = mentor._format_dismissed_context(context["dismissed_by_type"]["Delta Watch"], "Avoid:")
+        assert "- Pattern: pattern 1 (dismissed 1x)" in dismissed_context
+        assert "- Pattern: pattern 3 (dismissed 1x)" in dismissed_context
+
+    def test_identical_digest_prompt_reuses_claude_response(self, mentor):
+        """Test that a repeated digest prompt skips Claude while chat always calls it"""
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"title": "Cached"}')]
+        mentor.client.messages.create = Mock(return_value=mock_response)
+
+        assert mentor._call_claude("same prompt", "delta_watch") == '{"title": "Cached"}'
+        assert mentor._call_claude("same prompt", "delta_watch") == '{"title": "Cached"}'
+        assert mentor.client.messages.create.call_count == 1
+
+        mentor._call_claude("same prompt", "connection")
+        mentor._call_claude("other prompt", "delta_watch")
+        assert mentor.client.messages.create.call_count == 3
+
+        mentor._call_claude("same prompt", "chat")
+        mentor._call_claude("same prompt", "chat")
+        assert mentor.client.messages.create.call_count == 5
+
+        mentor.clear_cache()
+        mentor._call_claude("same prompt", "delta_watch")
+        assert mentor.client.messages.create.call_count == 6
+
+
+# ============================================================================
+# Unit Tests - Chat Context
+# ============================================================================
+
+
+def make_entity(entity_id, title, entity_type="project"):
+    """Entity model as returned by DatabaseService"""
+    created = datetime(2025, 10, 1)
+    return Entity(
+        id=entity_id,
+        source_event_id="event-1",
+        type=entity_type,
+        title=title,
+        summary="",
+        created_at=created,
+        updated_at=created
+    )
+
+
+def make_relationship(from_id, to_entity):
+    """Relationship item for an edge from from_id to to_entity"""
+    edge = Edge(
+        id=f"edge-{from_id}-{to_entity.id}",
+        from_id=from_id,
+        to_id=to_entity.id,
+        kind="relates_to",
+        created_at=datetime(2025, 10, 1)
+    )
+    return EntityRelationshipItem(edge=edge, entity=to_entity)
+
+
+class TestChatContext:
+    """Test _gather_chat_context's entity search and expansion"""
+
+    @pytest.fixture
+    def mentor(self):
+        """Mentor with a mocked database"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            mentor = Mentor(db=Mock())
+        mentor.db.get_entities_by_type.return_value = []
+        mentor.db.get_entities_by_signal_threshold.return_value = []
+        mentor.db.get_entities_by_importance.return_value = []
+        return mentor
+
+    def test_keywords_searched_and_expanded_in_one_call_each(self, mentor):
+        """Test that all keywords share one search and all matches one expansion"""
+        feed = make_entity("uuid-feed", "Feed")
+        willow = make_entity("uuid-willow", "Willow")
+        ghana = make_entity("uuid-ghana", "Ghana")
+        mentor.db.search_entities_by_titles.return_value = {"feed": [feed], "willow": [willow]}
+        mentor.db.get_entities_relationships.return_value = {
+            "uuid-feed": EntityRelationships(outgoing=[make_relationship("uuid-feed", willow)], incoming=[]),
+            "uuid-willow": EntityRelationships(outgoing=[], incoming=[make_relationship("uuid-ghana", ghana)])
+        }
+
+        context = mentor._gather_chat_context("How is feed going for willow")
+
+        mentor.db.search_entities_by_titles.assert_called_once()
+        keywords = mentor.db.search_entities_by_titles.call_args[0][0]
+        assert "feed" in keywords and "willow" in keywords
+        mentor.db.get_entities_relationships.assert_called_once_with(["uuid-feed", "uuid-willow"], limit=5)
+        mentor.db.search_entities_by_title.assert_not_called()
+        mentor.db.get_entity_relationships.assert_not_called()
+
+        assert [e.id for e in context["relevant_entities"]] == ["uuid-feed", "uuid-willow", "uuid-ghana"]
+        assert [(r["from"].id, r["to"].id) for r in context["relationships"]] == [
+            ("uuid-feed", "uuid-willow"),
+            ("uuid-ghana", "uuid-willow")
+        ]
+
+    def test_independent_context_reads_run_concurrently(self, mentor):
+        """Test that active work, high priority and keyword search are in flight together"""
+        barrier = threading.Barrier(3, timeout=5)
+        feed = make_entity("uuid-feed", "Feed")
+
+        def read(result):
+            def _read(*args, **kwargs):
+                barrier.wait()
+                return result
+            return _read
+
+        mentor.db.get_entities_by_signal_threshold.side_effect = read([])
+        mentor.db.get_entities_by_importance.side_effect = read([])
+        mentor.db.search_entities_by_titles.side_effect = read({"feed": [feed]})
+        mentor.db.get_entities_relationships.return_value = {
+            "uuid-feed": EntityRelationships(outgoing=[], incoming=[])
+        }
+
+        context = mentor._gather_chat_context("How is feed going")
+
+        assert [e.id for e in context["relevant_entities"]] == ["uuid-feed"]
+
+    def test_repeated_keywords_and_matches_expanded_once(self, mentor):
+        """Test that a repeated keyword or an entity matched twice yields its relationships once"""
+        water = make_entity("uuid-water", "Water Initiative")
+        ghana = make_entity("uuid-ghana", "Ghana")
+        mentor.db.search_entities_by_titles.return_value = {"water": [water], "initiative": [water]}
+        mentor.db.get_entities_relationships.return_value = {
+            "uuid-water": EntityRelationships(outgoing=[make_relationship("uuid-water", ghana)], incoming=[])
+        }
+
+        context = mentor._gather_chat_context("water water initiative")
+
+        assert mentor.db.search_entities_by_titles.call_args[0][0] == ["water", "initiative"]
+        mentor.db.get_entities_relationships.assert_called_once_with(["uuid-water"], limit=5)
+        assert [(r["from"].id, r["to"].id) for r in context["relationships"]] == [("uuid-water", "uuid-ghana")]
+
+    def test_context_capped_while_collecting(self, mentor):
+        """Test that only matches that can fit are expanded and both lists stop at their caps"""
+        matches = [make_entity(f"uuid-{i}", f"Topic {i}") for i in range(20)]
+        mentor.db.search_entities_by_titles.return_value = {"topic": matches}
+        mentor.db.get_entities_relationships.side_effect = lambda ids, limit: {
+            entity_id: EntityRelationships(
+                outgoing=[make_relationship(entity_id, make_entity(f"{entity_id}-n", "Neighbour"))],
+                incoming=[]
+            )
+            for entity_id in ids
+        }
+
+        context = mentor._gather_chat_context("topic")
+
+        expanded = mentor.db.get_entities_relationships.call_args[0][0]
+        assert expanded == [f"uuid-{i}" for i in range(15)]
+        assert len(context["relevant_entities"]) == 15
+        assert [e.id for e in context["relevant_entities"][:4]] == ["uuid-0", "uuid-0-n", "uuid-1", "uuid-1-n"]
+        assert len(context["relationships"]) == 10
+
+    def test_message_keywords_keep_phrases_and_drop_stop_words(self, mentor):
+        """Test that capitalised phrases stay whole and stop words are dropped"""
+        keywords = mentor._extract_keywords_from_message("How is the Water Initiative doing for our team")
+
+        assert keywords == ["how", "water initiative", "doing", "team"]
+
+    def test_entity_mentions_listed_once_in_context_order(self, mentor):
+        """Test that mentioned titles are matched case-insensitively and not repeated"""
+        water = make_entity("uuid-water", "Water Initiative")
+        feed = make_entity("uuid-feed", "Feed")
+        context = {
+            "relevant_entities": [water, make_entity("uuid-ghana", "Ghana")],
+            "active_work": [feed, water]
+        }
+
+        mentioned = mentor._extract_entity_mentions("the water initiative needs FEED data", context)
+
+        assert mentioned == ["Water Initiative", "Feed"]
+
+    def test_core_identity_reused_until_cache_cleared(self, mentor):
+        """Test that core identity is fetched once across chat turns until the cache is cleared"""
+        mentor.db.search_entities_by_titles.return_value = {}
+        mentor.db.get_entities_relationships.return_value = {}
+        mentor.db.get_entities_by_type.return_value = [make_entity("uuid-mission", "Mission", "core_identity")]
+
+        first = mentor._gather_chat_context("hello there")
+        second = mentor._gather_chat_context("hello again")
+        assert mentor.db.get_entities_by_type.call_count == 1
+        assert [e.id for e in first["core_identity"]] == [e.id for e in second["core_identity"]] == ["uuid-mission"]
+
+        mentor.clear_cache()
+        mentor._gather_chat_context("hello once more")
+        assert mentor.db.get_entities_by_type.call_count == 2
+
+    def test_chat_stream_yields_chunks_then_saves_full_reply(self, mentor):
+        """Test that streamed chat yields text as it arrives and saves the joined reply"""
+        mentor.db.search_entities_by_titles.return_value = {}
+        mentor.db.get_entities_relationships.return_value = {}
+        mentor.client.messages.stream = MagicMock()
+        stream = mentor.client.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = iter(["Good ", "question."])
+
+        items = list(mentor.chat_stream("What should I focus on?"))
+
+        assert items[:2] == ["Good ", "question."]
+        response = items[2]
+        assert response.response == "Good question."
+        mentor.db.create_raw_events.assert_called_once()
+        user_event, assistant_event = mentor.db.create_raw_events.call_args[0][0]
+        assert response.user_event_id == user_event["id"]
+        assert response.assistant_event_id == assistant_event["id"]
+        assert assistant_event["payload"]["content"] == "Good question."
+        assert assistant_event["payload"]["metadata"]["user_message_event_id"] == user_event["id"]
+        mentor.db.create_raw_event.assert_not_called()
+
+
+class TestConnectionCard:
+    """Test how _generate_connection looks up historical entities"""
+
+    def test_similar_entities_fetched_in_one_batch(self):
+        """Test that all recent entities are matched to history with one batched call"""
+        with patch('agents.mentor.settings') as mock_settings:
+            mock_settings.ANTHROPIC_API_KEY = "test-key"
+            mentor = Mentor(db=Mock())
+        recent = [make_entity("uuid-feed", "Feed"), make_entity("uuid-water", "Water OS")]
+        history = make_entity("uuid-old", "Old Feed")
+        mentor.db.get_similar_entities_batch.return_value = {"uuid-feed": [history], "uuid-water": []}
+        mentor.db.create_insight.return_value = "uuid-new-insight"
+        mentor._call_claude = Mock(return_value=json.dumps({
+            "title": "Test",
+            "body": "Test body",
+            "driver_entity_ids": ["uuid-feed", "uuid-old"]
+        }))
+
+        insight = mentor._generate_connection({"recent_entities": recent, "dismissed_by_type": {}})
+
+        assert insight["id"] == "uuid-new-insight"
+        mentor.db.get_similar_entities_batch.assert_called_once_with(recent, limit=3, exclude_recent_days=30)
+        mentor.db.get_similar_entities.assert_not_called()
+        prompt = mentor._call_claude.call_args[0][0]
+        assert "uuid-old" in prompt and "uuid-water" not in prompt
+
+    def test_similar_entities_cached_between_digests(self):
+        """Repeat lookups are served from the cache; only new entities hit the database"""
+        with patch('agents.mentor.Anthropic'):
+            mentor = Mentor(db=Mock())
+        feed = make_entity("uuid-feed", "Feed")
+        water = make_entity("uuid-water", "Water OS")
+        history = make_entity("uuid-old", "Old Feed")
+        mentor.db.get_similar_entities_batch.side_effect = [
+            {"uuid-feed": [history]},
+            {"uuid-water": []},
+        ]
+
+        first = mentor._get_similar_entities([feed], limit=3, exclude_recent_days=30)
+        second = mentor._get_similar_entities([feed, water], limit=3, exclude_recent_days=30)
+
+        assert first == {"uuid-feed": [history]}
+        assert second == {"uuid-feed": [history], "uuid-water": []}
+        assert mentor.db.get_similar_entities_batch.call_args_list[1] == call(
+            [water], limit=3, exclude_recent_days=30
+        )
+
+        mentor.clear_cache()
+        mentor.db.get_similar_entities_batch.side_effect = None
+        mentor.db.get_similar_entities_batch.return_value = {"uuid-feed": []}
+        assert mentor._get_similar_entities([feed], limit=3, exclude_recent_days=30) == {"uuid-feed": []}
+
+    def test_warm_similar_cache_prefetches_connection_lookups(self):
+        """Warming at startup means the Connection card makes no similarity query"""
+        with patch('agents.mentor.Anthropic'):
+            mentor = Mentor(db=Mock())
+        recent = [make_entity(f"uuid-{i}", f"Entity {i}") for i in range(7)]
+        mentor.db.get_entities_created_since.return_value = recent
+        mentor.db.get_similar_entities_batch.return_value = {}
+
+        assert mentor.warm_similar_cache() == 5
+        mentor.db.get_similar_entities_batch.assert_called_once_with(
+            recent[:5], limit=3, exclude_recent_days=30
+        )
+
+        mentor._call_claude = Mock()
+        assert mentor._generate_connection({"recent_entities": recent, "dismissed_by_type": {}}) is None
+        mentor.db.get_similar_entities_batch.assert_called_once()
+
+
 # ============================================================================
 # Unit Tests - Feedback Processor
 # ============================================================================
 
 
+FEEDBACK_INSIGHT_ID = "33333333-3333-3333-3333-333333333333"
+FEEDBACK_ENTITY_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def feedback_db(importance):
+    """Mock database holding one insight driven by one entity
+
+    Args:
+        importance: The driver's stored importance, or None for no signal row
+    """
+    db = Mock()
+    db.get_insight_by_id.return_value = Insight(
+        id=FEEDBACK_INSIGHT_ID,
+        title="Delta Watch: Feed launch",
+        body="The Feed launch is slipping",
+        drivers={"entity_ids": [FEEDBACK_ENTITY_ID]},
+        status="open",
+        created_at=datetime.now(),
+    )
+    db.get_signals_by_entity_ids.return_value = {} if importance is None else {
+        FEEDBACK_ENTITY_ID: Signal(
+            entity_id=FEEDBACK_ENTITY_ID, importance=importance, recency=0.5, novelty=0.5
+        )
+    }
+    return db
+
+
 class TestFeedbackProcessor:
     """Test FeedbackProcessor functionality"""
 
@@ -390,21 +856,18 @@ class TestFeedbackProcessor:
         assert result['pattern_recorded']['insight_type'] == 'Delta Watch'
         assert mock_db.record_dismissed_pattern.called
 
-    def test_adjust_entity_signals_clamps_to_valid_range(self, mock_db):
+    def test_apply_feedback_clamps_signals_to_valid_range(self):
         """Test that signal adjustments stay within [0.0, 1.0]"""
-        mock_db.get_signal_by_entity_id.return_value = {
-            'importance': 0.95  # Already high
-        }
+        db = feedback_db(importance=0.95)  # Already high
+        processor = FeedbackProcessor(db=db)
 
-        processor = FeedbackProcessor()
-        result = processor._adjust_entity_signals(
-            'uuid-test',
-            importance_delta=0.2,  # Would push to 1.15
-            recency_boost=False
-        )
+        result = processor._apply_feedback(FEEDBACK_INSIGHT_ID, 'acknowledge')  # Would push to 1.05
 
         # Should be clamped to 1.0
-        assert result['importance']['new'] == 1.0
+        assert result['signal_changes'][0]['importance']['new'] == 1.0
+        insight_id, status, rows, pattern = db.apply_insight_feedback.call_args[0]
+        assert (insight_id, status, pattern) == (FEEDBACK_INSIGHT_ID, 'acknowledged', None)
+        assert [row['importance'] for row in rows] == [1.0]
 
     def test_extract_pattern_identifies_insight_type(self, mock_db):
         """Test that pattern extraction identifies insight type correctly"""
@@ -475,19 +938,16 @@ class TestErrorHandling:
 
     def test_feedback_processor_handles_missing_signal(self):
         """Test FeedbackProcessor when entity has no signal"""
-        with patch('agents.feedback_processor.db') as mock_db:
-            mock_db.get_signal_by_entity_id.return_value = None
+        db = feedback_db(importance=None)
+        processor = FeedbackProcessor(db=db)
 
-            processor = FeedbackProcessor()
-            result = processor._adjust_entity_signals(
-                'uuid-no-signal',
-                importance_delta=0.1,
-                recency_boost=False
-            )
+        result = processor._apply_feedback(FEEDBACK_INSIGHT_ID, 'acknowledge')
 
-            # Should return error
-            assert 'error' in result
-            assert result['error'] == 'no_signal'
+        # Should report nothing updated and write no signal rows
+        assert result['status'] == 'success'
+        assert result['entities_updated'] == 0
+        insight_id, status, rows, _ = db.apply_insight_feedback.call_args[0]
+        assert (insight_id, status, rows) == (FEEDBACK_INSIGHT_ID, 'acknowledged', [])
 
     def test_feedback_processor_handles_missing_insight(self):
         """Test FeedbackProcessor when insight doesn't exist"""
@@ -393,6 +393,28 @@ class TestIncrementalMode:
                         assert 'processing_time' in result
 
 
+    def test_incremental_batch_reuses_event_texts(self):
+        """Test batch mode passes caller-supplied texts and only fetches missing ones together"""
+        engine = RelationshipEngine()
+        entities = [Mock(id=f'e{i}', title=f'Entity {i}', type='person', summary='', metadata={}) for i in range(2)]
+        stored_event = Mock()
+        stored_event.payload.content = 'Stored text'
+
+        with patch.object(engine.db, 'get_entities_by_source_events',
+                          return_value={'event-1': entities, 'event-2': entities}), \
+                patch.object(engine.db, 'get_recent_entities', return_value=[]), \
+                patch.object(engine.db, 'get_events_by_ids', return_value={'event-2': stored_event}) as get_events, \
+                patch.object(engine.db, 'get_event_by_id') as get_event, \
+                patch.object(engine, 'strategy_pattern_based', return_value=[]), \
+                patch.object(engine, 'strategy_semantic_llm', return_value=[]) as semantic:
+            result = engine.run_incremental_batch(['event-1', 'event-2'], {'event-1': 'Loaded text'})
+
+        assert result['events_analyzed'] == 2
+        get_event.assert_not_called()
+        get_events.assert_called_once_with(['event-2'])
+        assert [c[0][1] for c in semantic.call_args_list] == ['Loaded text', 'Stored text']
+
+
 class TestNightlyMode:
     """Test nightly consolidation mode"""
 
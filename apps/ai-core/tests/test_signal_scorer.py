@@ -1,6 +1,6 @@
 """Tests for SignalScorer"""
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from processors.signal_scorer import SignalScorer
 
 
@@ -182,6 +182,27 @@ def test_calculate_all_signals():
     assert signals['novelty'] > 0.0
 
 
+def test_calculate_all_signals_batch_matches_single():
+    """Test batch scoring matches per-entity scoring, in input order"""
+    scorer = SignalScorer()
+    now = datetime.now()
+    naive_old = now - timedelta(days=30)
+    aware_new = datetime.now(timezone.utc)
+
+    batch = scorer.calculate_all_signals_batch([
+        ('project', naive_old, None, 3, {}),
+        ('person', aware_new, aware_new, 0, {'user_importance': 'low'}),
+    ])
+
+    assert len(batch) == 2
+    single = scorer.calculate_all_signals('project', naive_old, None, 3, {})
+    assert batch[0]['importance'] == single['importance']
+    assert abs(batch[0]['recency'] - single['recency']) < 0.001
+    assert batch[0]['novelty'] == single['novelty']
+    assert batch[1]['importance'] == scorer.calculate_importance('person', {'user_importance': 'low'})
+    assert batch[1]['recency'] > 0.99
+
+
 def test_calculate_composite_score_default_weights():
     """Test composite score with default weights"""
     scorer = SignalScorer()
@@ -1,20 +1,29 @@
 import re
 
+# Runs of any whitespace (newlines included) collapse to a single space
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Curly quotes normalized to their ASCII equivalents in a single pass
+_QUOTE_TABLE = str.maketrans({
+    "“": '"',
+    "”": '"',
+    "‘": "'",
+    "’": "'",
+})
+
 
 class TextCleaner:
     @staticmethod
     def clean(text: str) -> str:
         """Clean and normalize text"""
         # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
 
         # Remove markdown artifacts
-        text = re.sub(r"\*\*", "", text)
-        text = re.sub(r"__", "", text)
+        text = text.replace("**", "").replace("__", "")
 
         # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace("'", "'").replace("'", "'")
+        text = text.translate(_QUOTE_TABLE)
 
         # Strip leading/trailing whitespace
         text = text.strip()
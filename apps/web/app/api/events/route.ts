@@ -3,6 +3,8 @@ import { createClient } from '@supabase/supabase-js';
 import type { SupabaseClient } from '@supabase/supabase-js';
 import type { RawEventInsert } from '@repo/db';
 
+const AI_CORE_URL = process.env.AI_CORE_URL || 'http://localhost:8000';
+
 export async function POST(request: Request) {
   try {
     // Get the authorization header from the request
@@ -80,6 +82,12 @@ export async function POST(request: Request) {
       );
     }
 
+    // Wake the Archivist worker so the event is processed without waiting
+    // for the next poll (fire-and-forget; the poll still picks it up)
+    fetch(`${AI_CORE_URL}/process/notify`, { method: 'POST' }).catch((notifyError) => {
+      console.warn('⚠️ [API] Failed to notify AI Core:', notifyError);
+    });
+
     // Return success response
     console.log('✅ [API] Event saved successfully:', data.id);
     return NextResponse.json({
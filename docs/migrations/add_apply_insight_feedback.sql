@@ -0,0 +1,47 @@
+-- Migration: Add insight feedback function
+-- Date: 2026-10-16
+-- Purpose: Write the signal updates, dismissed pattern and status change of
+--          one acknowledge/dismiss in a single round trip and transaction
+--          (called via RPC from DatabaseService.apply_insight_feedback)
+-- Requires: add_dismissed_pattern_hash.sql
+
+-- signals: JSON array of {"entity_id", "importance", "recency", "last_surfaced_at"}
+-- pattern: dismissed pattern object from the Feedback Processor, or NULL
+CREATE OR REPLACE FUNCTION apply_insight_feedback(
+    insight_id UUID,
+    new_status TEXT,
+    signals JSONB,
+    pattern JSONB DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE signal AS s
+    SET importance = u.importance,
+        recency = u.recency,
+        last_surfaced_at = u.last_surfaced_at
+    FROM jsonb_to_recordset(signals)
+        AS u(entity_id UUID, importance FLOAT, recency FLOAT, last_surfaced_at TIMESTAMPTZ)
+    WHERE s.entity_id = u.entity_id;
+
+    IF pattern IS NOT NULL THEN
+        INSERT INTO dismissed_patterns (
+            insight_type, driver_entity_types, pattern_signature, pattern_hash, last_dismissed_at
+        )
+        VALUES (
+            pattern->>'insight_type',
+            ARRAY(SELECT jsonb_array_elements_text(pattern->'driver_entity_types')),
+            pattern->'pattern_signature',
+            pattern->>'pattern_hash',
+            COALESCE((pattern->'pattern_signature'->>'dismissed_at')::TIMESTAMPTZ, NOW())
+        )
+        ON CONFLICT (pattern_hash) DO UPDATE
+        SET pattern_signature = EXCLUDED.pattern_signature,
+            last_dismissed_at = EXCLUDED.last_dismissed_at,
+            dismissed_count = dismissed_patterns.dismissed_count + 1;
+    END IF;
+
+    UPDATE insight SET status = new_status WHERE id = apply_insight_feedback.insight_id;
+END;
+$$;
@@ -0,0 +1,15 @@
+-- Migration: Add bulk entity metadata update function
+-- Date: 2026-10-16
+-- Purpose: Let the Archivist write metadata for many entities in one round trip
+--          (called via RPC from DatabaseService.bulk_update_entity_metadata)
+
+-- updates: JSON array of {"id": <uuid>, "metadata": <object>}
+CREATE OR REPLACE FUNCTION bulk_update_entity_metadata(updates JSONB)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE entity AS e
+    SET metadata = u.metadata
+    FROM jsonb_to_recordset(updates) AS u(id UUID, metadata JSONB)
+    WHERE e.id = u.id;
+$$;
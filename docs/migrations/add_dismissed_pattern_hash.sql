@@ -0,0 +1,13 @@
+-- Migration: Add pattern hash to dismissed_patterns
+-- Date: 2026-10-16
+-- Purpose: Let repeat dismissals of an equivalent insight update one row
+--          (matched on pattern_hash by DatabaseService.record_dismissed_pattern)
+
+ALTER TABLE dismissed_patterns
+ADD COLUMN IF NOT EXISTS pattern_hash TEXT;
+
+-- Existing rows keep a NULL hash, which the unique index allows
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dismissed_patterns_hash
+ON dismissed_patterns(pattern_hash);
+
+COMMENT ON COLUMN dismissed_patterns.pattern_hash IS 'blake2b hash of the pattern signature without dismissed_at; identical dismissals share a row';
@@ -0,0 +1,56 @@
+-- Migration: Add digest context function
+-- Date: 2026-10-16
+-- Purpose: Return everything the Mentor's daily digest reads from the graph
+--          (recent entities, high-importance and high-recency entities,
+--          recently dismissed patterns) in a single round trip
+--          (called via RPC from DatabaseService.get_digest_context)
+
+-- Entity rows in high_priority / recent_work carry their signal row under "signal"
+CREATE OR REPLACE FUNCTION get_digest_context(
+    since TIMESTAMPTZ,
+    dismissed_since TIMESTAMPTZ,
+    signal_limit INTEGER DEFAULT 20,
+    importance_min FLOAT DEFAULT 0.7,
+    recency_min FLOAT DEFAULT 0.8
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'recent_entities', COALESCE((
+            SELECT jsonb_agg(to_jsonb(e) ORDER BY e.created_at DESC)
+            FROM entity AS e
+            WHERE e.created_at >= since
+        ), '[]'::jsonb),
+        'high_priority', COALESCE((
+            SELECT jsonb_agg(row_data ORDER BY importance DESC)
+            FROM (
+                SELECT to_jsonb(e) || jsonb_build_object('signal', to_jsonb(s)) AS row_data,
+                       s.importance
+                FROM entity AS e
+                JOIN signal AS s ON s.entity_id = e.id
+                WHERE s.importance >= importance_min
+                ORDER BY s.importance DESC
+                LIMIT signal_limit
+            ) AS ranked
+        ), '[]'::jsonb),
+        'recent_work', COALESCE((
+            SELECT jsonb_agg(row_data ORDER BY recency DESC)
+            FROM (
+                SELECT to_jsonb(e) || jsonb_build_object('signal', to_jsonb(s)) AS row_data,
+                       s.recency
+                FROM entity AS e
+                JOIN signal AS s ON s.entity_id = e.id
+                WHERE s.recency >= recency_min
+                ORDER BY s.recency DESC
+                LIMIT signal_limit
+            ) AS ranked
+        ), '[]'::jsonb),
+        'dismissed_patterns', COALESCE((
+            SELECT jsonb_agg(to_jsonb(p) ORDER BY p.last_dismissed_at DESC)
+            FROM dismissed_patterns AS p
+            WHERE p.last_dismissed_at >= dismissed_since
+        ), '[]'::jsonb)
+    );
+$$;
@@ -0,0 +1,18 @@
+-- Migration: Add grouped edge count function
+-- Date: 2026-10-16
+-- Purpose: Count incoming + outgoing edges for many entities server-side
+--          (called via RPC from DatabaseService.get_edge_counts_for_entities)
+
+CREATE OR REPLACE FUNCTION get_edge_counts(entity_ids UUID[])
+RETURNS TABLE (entity_id UUID, edge_count BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT endpoint AS entity_id, COUNT(*) AS edge_count
+    FROM (
+        SELECT from_id AS endpoint FROM edge WHERE from_id = ANY(entity_ids)
+        UNION ALL
+        SELECT to_id AS endpoint FROM edge WHERE to_id = ANY(entity_ids)
+    ) AS endpoints
+    GROUP BY endpoint;
+$$;
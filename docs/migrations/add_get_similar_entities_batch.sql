@@ -0,0 +1,28 @@
+-- Migration: Add batched similar entity lookup
+-- Date: 2026-10-16
+-- Purpose: Find similar historical entities for several entities in one
+--          round trip (called via RPC from DatabaseService.get_similar_entities_batch)
+
+-- Same heuristic as get_similar_entities: same type, created before the
+-- cutoff, excluding the entity itself, at most max_per_entity each
+CREATE OR REPLACE FUNCTION get_similar_entities_batch(
+    entity_ids UUID[],
+    max_per_entity INTEGER,
+    created_before TIMESTAMPTZ
+)
+RETURNS TABLE (source_id UUID, similar JSONB)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT src.id AS source_id, to_jsonb(candidate) AS similar
+    FROM entity AS src
+    CROSS JOIN LATERAL (
+        SELECT *
+        FROM entity AS e
+        WHERE e.type = src.type
+          AND e.created_at < created_before
+          AND e.id <> src.id
+        LIMIT max_per_entity
+    ) AS candidate
+    WHERE src.id = ANY(entity_ids);
+$$;
@@ -0,0 +1,33 @@
+-- Migration: Add conditional signal upsert function
+-- Date: 2026-10-16
+-- Purpose: Let the Archivist upsert signals in one round trip while leaving
+--          rows whose scores haven't changed untouched
+--          (called via RPC from DatabaseService.upsert_changed_signals)
+
+-- signals: JSON array of {"entity_id", "importance", "recency", "novelty", "last_surfaced_at"}
+--          (the Archivist rounds scores first so unchanged entities compare equal)
+-- Returns the number of rows inserted or updated
+CREATE OR REPLACE FUNCTION upsert_changed_signals(signals JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    written INTEGER;
+BEGIN
+    INSERT INTO signal (entity_id, importance, recency, novelty, last_surfaced_at)
+    SELECT u.entity_id, u.importance, u.recency, u.novelty, u.last_surfaced_at
+    FROM jsonb_to_recordset(signals)
+        AS u(entity_id UUID, importance FLOAT, recency FLOAT, novelty FLOAT, last_surfaced_at TIMESTAMPTZ)
+    ON CONFLICT (entity_id) DO UPDATE
+    SET importance = EXCLUDED.importance,
+        recency = EXCLUDED.recency,
+        novelty = EXCLUDED.novelty,
+        last_surfaced_at = EXCLUDED.last_surfaced_at
+    WHERE signal.importance IS DISTINCT FROM EXCLUDED.importance
+       OR signal.recency IS DISTINCT FROM EXCLUDED.recency
+       OR signal.novelty IS DISTINCT FROM EXCLUDED.novelty;
+
+    GET DIAGNOSTICS written = ROW_COUNT;
+    RETURN written;
+END;
+$$;